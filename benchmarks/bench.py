@@ -0,0 +1,272 @@
+"""
+오프라인 종단 간 벤치마크
+
+로컬 RSS 서버 + Gemini/텔레그램 대체 객체로 news_digest.main()을 실행하고
+단계별 소요 시간과 최대 메모리(tracemalloc)를 출력합니다.
+
+    python benchmarks/bench.py                     # 피드 4 / 50 / 500개
+    python benchmarks/bench.py --feeds 50 --repeat 2 --error-rate 0.1
+    python benchmarks/bench.py --json result.json  # 결과 저장 (회귀 비교용)
+"""
+
+import os
+import sys
+import copy
+import json
+import time
+import argparse
+import logging
+import tempfile
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, List
+
+import yaml
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import news_digest  # noqa: E402
+from fakes import FakeBot, FakeGenerativeModel, fake_services  # noqa: E402
+from feed_server import FeedServer  # noqa: E402
+
+# 시간을 잴 news_digest 함수 (main이 모듈 전역으로 호출하는 함수)
+STAGES = [
+    'fetch_all_rss',
+    'prepare_digest_articles',
+    'enrich_articles',
+    'dedupe_articles',
+    'smart_truncate_articles',
+    'summarize_with_gemini',
+    'broadcast_to_telegram',
+]
+
+FAILURES = ['403', '429', 'timeout']
+
+# ═══════════════════════════════════════════════════════════════
+# 단계별 시간/메모리 측정
+# ═══════════════════════════════════════════════════════════════
+
+class StageProfiler:
+    """
+    함수 호출별 소요 시간과 최대 메모리 기록
+
+    단계가 중첩되면(요약 안의 토큰 축소 등) 바깥 단계에도 안쪽 최대 메모리가 반영됩니다.
+    """
+
+    def __init__(self, trace_memory: bool = True):
+        self.trace_memory = trace_memory
+        self.records: Dict[str, Dict[str, float]] = {}
+        self._stack: List[List[float]] = []
+        self._lock = threading.Lock()
+
+    def _peak(self) -> float:
+        return tracemalloc.get_traced_memory()[1] if self.trace_memory else 0
+
+    @contextmanager
+    def stage(self, name: str):
+        # 메인 스레드만 중첩 추적 (동시 실행 단계는 시간만 합산)
+        main = threading.current_thread() is threading.main_thread()
+        if main and self.trace_memory:
+            if self._stack:
+                self._stack[-1][0] = max(self._stack[-1][0], self._peak())
+            tracemalloc.reset_peak()
+            self._stack.append([0])
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            peak = 0
+            if main and self.trace_memory:
+                peak = max(self._stack.pop()[0], self._peak())
+                if self._stack:
+                    self._stack[-1][0] = max(self._stack[-1][0], peak)
+
+            with self._lock:
+                record = self.records.setdefault(name, {'calls': 0, 'seconds': 0.0, 'peak_mb': 0.0})
+                record['calls'] += 1
+                record['seconds'] += elapsed
+                record['peak_mb'] = max(record['peak_mb'], peak / 1024 / 1024)
+
+    def wrap(self, module, name: str) -> None:
+        """module.name을 측정 래퍼로 교체"""
+        original = getattr(module, name)
+
+        def wrapper(*args, **kwargs):
+            with self.stage(name):
+                return original(*args, **kwargs)
+
+        wrapper.__wrapped__ = original
+        setattr(module, name, wrapper)
+
+
+@contextmanager
+def profiled(profiler: StageProfiler):
+    """news_digest 단계 함수를 측정 래퍼로 교체 (종료 시 복원)"""
+    originals = {name: getattr(news_digest, name) for name in STAGES}
+    for name in STAGES:
+        profiler.wrap(news_digest, name)
+    try:
+        yield
+    finally:
+        for name, original in originals.items():
+            setattr(news_digest, name, original)
+
+# ═══════════════════════════════════════════════════════════════
+# 시나리오
+# ═══════════════════════════════════════════════════════════════
+
+def build_config(base: Dict[str, Any], args: argparse.Namespace, feeds: int,
+                 port: int, workdir: str) -> Dict[str, Any]:
+    """기본 설정 + 합성 피드 목록 (호스트는 127.0.0.x로 분산)"""
+    config = copy.deepcopy(base)
+    config.pop('digests', None)
+
+    failing = int(feeds * args.error_rate)
+    rss_feeds = []
+    for i in range(feeds):
+        host = f"127.0.0.{2 + i % args.hosts}"
+        query = (f"entries={args.entries}&entry_bytes={args.entry_bytes}"
+                 f"&latency={args.feed_latency}")
+        if i < failing:
+            query += f"&fail={FAILURES[i % len(FAILURES)]}&timeout_after={args.request_timeout + 1}"
+        rss_feeds.append({
+            'name': f"feed-{i:04d}",
+            'url': f"http://{host}:{port}/feed/feed-{i:04d}?{query}",
+            'enabled': True,
+            'priority': i % 5 + 1,
+        })
+    config['rss_feeds'] = rss_feeds
+
+    collection = config.setdefault('collection', {})
+    collection['request_timeout'] = args.request_timeout
+    collection['max_retries'] = 2
+
+    config.setdefault('cache', {})['directory'] = os.path.join(workdir, '.cache')
+    config.setdefault('history', {})['enabled'] = False  # 반복 실행도 같은 기사 사용
+    config.setdefault('telegram', {})['send_interval'] = args.send_interval
+    config['logging'] = {'level': args.log_level}
+    return config
+
+
+def run_once(profiler: StageProfiler) -> float:
+    """main() 1회 실행 → 소요 시간"""
+    sys.argv = ['news_digest.py']
+    started = time.perf_counter()
+    try:
+        news_digest.main()
+    except SystemExit as e:
+        if e.code:
+            raise RuntimeError(f"main() 실패 (exit {e.code})")
+    return time.perf_counter() - started
+
+
+def run_scenario(base: Dict[str, Any], args: argparse.Namespace, feeds: int) -> List[Dict[str, Any]]:
+    """피드 feeds개 시나리오 (repeat회, 2회차부터 캐시 사용)"""
+    results = []
+    cwd = os.getcwd()
+
+    with tempfile.TemporaryDirectory(prefix='bench-') as workdir, FeedServer() as server, \
+            fake_services(args.gemini_latency, args.telegram_latency):
+        config = build_config(base, args, feeds, server.port, workdir)
+        with open(os.path.join(workdir, 'config.yaml'), 'w', encoding='utf-8') as f:
+            yaml.safe_dump(config, f, allow_unicode=True)
+
+        os.chdir(workdir)
+        try:
+            for run in range(args.repeat):
+                server.reset_stats()
+                FakeBot.sent = []
+                FakeGenerativeModel.calls = {'count_tokens': 0, 'generate_content': 0}
+
+                profiler = StageProfiler(trace_memory=not args.no_memory)
+                if profiler.trace_memory:
+                    tracemalloc.start()
+                try:
+                    with profiled(profiler):
+                        elapsed = run_once(profiler)
+                    # 단계 측정이 최대값을 초기화하므로 단계별 최대값과 합침
+                    peak = tracemalloc.get_traced_memory()[1] if profiler.trace_memory else 0
+                    peak = max([peak / 1024 / 1024] +
+                               [r['peak_mb'] for r in profiler.records.values()])
+                finally:
+                    if profiler.trace_memory:
+                        tracemalloc.stop()
+
+                results.append({
+                    'feeds': feeds,
+                    'run': run + 1,
+                    'total_seconds': elapsed,
+                    'peak_mb': peak,
+                    'stages': profiler.records,
+                    'http': server.stats,
+                    'gemini_calls': dict(FakeGenerativeModel.calls),
+                    'telegram_messages': len(FakeBot.sent),
+                })
+        finally:
+            os.chdir(cwd)
+
+    return results
+
+
+def print_result(result: Dict[str, Any]) -> None:
+    """시나리오 결과 표 출력"""
+    print(f"\n▶ 피드 {result['feeds']}개 (실행 {result['run']})")
+    print(f"  {'단계':<26}{'호출':>6}{'시간(s)':>10}{'최대 MB':>10}")
+    for name in STAGES:
+        record = result['stages'].get(name)
+        if record:
+            print(f"  {name:<26}{record['calls']:>6}{record['seconds']:>10.3f}{record['peak_mb']:>10.1f}")
+    http = result['http']
+    print(f"  {'전체':<26}{'':>6}{result['total_seconds']:>10.3f}{result['peak_mb']:>10.1f}")
+    print(f"  HTTP 요청 {http['requests']}회 / {http['bytes'] / 1024:,.0f} KB, "
+          f"Gemini {result['gemini_calls']}, 텔레그램 메시지 {result['telegram_messages']}개")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="오프라인 종단 간 벤치마크")
+    parser.add_argument('--feeds', type=int, nargs='+', default=[4, 50, 500], help="시나리오별 피드 수")
+    parser.add_argument('--entries', type=int, default=30, help="피드당 기사 수")
+    parser.add_argument('--entry-bytes', type=int, default=300, help="기사당 본문 크기 (bytes)")
+    parser.add_argument('--feed-latency', type=float, default=0.2, help="피드 응답 지연 (초)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="403/429/타임아웃 피드 비율")
+    parser.add_argument('--request-timeout', type=int, default=2, help="collection.request_timeout")
+    parser.add_argument('--hosts', type=int, default=32, help="피드를 나눌 루프백 호스트 수")
+    parser.add_argument('--gemini-latency', type=float, default=1.0, help="generate_content 지연 (초)")
+    parser.add_argument('--telegram-latency', type=float, default=0.05, help="텔레그램 API 지연 (초)")
+    parser.add_argument('--send-interval', type=float, default=0.5, help="telegram.send_interval")
+    parser.add_argument('--repeat', type=int, default=1, help="시나리오별 반복 (2회차부터 캐시 사용)")
+    parser.add_argument('--config', default=os.path.join(ROOT, 'config.yaml'), help="기본 설정 파일")
+    parser.add_argument('--no-memory', action='store_true', help="tracemalloc 끄기 (시간 측정 왜곡 없음)")
+    parser.add_argument('--log-level', default='ERROR', help="news_digest 로그 레벨")
+    parser.add_argument('--json', help="결과 JSON 저장 경로")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+    with open(args.config, 'r', encoding='utf-8') as f:
+        base = yaml.safe_load(f)
+
+    for key in ('GEMINI_API_KEY', 'TELEGRAM_BOT_TOKEN', 'TELEGRAM_CHAT_ID'):
+        os.environ.setdefault(key, 'benchmark')
+    logging.getLogger().setLevel(args.log_level)
+
+    results = []
+    for feeds in args.feeds:
+        for result in run_scenario(base, args, feeds):
+            print_result(result)
+            results.append(result)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 결과 저장: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""
+벤치마크용 Gemini / 텔레그램 대체 객체
+실제 라이브러리의 GenerativeModel, configure, Bot 자리에 끼워 넣어
+네트워크 없이 지연 시간만 흉내 냅니다.
+"""
+
+import re
+import json
+import time
+import threading
+from contextlib import contextmanager
+from typing import Dict, List
+
+import google.generativeai as genai
+import telegram
+
+_LINK_RE = re.compile(r'https?://\S+')
+_ID_RE = re.compile(r'^\[(a\d+)\]', re.MULTILINE)
+
+
+class _Result:
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+class FakeGenerativeModel:
+    """
+    genai.GenerativeModel 대체
+
+    프롬프트의 기사 링크(또는 기사 ID)로 요약 형식의 응답을 만듭니다.
+    response_schema가 있으면 구조화 출력(JSON 항목 배열)을 반환합니다.
+    """
+
+    latency = {'count_tokens': 0.05, 'generate_content': 1.0}
+    calls: Dict[str, int] = {'count_tokens': 0, 'generate_content': 0}
+    _lock = threading.Lock()
+
+    def __init__(self, model_name: str, **kwargs):
+        self.model_name = model_name
+
+    @classmethod
+    def _record(cls, method: str) -> None:
+        with cls._lock:
+            cls.calls[method] += 1
+        time.sleep(cls.latency[method])
+
+    def count_tokens(self, text):
+        self._record('count_tokens')
+        return _Result(total_tokens=len(str(text)) // 3)
+
+    def generate_content(self, prompt, generation_config=None, stream=False, **kwargs):
+        self._record('generate_content')
+        if generation_config and 'response_schema' in generation_config:
+            ids = generation_config['response_schema']['items']['properties']['id']['enum'][:10]
+            items = [{'id': ref, 'title': f"벤치마크 기사 제목 {i}", 'summary': '요약 문장 ' * 20, 'rank': i}
+                     for i, ref in enumerate(ids, 1)]
+            return _Result(text=json.dumps(items, ensure_ascii=False))
+        links = (_LINK_RE.findall(str(prompt)) or _ID_RE.findall(str(prompt)))[:10]
+        text = '📰 **오늘의 핵심 뉴스**\n\n' + '\n\n'.join(
+            f"{i}. **[Source]({link})** 벤치마크 기사 제목 {i}\n   → {'요약 문장 ' * 20}"
+            for i, link in enumerate(links, 1)
+        )
+        if not stream:
+            return _Result(text=text)
+        return [_Result(text=text[i:i + 200]) for i in range(0, len(text), 200)]
+
+
+class FakeBot:
+    """telegram.Bot 대체 (호출마다 latency초 지연)"""
+
+    latency = 0.05
+    sent: List[str] = []
+    _lock = threading.Lock()
+    _next_id = 0
+
+    def __init__(self, token=None, **kwargs):
+        pass
+
+    @classmethod
+    def _message(cls) -> _Result:
+        time.sleep(cls.latency)
+        with cls._lock:
+            cls._next_id += 1
+            return _Result(message_id=cls._next_id)
+
+    def get_me(self):
+        time.sleep(self.latency)
+        return _Result(username='benchmark_bot')
+
+    def get_chat(self, chat_id):
+        time.sleep(self.latency)
+        return _Result(type='private')
+
+    def send_message(self, chat_id, text, **kwargs):
+        message = self._message()
+        with self._lock:
+            self.sent.append(text)
+        return message
+
+    def edit_message_text(self, text=None, chat_id=None, message_id=None, **kwargs):
+        time.sleep(self.latency)
+
+    def delete_message(self, chat_id, message_id):
+        time.sleep(self.latency)
+
+
+@contextmanager
+def fake_services(gemini_latency: float = 1.0, telegram_latency: float = 0.05):
+    """Gemini / 텔레그램을 대체 객체로 교체 (종료 시 복원)"""
+    FakeGenerativeModel.latency = {
+        'count_tokens': gemini_latency / 20,
+        'generate_content': gemini_latency,
+    }
+    FakeGenerativeModel.calls = {'count_tokens': 0, 'generate_content': 0}
+    FakeBot.latency = telegram_latency
+    FakeBot.sent = []
+
+    originals = (genai.GenerativeModel, genai.configure, genai.get_model, telegram.Bot)
+    genai.GenerativeModel = FakeGenerativeModel
+    genai.configure = lambda **kwargs: None
+    genai.get_model = lambda name: _Result(name=name)
+    telegram.Bot = FakeBot
+    try:
+        yield
+    finally:
+        genai.GenerativeModel, genai.configure, genai.get_model, telegram.Bot = originals
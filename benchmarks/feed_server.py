@@ -0,0 +1,149 @@
+"""
+벤치마크용 로컬 RSS 서버
+경로/쿼리로 피드 크기, 기사 수, 지연, 오류(403/429/타임아웃)를 지정합니다.
+
+    GET /feed/<이름>?entries=30&entry_bytes=800&latency=0.2&fail=429
+
+fail 값:
+    403     항상 403 응답
+    429     첫 요청만 429 (Retry-After: 1), 이후 정상
+    timeout 응답 전에 timeout_after초 대기
+"""
+
+import time
+import hashlib
+import threading
+from email.utils import formatdate
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict
+from urllib.parse import urlparse, parse_qs
+
+WORDS = (
+    'ekonomi harga minyak naik turun bank indonesia presiden rupiah saham ekspor '
+    'impor pajak jalan tol banjir gempa pemilu menteri investasi pabrik'
+).split()
+
+
+def build_feed(name: str, entries: int, entry_bytes: int, now: float) -> bytes:
+    """합성 RSS 2.0 본문 (이름/순번 기반 고정 제목, 10분 간격 발행)"""
+    items = []
+    for i in range(entries):
+        digest = hashlib.md5(f'{name}-{i}'.encode()).digest()
+        title = ' '.join(WORDS[b % len(WORDS)] for b in digest[:7])
+        padding = ' '.join(WORDS[b % len(WORDS)] for b in digest) * max(1, entry_bytes // 150)
+        items.append(
+            f'<item><title>{title} {name} {i}</title>'
+            f'<link>http://news.example/{name}/{i}?utm_source=rss</link>'
+            f'<guid>{name}-{i}</guid>'
+            f'<pubDate>{formatdate(now - i * 600, usegmt=True)}</pubDate>'
+            f'<description>{padding[:entry_bytes]}</description></item>'
+        )
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f'<title>{name}</title>{"".join(items)}</channel></rss>'
+    ).encode('utf-8')
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    """피드 요청 처리 (ETag/304 지원)"""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'BenchFeed/1.0'
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        name = url.path.rsplit('/', 1)[-1]
+        state = self.server.state
+
+        with state['lock']:
+            state['requests'] += 1
+            hits = state['hits'][name] = state['hits'].get(name, 0) + 1
+
+        time.sleep(float(params.get('latency', 0)))
+
+        fail = params.get('fail')
+        if fail == '403':
+            return self._empty(403)
+        if fail == '429' and hits == 1:
+            return self._empty(429, {'Retry-After': '1'})
+        if fail == 'timeout':
+            time.sleep(float(params.get('timeout_after', 3)))
+
+        etag = f'"{name}-{state["epoch"]}"'
+        if self.headers.get('If-None-Match') == etag:
+            return self._empty(304, {'ETag': etag})
+
+        body = build_feed(
+            name,
+            int(params.get('entries', 30)),
+            int(params.get('entry_bytes', 300)),
+            state['now']
+        )
+        with state['lock']:
+            state['bytes'] += len(body)
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/rss+xml; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # 스트리밍 파서의 조기 중단
+
+    def _empty(self, status: int, headers: Dict[str, str] = None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+
+class FeedServer:
+    """백그라운드 스레드에서 실행되는 피드 서버 (모든 루프백 주소에서 수신)"""
+
+    def __init__(self, port: int = 0):
+        self.httpd = ThreadingHTTPServer(('', port), FeedHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = {
+            'lock': threading.Lock(),
+            'requests': 0,
+            'bytes': 0,
+            'hits': {},
+            'epoch': 1,
+            'now': time.time(),
+        }
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self.httpd.server_address[1]
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        state = self.httpd.state
+        return {'requests': state['requests'], 'bytes': state['bytes']}
+
+    def reset_stats(self, new_content: bool = False) -> None:
+        """요청 통계 초기화 (new_content면 ETag 변경 → 전체 재다운로드)"""
+        state = self.httpd.state
+        with state['lock']:
+            state['requests'] = 0
+            state['bytes'] = 0
+            state['hits'] = {}
+            if new_content:
+                state['epoch'] += 1
+                state['now'] = time.time()
+
+    def __enter__(self) -> 'FeedServer':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -8,6 +8,9 @@ import sys
 import logging
 from typing import Dict, Any, List, Optional
 from pathlib import Path
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from scheduler import CronError, build_schedules
 
 try:
     import yaml
@@ -57,8 +60,8 @@ class ConfigValidator:
         return True
     
     @staticmethod
-    def validate_collection(config: Dict[str, Any]) -> bool:
-        """수집 설정 검증"""
+    def validate_collection(config: Dict[str, Any], map_reduce: bool = False) -> bool:
+        """수집 설정 검증 (맵리듀스 사용 시 전체 기사 상한 확대)"""
         max_per_source = config.get('max_articles_per_source', 20)
         max_total = config.get('max_total_articles', 60)
         hours = config.get('hours_threshold', 24)
@@ -69,8 +72,9 @@ class ConfigValidator:
         if not (1 <= max_per_source <= 100):
             raise ConfigError(f"max_articles_per_source는 1~100 사이여야 함: {max_per_source}")
         
-        if not (1 <= max_total <= 200):
-            raise ConfigError(f"max_total_articles는 1~200 사이여야 함: {max_total}")
+        max_total_limit = 2000 if map_reduce else 200
+        if not (1 <= max_total <= max_total_limit):
+            raise ConfigError(f"max_total_articles는 1~{max_total_limit} 사이여야 함: {max_total}")
         
         if not (1 <= hours <= 168):
             raise ConfigError(f"hours_threshold는 1~168 사이여야 함: {hours}")
@@ -81,9 +85,193 @@ class ConfigValidator:
         if not (1 <= retries <= 10):
             raise ConfigError(f"max_retries는 1~10 사이여야 함: {retries}")
         
+        max_concurrent = config.get('max_concurrent_feeds', 8)
+        if not (1 <= max_concurrent <= 64):
+            raise ConfigError(f"max_concurrent_feeds는 1~64 사이여야 함: {max_concurrent}")
+        
+        max_per_host = config.get('max_per_host', 2)
+        if not (1 <= max_per_host <= 16):
+            raise ConfigError(f"max_per_host는 1~16 사이여야 함: {max_per_host}")
+        
+        parse_workers = config.get('parse_workers', 0)
+        if parse_workers != 'auto' and not (isinstance(parse_workers, int) and 0 <= parse_workers <= 64):
+            raise ConfigError(f"parse_workers는 'auto' 또는 0~64여야 함: {parse_workers}")
+        
         logger.info("✅ 수집 설정 검증 완료")
         return True
     
+    @staticmethod
+    def validate_dedup(config: Dict[str, Any]) -> bool:
+        """유사 기사 병합 설정 검증"""
+        threshold = config.get('similarity_threshold', 0.5)
+        num_perm = config.get('num_perm', 64)
+        
+        if not (0.0 < threshold <= 1.0):
+            raise ConfigError(f"similarity_threshold는 0.0~1.0 사이여야 함: {threshold}")
+        
+        if not (8 <= num_perm <= 512):
+            raise ConfigError(f"num_perm은 8~512 사이여야 함: {num_perm}")
+        
+        return True
+    
+    @staticmethod
+    def validate_ranking(config: Dict[str, Any], map_reduce: bool = False,
+                         max_total: int = 60) -> bool:
+        """사전 순위 설정 검증"""
+        top_k = config.get('top_k', 40)
+        if not (5 <= top_k <= 2000):
+            raise ConfigError(f"ranking.top_k는 5~2000 사이여야 함: {top_k}")
+        
+        pool_factor = config.get('pool_factor', 3)
+        if not (1 <= pool_factor <= 20):
+            raise ConfigError(f"ranking.pool_factor는 1~20 사이여야 함: {pool_factor}")
+        
+        # 순위가 먼저 적용되므로 맵리듀스 입력도 top_k개로 제한됨
+        if config.get('enabled', False) and map_reduce and top_k < max_total:
+            logger.warning(
+                f"⚠️ ranking.top_k({top_k})가 맵리듀스 입력을 제한함 "
+                f"(max_total_articles {max_total}개 전체를 검토하려면 top_k를 늘리세요)"
+            )
+        
+        topics = config.get('topics') or {}
+        if not isinstance(topics, dict) or not all(isinstance(v, list) for v in topics.values()):
+            raise ConfigError("ranking.topics는 {주제: [키워드, ...]} 형식이어야 함")
+        
+        for name, weight in (config.get('weights') or {}).items():
+            if name not in ('relevance', 'coverage', 'priority', 'recency'):
+                raise ConfigError(f"알 수 없는 ranking.weights 항목: {name}")
+            if weight < 0:
+                raise ConfigError(f"ranking.weights.{name}는 0 이상이어야 함: {weight}")
+        
+        return True
+    
+    @staticmethod
+    def validate_content(config: Dict[str, Any]) -> bool:
+        """기사 본문 보강 설정 검증"""
+        max_tokens = config.get('max_tokens_per_article', 200)
+        max_concurrent = config.get('max_concurrent', 8)
+        timeout = config.get('page_timeout', 5)
+        
+        if not (20 <= max_tokens <= 2000):
+            raise ConfigError(f"max_tokens_per_article는 20~2000 사이여야 함: {max_tokens}")
+        
+        if not (1 <= max_concurrent <= 64):
+            raise ConfigError(f"content.max_concurrent는 1~64 사이여야 함: {max_concurrent}")
+        
+        if not (1 <= timeout <= 60):
+            raise ConfigError(f"page_timeout은 1~60 사이여야 함: {timeout}")
+        
+        return True
+    
+    @staticmethod
+    def validate_structured_output(config: Dict[str, Any], prompts: Dict[str, Any]) -> bool:
+        """구조화 출력 설정 검증 (재요청 횟수, 프롬프트, 렌더링 템플릿)"""
+        if not config.get('enabled', False):
+            return True
+        
+        max_followups = config.get('max_followups', 2)
+        if not (0 <= max_followups <= 5):
+            raise ConfigError(f"max_followups는 0~5 사이여야 함: {max_followups}")
+        
+        if not prompts.get('structured'):
+            raise ConfigError("구조화 출력 사용 시 prompts.structured 필요")
+        
+        item = (prompts.get('digest_template') or {}).get('item')
+        if item:
+            try:
+                item.format(number=1, source='', link='', title='', summary='')
+            except (KeyError, IndexError, ValueError) as e:
+                raise ConfigError(f"prompts.digest_template.item 형식 오류: {e}")
+        
+        return True
+    
+    @staticmethod
+    def validate_cascade(config: Dict[str, Any]) -> bool:
+        """모델 캐스케이드 / 헤지 요청 설정 검증"""
+        fallback_models = config.get('fallback_models', [])
+        percentile = config.get('hedge_percentile', 90)
+        default_hedge = config.get('default_hedge_seconds', 20)
+        min_hedge = config.get('min_hedge_seconds', 3)
+        timeout = config.get('request_timeout', 120)
+        history_size = config.get('history_size', 50)
+        
+        if not isinstance(fallback_models, list) or not all(isinstance(m, str) for m in fallback_models):
+            raise ConfigError(f"fallback_models는 모델명 목록이어야 함: {fallback_models}")
+        
+        if not (50 <= percentile <= 99):
+            raise ConfigError(f"hedge_percentile은 50~99 사이여야 함: {percentile}")
+        
+        if not (0 <= min_hedge <= default_hedge <= timeout):
+            raise ConfigError(
+                f"min_hedge_seconds ≤ default_hedge_seconds ≤ request_timeout이어야 함: "
+                f"{min_hedge}, {default_hedge}, {timeout}"
+            )
+        
+        if not (10 <= timeout <= 600):
+            raise ConfigError(f"request_timeout은 10~600 사이여야 함: {timeout}")
+        
+        if not (5 <= history_size <= 1000):
+            raise ConfigError(f"history_size는 5~1000 사이여야 함: {history_size}")
+        
+        return True
+    
+    @staticmethod
+    def validate_telegram(config: Dict[str, Any]) -> bool:
+        """텔레그램 발송 설정 검증"""
+        global_rate = config.get('global_rate', 25)
+        max_concurrent = config.get('max_concurrent_sends', 8)
+        
+        # 텔레그램 봇 API 한도: 초당 30건
+        if not (0 < global_rate <= 30):
+            raise ConfigError(f"global_rate는 0~30 사이여야 함: {global_rate}")
+        
+        if not (1 <= max_concurrent <= 32):
+            raise ConfigError(f"max_concurrent_sends는 1~32 사이여야 함: {max_concurrent}")
+        
+        return True
+    
+    @staticmethod
+    def validate_daemon(config: Dict[str, Any]) -> bool:
+        """데몬 모드 설정 검증 (cron 표현식, 시간대)"""
+        try:
+            build_schedules(config)
+        except (CronError, KeyError, TypeError) as e:
+            raise ConfigError(f"daemon.schedules 오류: {e}")
+        
+        timezone = config.get('timezone')
+        if timezone:
+            try:
+                ZoneInfo(timezone)
+            except (ZoneInfoNotFoundError, ValueError):
+                raise ConfigError(f"알 수 없는 시간대: {timezone}")
+        
+        reload_interval = config.get('reload_interval', 30)
+        if not (1 <= reload_interval <= 3600):
+            raise ConfigError(f"reload_interval은 1~3600 사이여야 함: {reload_interval}")
+        
+        return True
+    
+    @staticmethod
+    def validate_polling(config: Dict[str, Any]) -> bool:
+        """적응형 폴링 설정 검증"""
+        min_interval = config.get('min_interval_minutes', 10)
+        max_interval = config.get('max_interval_hours', 12)
+        if min_interval < 0:
+            raise ConfigError(f"min_interval_minutes는 0 이상이어야 함: {min_interval}")
+        if max_interval * 60 < min_interval:
+            raise ConfigError("max_interval_hours는 min_interval_minutes보다 길어야 함")
+        
+        for key in ('min_expected_items', 'busy_fill_ratio'):
+            value = config.get(key, 0.5)
+            if value <= 0:
+                raise ConfigError(f"{key}는 0보다 커야 함: {value}")
+        
+        background_interval = config.get('background_interval_minutes', 15)
+        if background_interval < 1:
+            raise ConfigError(f"background_interval_minutes는 1 이상이어야 함: {background_interval}")
+        
+        return True
+    
     @staticmethod
     def validate_ai(config: Dict[str, Any]) -> bool:
         """AI 설정 검증 (2026년 2월 업데이트)"""
@@ -133,6 +321,58 @@ class ConfigValidator:
         logger.info(f"✅ AI 설정 검증 완료 (모델: {model})")
         return True
     
+    @staticmethod
+    def validate_digests(digests: List[Dict[str, Any]], feeds: List[Dict[str, Any]],
+                         structured_output: bool = False,
+                         prompts: Optional[Dict[str, Any]] = None) -> bool:
+        """다이제스트 프로필 검증 (structured_output: 전역 구조화 출력 사용 여부)"""
+        prompts = prompts or {}
+        feed_names = {f.get('name') for f in feeds}
+        names = set()
+        
+        for i, digest in enumerate(digests):
+            name = digest.get('name')
+            if not name:
+                raise ConfigError(f"다이제스트 #{i+1}: 'name' 필드 누락")
+            if name in names:
+                raise ConfigError(f"다이제스트 이름 중복: {name}")
+            names.add(name)
+            
+            unknown = [f for f in digest.get('feeds') or [] if f not in feed_names]
+            if unknown:
+                raise ConfigError(f"다이제스트 '{name}': 알 수 없는 피드 - {', '.join(unknown)}")
+            
+            chat_ids = digest.get('chat_ids')
+            if chat_ids is not None and not isinstance(chat_ids, list):
+                raise ConfigError(f"다이제스트 '{name}': chat_ids는 목록이어야 함")
+            
+            summary_count = digest.get('summary_count', 10)
+            if not (1 <= summary_count <= 50):
+                raise ConfigError(f"다이제스트 '{name}': summary_count는 1~50 사이여야 함: {summary_count}")
+            
+            # 프롬프트: prompts 키 이름 또는 {articles_text}가 있는 템플릿 본문
+            for key in ('prompt', 'structured_prompt'):
+                value = digest.get(key)
+                if value is None:
+                    continue
+                if not isinstance(value, str) or (value not in prompts and '{articles_text}' not in value):
+                    raise ConfigError(
+                        f"다이제스트 '{name}': {key} '{value}'는 prompts의 키도, "
+                        f"{{articles_text}}가 있는 템플릿도 아님"
+                    )
+            
+            # 구조화 출력은 prompts.summary 대신 prompts.structured 사용
+            structured = digest.get('ai', {}).get('structured_output', {}).get('enabled', structured_output)
+            if structured and 'prompt' in digest and 'structured_prompt' not in digest:
+                logger.warning(
+                    f"⚠️ 다이제스트 '{name}': 구조화 출력 사용 중이라 prompt는 무시됨 "
+                    f"(structured_prompt 지정 필요)"
+                )
+        
+        if digests:
+            logger.info(f"✅ 다이제스트 검증 완료: {len(digests)}개")
+        return True
+    
     @classmethod
     def validate(cls, config: Dict[str, Any]) -> bool:
         """전체 설정 검증"""
@@ -144,8 +384,27 @@ class ConfigValidator:
         
         # 각 섹션 검증
         cls.validate_rss_feeds(config['rss_feeds'])
-        cls.validate_collection(config['collection'])
+        map_reduce = config['ai'].get('map_reduce', {}).get('enabled', False)
+        cls.validate_collection(config['collection'], map_reduce)
         cls.validate_ai(config['ai'])
+        cls.validate_cascade(config['ai'].get('cascade', {}))
+        cls.validate_structured_output(config['ai'].get('structured_output', {}), config.get('prompts', {}))
+        cls.validate_dedup(config.get('dedup', {}))
+        cls.validate_ranking(
+            config.get('ranking', {}),
+            map_reduce,
+            config['collection'].get('max_total_articles', 60)
+        )
+        cls.validate_content(config.get('content', {}))
+        cls.validate_telegram(config.get('telegram', {}))
+        cls.validate_daemon(config.get('daemon', {}))
+        cls.validate_polling(config.get('polling', {}))
+        cls.validate_digests(
+            config.get('digests') or [],
+            config['rss_feeds'],
+            config['ai'].get('structured_output', {}).get('enabled', False),
+            config.get('prompts', {})
+        )
         
         return True
 
@@ -174,6 +433,13 @@ class ConfigLoader:
             'hours_threshold': 24,
             'request_timeout': 10,
             'max_retries': 3,
+            'concurrent_fetch': True,
+            'max_concurrent_feeds': 8,
+            'max_per_host': 2,
+            'streaming_parser': True,
+            'max_feed_size_mb': 5,
+            'spool_dir': '.spool',
+            'parse_workers': 0,
             'user_agent': 'Mozilla/5.0 (compatible; NewsBot/2.0)'
         },
         'ai': {
@@ -184,6 +450,25 @@ class ConfigLoader:
             'top_k': 40,
             'summary_count': 10,
             'language': 'ko',
+            'short_link_ids': False,
+            'structured_output': {
+                'enabled': False,
+                'max_followups': 2
+            },
+            'cascade': {
+                'enabled': False,
+                'fallback_models': [],
+                'hedge_percentile': 90,
+                'default_hedge_seconds': 20,
+                'min_hedge_seconds': 3,
+                'request_timeout': 120,
+                'history_size': 50
+            },
+            'map_reduce': {
+                'enabled': False,
+                'batch_tokens': 8000,
+                'max_workers': 4
+            },
             'safety_settings': {
                 'harassment': 'BLOCK_NONE',
                 'hate_speech': 'BLOCK_NONE',
@@ -191,12 +476,82 @@ class ConfigLoader:
                 'dangerous_content': 'BLOCK_NONE'
             }
         },
+        'cache': {
+            'enabled': True,
+            'directory': '.cache',
+            'feeds': {
+                'enabled': True,
+                'max_age_hours': 72,
+                'max_size_mb': 50
+            },
+            'token_calibration_days': 7,
+            'credential_hours': 24,
+            'responses': {
+                'enabled': True,
+                'ttl_hours': 24,
+                'max_size_mb': 20
+            }
+        },
+        'history': {
+            'enabled': False,
+            'ttl_days': 7
+        },
+        'dedup': {
+            'enabled': True,
+            'similarity_threshold': 0.5,
+            'num_perm': 64
+        },
+        'ranking': {
+            'enabled': False,
+            'top_k': 40,
+            'pool_factor': 3,
+            'topics': {},
+            'weights': {
+                'relevance': 0.6,
+                'coverage': 0.2,
+                'priority': 0.1,
+                'recency': 0.1
+            }
+        },
+        'content': {
+            'enabled': False,
+            'max_articles': 60,
+            'max_tokens_per_article': 200,
+            'max_concurrent': 8,
+            'page_timeout': 5,
+            'max_page_kb': 512,
+            'cache_days': 30,
+            'cache_size_mb': 50
+        },
         'telegram': {
             'max_message_length': 4000,
             'disable_preview': True,
             'parse_mode': 'Markdown',
             'retry_on_error': True,
-            'send_interval': 0.5
+            'send_interval': 0.5,
+            'global_rate': 25,
+            'max_concurrent_sends': 8,
+            'max_send_retries': 5
+        },
+        'daemon': {
+            'schedules': [],
+            'timezone': None,
+            'run_on_start': False,
+            'reload_interval': 30
+        },
+        'polling': {
+            'enabled': False,
+            'min_interval_minutes': 10,
+            'max_interval_hours': 12,
+            'min_expected_items': 0.5,
+            'busy_fill_ratio': 0.5,
+            'max_accumulated': 100,
+            'background_interval_minutes': 15
+        },
+        'metrics': {
+            'enabled': True,
+            'json_path': '.cache/metrics/run-report.json',
+            'prometheus_path': None
         },
         'logging': {
             'level': 'INFO',
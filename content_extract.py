@@ -0,0 +1,117 @@
+"""
+기사 본문 추출 (lxml 우선, 실패 시 BeautifulSoup)
+기사 페이지 HTML에서 본문 문단만 골라 텍스트로 만들고,
+프롬프트에 넣기 전 기사별 토큰 예산에 맞춰 자릅니다.
+
+본문 후보: <article> → 문단(<p>) 텍스트가 가장 많은 요소 → meta description
+"""
+
+import re
+import logging
+from typing import List, Optional
+
+from lxml import etree, html as lxml_html
+
+from token_budget import TokenEstimator
+
+logger = logging.getLogger(__name__)
+
+# 본문이 아닌 요소 (내용째 제거)
+_NOISE_TAGS = ['script', 'style', 'noscript', 'nav', 'header', 'footer', 'aside',
+               'form', 'iframe', 'svg', 'button', 'figure']
+
+# 이보다 짧은 문단은 캡션/버튼 문구로 보고 제외
+MIN_PARAGRAPH_CHARS = 40
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?。])\s')
+
+
+def _clean(text: str) -> str:
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+
+def _paragraphs(element) -> List[str]:
+    texts = (_clean(p.text_content()) for p in element.iter('p'))
+    return [t for t in texts if len(t) >= MIN_PARAGRAPH_CHARS]
+
+
+def _extract_lxml(content: bytes) -> str:
+    document = lxml_html.fromstring(content)
+    etree.strip_elements(document, *_NOISE_TAGS, with_tail=False)
+
+    # 1) <article>가 있으면 문단이 가장 많은 것
+    candidates = [_paragraphs(a) for a in document.iter('article')]
+    best = max(candidates, key=lambda ps: sum(map(len, ps)), default=[])
+
+    # 2) 문단 부모별 텍스트 합이 가장 큰 요소
+    if not best:
+        scores = {}
+        for p in document.iter('p'):
+            text = _clean(p.text_content())
+            parent = p.getparent()
+            if parent is not None and len(text) >= MIN_PARAGRAPH_CHARS:
+                scores[parent] = scores.get(parent, 0) + len(text)
+        if scores:
+            best = _paragraphs(max(scores, key=scores.get))
+
+    if best:
+        return '\n'.join(best)
+
+    # 3) 문단이 없으면 요약 메타 태그
+    for xpath in ('//meta[@property="og:description"]/@content',
+                  '//meta[@name="description"]/@content'):
+        values = document.xpath(xpath)
+        if values:
+            return _clean(values[0])
+    return ''
+
+
+def _extract_soup(content: bytes) -> str:
+    from bs4 import BeautifulSoup  # lxml이 처리하지 못한 문서만
+
+    soup = BeautifulSoup(content, 'html.parser')
+    for tag in soup(_NOISE_TAGS):
+        tag.decompose()
+    paragraphs = [_clean(p.get_text(' ')) for p in soup.find_all('p')]
+    return '\n'.join(p for p in paragraphs if len(p) >= MIN_PARAGRAPH_CHARS)
+
+
+def extract_text(content: bytes, max_chars: int = 4000) -> str:
+    """
+    HTML → 본문 텍스트 (최대 max_chars자)
+
+    추출 실패 시 빈 문자열을 반환합니다.
+    """
+    if not content:
+        return ''
+    try:
+        text = _extract_lxml(content)
+    except (etree.ParserError, ValueError) as e:
+        logger.debug(f"lxml 추출 실패, BeautifulSoup 사용: {e}")
+        try:
+            text = _extract_soup(content)
+        except Exception as e:
+            logger.debug(f"본문 추출 실패: {e}")
+            return ''
+    return text[:max_chars]
+
+
+def trim_to_tokens(text: str, max_tokens: int, estimator: Optional[TokenEstimator] = None) -> str:
+    """텍스트를 토큰 예산 이내로 자르기 (가능하면 문장 경계에서)"""
+    estimator = estimator or TokenEstimator()
+    if not text or estimator.estimate(text) <= max_tokens:
+        return text
+
+    # 토큰 비율로 길이를 맞춘 뒤 예산 이내가 될 때까지 줄임
+    cut = len(text)
+    while cut > 0:
+        cut = int(cut * max_tokens / max(estimator.estimate(text[:cut]), 1) * 0.95)
+        if estimator.estimate(text[:cut]) <= max_tokens:
+            break
+
+    trimmed = text[:cut]
+    boundaries = [m.start() for m in _SENTENCE_END_RE.finditer(trimmed)]
+    if boundaries and boundaries[-1] > cut // 2:
+        trimmed = trimmed[:boundaries[-1]]
+    return trimmed.rstrip() + '…'
@@ -0,0 +1,161 @@
+"""
+유사 기사 클러스터링 (MinHash + LSH)
+여러 매체가 같은 통신 기사를 조금씩 다른 제목으로 낸 경우 하나로 묶습니다.
+"""
+
+import re
+import hashlib
+import logging
+import unicodedata
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_NON_WORD_RE = re.compile(r'[\W_]+', re.UNICODE)
+
+
+def normalize_title(title: str) -> str:
+    """제목 정규화 (NFKC + 소문자 + 구두점 제거)"""
+    title = unicodedata.normalize('NFKC', title or '').lower()
+    return _NON_WORD_RE.sub(' ', title).strip()
+
+
+def shingles(text: str, size: int = 3) -> set:
+    """문자 n-gram 집합 (언어 무관)"""
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def _base_hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=4).digest(), 'big')
+
+
+def _lsh_params(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """임계값에 가장 가까운 (밴드 수, 밴드당 행 수) 선택"""
+    best = (num_perm, 1)
+    best_error = float('inf')
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        # S-커브 변곡점 ≈ (1/b)^(1/r)
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class MinHasher:
+    """고정 시드 MinHash 서명 생성기"""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        # 결정적 순열 계수 (실행마다 동일)
+        coefficients = []
+        for i in range(num_perm):
+            digest = hashlib.blake2b(f"{seed}:{i}".encode(), digest_size=16).digest()
+            a = int.from_bytes(digest[:8], 'big') % (_MERSENNE_PRIME - 1) + 1
+            b = int.from_bytes(digest[8:], 'big') % _MERSENNE_PRIME
+            coefficients.append((a, b))
+        self.coefficients = coefficients
+
+    def signature(self, shingle_set: set) -> Tuple[int, ...]:
+        hashes = [_base_hash(s) for s in shingle_set] or [0]
+        return tuple(
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self.coefficients
+        )
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, x: int) -> int:
+        while self.parent[x] != x:
+            self.parent[x] = self.parent[self.parent[x]]
+            x = self.parent[x]
+        return x
+
+    def union(self, x: int, y: int) -> None:
+        rx, ry = self.find(x), self.find(y)
+        if rx != ry:
+            # 작은 인덱스를 루트로 (결정적 결과)
+            self.parent[max(rx, ry)] = min(rx, ry)
+
+
+def cluster_articles(articles: List[Dict], threshold: float = 0.5, num_perm: int = 64,
+                     priorities: Optional[Dict[str, int]] = None) -> Tuple[List[Dict], List[Dict]]:
+    """
+    유사 제목 기사 클러스터링
+
+    Args:
+        articles: 기사 목록
+        threshold: 제목 문자 3-gram 자카드 유사도 임계값 (0~1)
+        num_perm: MinHash 순열 수
+        priorities: {소스명: 우선순위} (낮을수록 대표 기사로 선택)
+
+    Returns:
+        (대표 기사 목록, 제거된 기사 목록)
+        대표 기사에는 'alt_sources'(같은 기사를 보도한 다른 매체)와
+        'duplicate_links'(병합된 기사 링크) 필드가 추가됩니다.
+    """
+    if len(articles) < 2:
+        return articles, []
+
+    priorities = priorities or {}
+    hasher = MinHasher(num_perm)
+    bands, rows = _lsh_params(num_perm, threshold)
+
+    shingle_sets = [shingles(normalize_title(a.get('title', ''))) for a in articles]
+    signatures = [hasher.signature(s) for s in shingle_sets]
+
+    # LSH 버킷 → 후보 쌍만 비교 (전체 쌍 비교 회피)
+    union_find = _UnionFind(len(articles))
+    for band in range(bands):
+        buckets = defaultdict(list)
+        for index, signature in enumerate(signatures):
+            if not shingle_sets[index]:
+                continue
+            buckets[signature[band * rows:(band + 1) * rows]].append(index)
+
+        for members in buckets.values():
+            for i, x in enumerate(members):
+                for y in members[i + 1:]:
+                    if union_find.find(x) == union_find.find(y):
+                        continue
+                    a, b = shingle_sets[x], shingle_sets[y]
+                    if len(a & b) / len(a | b) >= threshold:
+                        union_find.union(x, y)
+
+    clusters = defaultdict(list)
+    for index in range(len(articles)):
+        clusters[union_find.find(index)].append(index)
+
+    # 대표 기사 선택 (소스 우선순위 → 원래 순서)
+    representatives = {}
+    removed = []
+    for members in clusters.values():
+        leader = min(members, key=lambda i: (priorities.get(articles[i].get('source'), 999), i))
+        if len(members) == 1:
+            representatives[leader] = articles[leader]
+            continue
+
+        alt_sources = []
+        duplicate_links = []
+        for i in members:
+            source = articles[i].get('source')
+            if i != leader:
+                removed.append(articles[i])
+                duplicate_links.append(articles[i].get('link'))
+                if source != articles[leader].get('source') and source not in alt_sources:
+                    alt_sources.append(source)
+
+        representatives[leader] = {**articles[leader], 'alt_sources': alt_sources,
+                                   'duplicate_links': duplicate_links}
+
+    result = [representatives[i] for i in sorted(representatives)]
+    return result, removed
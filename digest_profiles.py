@@ -0,0 +1,101 @@
+"""
+다이제스트 프로필 (수집 1회 → 여러 다이제스트)
+프로필마다 피드 범위, 프롬프트, 요약 개수/언어, 수신 채팅을 따로 지정합니다.
+"""
+
+import os
+import copy
+import logging
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE = 'default'
+
+
+def _resolve_chat_ids(values: List[Any]) -> List[str]:
+    """채팅 ID 목록 (${ENV} 형식은 환경 변수로 치환)"""
+    chat_ids = []
+    for value in values:
+        chat_id = os.path.expandvars(str(value)).strip()
+        if not chat_id or chat_id.startswith('$'):
+            logger.warning(f"⚠️ 채팅 ID 환경 변수 미설정: {value}")
+            continue
+        if chat_id not in chat_ids:
+            chat_ids.append(chat_id)
+    return chat_ids
+
+
+def build_profiles(config: Dict[str, Any], default_chat_id: str) -> List[Dict[str, Any]]:
+    """
+    설정 → 프로필 목록
+
+    digests 섹션이 없으면 기존 설정 그대로인 기본 프로필 1개를 반환합니다.
+
+    Returns:
+        [{'name', 'config', 'chat_ids', 'feeds'}, ...]
+        config는 프로필 설정이 반영된 전체 설정 사본, feeds는 피드 이름 집합(None = 전체)
+    """
+    digests = config.get('digests') or []
+    if not digests:
+        return [{
+            'name': DEFAULT_PROFILE,
+            'config': config,
+            'chat_ids': [default_chat_id],
+            'feeds': None,
+        }]
+
+    prompts = config.get('prompts', {})
+    profiles = []
+    for digest in digests:
+        profile_config = copy.deepcopy(config)
+        profile_config.pop('digests', None)
+
+        # AI / 텔레그램 설정 덮어쓰기
+        profile_config['ai'].update(digest.get('ai', {}))
+        for key in ('summary_count', 'language'):
+            if key in digest:
+                profile_config['ai'][key] = digest[key]
+        profile_config.setdefault('telegram', {}).update(digest.get('telegram', {}))
+        profile_config.setdefault('ranking', {}).update(digest.get('ranking', {}))
+
+        # 프롬프트: prompts 키 이름 또는 템플릿 본문 (구조화 출력은 structured_prompt)
+        prompt = digest.get('prompt', 'summary')
+        structured_prompt = digest.get('structured_prompt', 'structured')
+        profile_config['prompts'] = dict(prompts)
+        profile_config['prompts']['summary'] = prompts.get(prompt, prompt)
+        profile_config['prompts']['structured'] = prompts.get(structured_prompt, structured_prompt)
+
+        feeds = set(digest['feeds']) if digest.get('feeds') else None
+        if feeds is not None:
+            profile_config['rss_feeds'] = [
+                f for f in config.get('rss_feeds', []) if f.get('name') in feeds
+            ]
+
+        profiles.append({
+            'name': digest['name'],
+            'config': profile_config,
+            'chat_ids': _resolve_chat_ids(digest.get('chat_ids') or [default_chat_id]),
+            'feeds': feeds,
+        })
+
+    return profiles
+
+
+def union_feed_config(config: Dict[str, Any], profiles: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """모든 프로필이 사용하는 피드만 남긴 수집용 설정 (피드는 1번씩만 수집)"""
+    if any(p['feeds'] is None for p in profiles):
+        return config
+
+    names = set().union(*(p['feeds'] for p in profiles))
+    collect_config = dict(config)
+    collect_config['rss_feeds'] = [f for f in config.get('rss_feeds', []) if f.get('name') in names]
+    return collect_config
+
+
+def select_articles(articles: List[Dict], profile: Dict[str, Any]) -> List[Dict]:
+    """프로필 피드에 해당하는 기사만 선택 (순서 유지)"""
+    feeds: Optional[set] = profile['feeds']
+    if feeds is None:
+        return list(articles)
+    return [a for a in articles if a.get('source') in feeds]
@@ -0,0 +1,119 @@
+"""
+디스크 캐시 (JSON 파일 기반)
+키 하나당 JSON 파일 하나로 저장하고, 나이/용량 기준으로 정리합니다.
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """디렉터리 기반 JSON 캐시"""
+
+    def __init__(self, directory: str, max_age_seconds: Optional[float] = None,
+                 max_bytes: Optional[int] = None, max_entries: Optional[int] = None):
+        """
+        Args:
+            directory: 캐시 디렉터리 (없으면 생성)
+            max_age_seconds: 이보다 오래된 항목은 무효 (None = 무제한)
+            max_bytes: 전체 용량 상한 (초과 시 오래된 항목부터 삭제)
+            max_entries: 전체 항목 수 상한
+        """
+        self.directory = Path(directory)
+        self.max_age_seconds = max_age_seconds
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return self.directory / f"{digest[:40]}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """값 조회 (없거나 만료/손상 시 None)"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"캐시 손상, 삭제: {path} - {e}")
+            self.delete(key)
+            return None
+
+        if record.get('key') != key:
+            return None
+
+        if self.max_age_seconds is not None:
+            if time.time() - record.get('stored_at', 0) > self.max_age_seconds:
+                self.delete(key)
+                return None
+
+        return record.get('value')
+
+    def set(self, key: str, value: Any) -> None:
+        """값 저장 (원자적 쓰기)"""
+        path = self._path(key)
+        record = {'key': key, 'stored_at': time.time(), 'value': value}
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(record, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"⚠️ 캐시 저장 실패: {e}")
+
+    def delete(self, key: str) -> None:
+        """항목 삭제"""
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def evict(self) -> int:
+        """만료 항목 + 용량/개수 초과분 정리 (오래된 것부터)"""
+        with self._lock:
+            now = time.time()
+            files = []
+            for path in self.directory.glob('*.json'):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+
+            files.sort()  # 오래된 순
+            total_bytes = sum(size for _, size, _ in files)
+            removed = 0
+
+            for index, (mtime, size, path) in enumerate(files):
+                remaining = len(files) - index
+                expired = (self.max_age_seconds is not None
+                           and now - mtime > self.max_age_seconds)
+                over_bytes = self.max_bytes is not None and total_bytes > self.max_bytes
+                over_count = self.max_entries is not None and remaining > self.max_entries
+
+                if not (expired or over_bytes or over_count):
+                    break
+
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                total_bytes -= size
+                removed += 1
+
+            if removed:
+                logger.debug(f"캐시 정리: {self.directory} - {removed}개 삭제")
+            return removed
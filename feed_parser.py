@@ -0,0 +1,248 @@
+"""
+RSS/Atom 파서
+다운로드 중인 본문을 lxml 증분 파서로 읽다가 필요한 만큼 모이면 즉시 중단합니다.
+형식이 깨진 피드만 feedparser로 전체 파싱합니다.
+"""
+
+import logging
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+ITEM_TAGS = {'item', 'entry'}
+CHANNEL_TAGS = {'ttl', 'skipHours'}
+
+
+def parse_feed_entries(content, max_entries: int, meta: Optional[Dict] = None) -> List[Dict]:
+    """
+    피드 본문 → 압축 레코드 목록 (title, link, id, published) - feedparser 사용
+
+    Args:
+        meta: 있으면 채널 정보(ttl)를 채움
+    """
+    import feedparser  # 형식 오류 대체 경로에서만 사용 (임포트가 느림)
+    
+    parsed = feedparser.parse(content)
+    if meta is not None:
+        ttl = str(parsed.feed.get('ttl', '')).strip()
+        if ttl.isdigit():
+            meta['ttl'] = int(ttl)
+
+    records = []
+    for entry in parsed.entries[:max_entries]:
+        pub_date = entry.get('published_parsed')
+        records.append({
+            'title': entry.get('title', '제목 없음'),
+            'link': entry.get('link', ''),
+            'id': entry.get('id', ''),
+            'published': datetime(*pub_date[:6]) if pub_date else None
+        })
+    return records
+
+
+def parse_date(value: Optional[str]) -> Optional[datetime]:
+    """RFC 822 / ISO 8601 날짜 → UTC naive datetime (feedparser와 동일 기준)"""
+    if not value:
+        return None
+    value = value.strip()
+
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _localname(element) -> str:
+    tag = element.tag
+    if not isinstance(tag, str):
+        return ''
+    return tag.rsplit('}', 1)[-1]
+
+
+def _item_record(element) -> Dict:
+    """<item>/<entry> 요소 → 레코드"""
+    title = None
+    link = None
+    guid = ''
+    published = None
+
+    for child in element:
+        name = _localname(child)
+        text = (child.text or '').strip()
+
+        if name == 'title' and title is None:
+            title = ''.join(child.itertext()).strip()
+        elif name == 'link':
+            href = child.get('href')
+            if href is not None:
+                # Atom: rel="alternate" (또는 rel 없음) 우선
+                if link is None or child.get('rel', 'alternate') == 'alternate':
+                    link = href.strip()
+            elif text and link is None:
+                link = text
+        elif name in ('guid', 'id') and not guid:
+            guid = text
+        elif name in ('pubDate', 'published') and published is None:
+            published = parse_date(text)
+
+    return {
+        'title': title or '제목 없음',
+        'link': link or '',
+        'id': guid,
+        'published': published
+    }
+
+
+class FeedStreamParser:
+    """
+    증분 피드 파서
+
+    max_entries개를 읽었거나, cutoff보다 오래된 기사가 연속으로
+    stop_after_old개 나오면 완료 상태가 됩니다.
+    """
+
+    def __init__(self, max_entries: int, cutoff: Optional[datetime] = None,
+                 stop_after_old: int = 3):
+        self.max_entries = max_entries
+        self.cutoff = cutoff
+        self.stop_after_old = stop_after_old
+        self.records: List[Dict] = []
+        self.meta: Dict = {}  # 채널 정보 (ttl: 분, skip_hours: UTC 시 목록)
+        self.done = False
+        self._old_streak = 0
+        self._parser = etree.XMLPullParser(
+            events=('end',),
+            resolve_entities=False,
+            no_network=True,
+            huge_tree=False
+        )
+
+    def feed(self, chunk: bytes) -> bool:
+        """청크 입력 (완료 시 True)"""
+        if self.done:
+            return True
+
+        self._parser.feed(chunk)
+        for _, element in self._parser.read_events():
+            name = _localname(element)
+            if name not in ITEM_TAGS:
+                if name in CHANNEL_TAGS:
+                    self._channel_meta(name, element)
+                continue
+
+            record = _item_record(element)
+            self.records.append(record)
+
+            # 처리한 요소는 즉시 해제 (메모리 일정 유지)
+            element.clear()
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+
+            published = record['published']
+            if self.cutoff and published and published < self.cutoff:
+                self._old_streak += 1
+            else:
+                self._old_streak = 0
+
+            if len(self.records) >= self.max_entries or self._old_streak >= self.stop_after_old:
+                self.done = True
+                break
+
+        return self.done
+
+    def _channel_meta(self, name: str, element) -> None:
+        """RSS <ttl>, <skipHours> 기록 (폴링 주기 힌트)"""
+        parent = element.getparent()
+        if parent is None or _localname(parent) != 'channel':
+            return
+        if name == 'ttl':
+            text = (element.text or '').strip()
+            if text.isdigit():
+                self.meta['ttl'] = int(text)
+        else:
+            hours = [(child.text or '').strip() for child in element]
+            self.meta['skip_hours'] = sorted({int(h) % 24 for h in hours if h.isdigit()})
+
+    def close(self) -> None:
+        """스트림 끝 (남은 이벤트 처리)"""
+        if self.done:
+            return
+        self._parser.close()
+        self.feed(b'')
+
+
+def parse_feed_stream(chunks: Iterable[bytes], max_entries: int,
+                      cutoff: Optional[datetime] = None,
+                      max_bytes: int = 5 * 1024 * 1024,
+                      meta: Optional[Dict] = None) -> List[Dict]:
+    """
+    스트리밍 파싱 (조기 중단)
+
+    Args:
+        chunks: 본문 청크 (response.iter_content 등)
+        max_entries: 최대 기사 수
+        cutoff: 이보다 오래된 기사가 이어지면 중단
+        max_bytes: 읽을 최대 바이트 수
+        meta: 있으면 채널 정보(ttl, skip_hours)를 채움
+
+    Returns:
+        레코드 목록 (형식 오류 시 feedparser 결과)
+    """
+    parser = FeedStreamParser(max_entries, cutoff)
+    received = []
+    size = 0
+    iterator = iter(chunks)
+
+    try:
+        for chunk in iterator:
+            received.append(chunk)
+            size += len(chunk)
+            if parser.feed(chunk) or size >= max_bytes:
+                break
+        else:
+            parser.close()
+
+        logger.debug(f"스트리밍 파싱: {len(parser.records)}개, {size:,} bytes")
+        if meta is not None:
+            meta.update(parser.meta)
+        return parser.records
+
+    except etree.XMLSyntaxError as e:
+        # 형식 오류 → 남은 본문(상한까지)을 받아 feedparser로 재시도
+        logger.debug(f"XML 형식 오류, feedparser로 대체: {e}")
+        for chunk in iterator:
+            if size >= max_bytes:
+                break
+            received.append(chunk)
+            size += len(chunk)
+        return parse_feed_entries(b''.join(received)[:max_bytes], max_entries, meta)
+
+
+def parse_feed_bytes(content: bytes, max_entries: int, cutoff: Optional[datetime] = None,
+                     max_bytes: int = 5 * 1024 * 1024) -> Tuple[List[Dict], Dict[str, Any]]:
+    """
+    프로세스 풀 작업 단위: 다운로드된 본문 → (레코드, 채널 정보)
+
+    모듈 최상위 함수라 pickle 가능하며, 입력은 bytes / 결과는 압축 레코드만 오갑니다.
+    청크 단위로 넣어 스트리밍 파싱과 같이 필요한 만큼만 파싱합니다.
+    """
+    chunk_size = 64 * 1024
+    meta: Dict[str, Any] = {}
+    records = parse_feed_stream(
+        (content[i:i + chunk_size] for i in range(0, len(content), chunk_size)),
+        max_entries, cutoff, max_bytes, meta
+    )
+    return records, meta
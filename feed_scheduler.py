@@ -0,0 +1,148 @@
+"""
+피드별 적응형 폴링
+저장된 기사 발행 시각으로 피드의 발행 빈도를 추정하고,
+RSS <ttl>/<skipHours>, HTTP Cache-Control/Expires를 지켜 요청 여부를 정합니다.
+
+- 다이제스트 실행: 새 기사가 있을 가능성이 낮은 피드는 건너뛰고 캐시된 기사 사용
+- 백그라운드 폴링(데몬): 다음 다이제스트 전에 max_articles_per_source를 넘칠
+  만큼 바쁜 피드만 미리 수집해 기사를 누적
+"""
+
+import re
+import logging
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 발행 빈도 추정에 쓰는 최근 발행 시각 수
+MAX_TIMESTAMPS = 50
+
+_MAX_AGE_RE = re.compile(r'(?:^|,)\s*(?:s-)?max-age\s*=\s*(\d+)', re.IGNORECASE)
+
+
+class PollingPolicy:
+    """polling 설정"""
+
+    def __init__(self, config: Dict[str, Any]):
+        polling_config = config.get('polling', {})
+        self.enabled = polling_config.get('enabled', False)
+        self.min_interval = polling_config.get('min_interval_minutes', 10) * 60
+        self.max_interval = polling_config.get('max_interval_hours', 12) * 3600
+        self.min_expected_items = polling_config.get('min_expected_items', 0.5)
+        self.busy_fill_ratio = polling_config.get('busy_fill_ratio', 0.5)
+        self.max_accumulated = polling_config.get('max_accumulated', 100)
+
+
+def estimate_rate(timestamps: List[float]) -> Optional[float]:
+    """발행 시각(epoch 초) 목록 → 시간당 기사 수 (추정 불가 시 None)"""
+    if len(timestamps) < 2:
+        return None
+    span = max(timestamps) - min(timestamps)
+    if span <= 0:
+        return None
+    return (len(timestamps) - 1) / (span / 3600)
+
+
+def http_fresh_until(headers: Dict[str, str], now: float) -> Optional[float]:
+    """Cache-Control max-age / Expires → 재요청 불필요 시각 (epoch 초)"""
+    cache_control = headers.get('Cache-Control', '')
+    if 'no-cache' in cache_control.lower() or 'no-store' in cache_control.lower():
+        return None
+
+    match = _MAX_AGE_RE.search(cache_control)
+    if match:
+        return now + int(match.group(1))
+
+    expires = headers.get('Expires')
+    if expires:
+        try:
+            return parsedate_to_datetime(expires).timestamp()
+        except (TypeError, ValueError, IndexError):
+            return None
+    return None
+
+
+def poll_decision(state: Optional[Dict[str, Any]], now: float, max_per_source: int,
+                  policy: PollingPolicy, background: bool = False) -> Tuple[bool, str]:
+    """
+    지금 요청할지 결정
+
+    Args:
+        state: 캐시된 폴링 상태 (없으면 항상 요청)
+        background: 다이제스트 사이 폴링이면 True (바쁜 피드만 요청)
+
+    Returns:
+        (요청 여부, 사유)
+    """
+    if not state or 'polled_at' not in state:
+        return (not background), 'first'
+
+    elapsed = now - state['polled_at']
+    if elapsed < policy.min_interval:
+        return False, 'min_interval'
+
+    # 게시자 지시: Cache-Control/Expires, RSS ttl(분)
+    if state.get('fresh_until') and now < state['fresh_until']:
+        return False, 'http_fresh'
+    if state.get('ttl') and elapsed < state['ttl'] * 60:
+        return False, 'ttl'
+
+    # RSS skipHours (UTC 시)
+    hour = datetime.fromtimestamp(now, timezone.utc).hour
+    if hour in state.get('skip_hours', []):
+        return False, 'skip_hours'
+
+    rate = estimate_rate(state.get('timestamps', []))
+    if background:
+        # 다음 다이제스트 전에 수집 한도를 넘칠 피드만
+        if rate is None:
+            return False, 'unknown_rate'
+        expected = rate * elapsed / 3600
+        return expected >= policy.busy_fill_ratio * max_per_source, 'busy'
+
+    if elapsed >= policy.max_interval:
+        return True, 'max_interval'
+    if rate is None:
+        return True, 'unknown_rate'
+    expected = rate * elapsed / 3600
+    if expected >= policy.min_expected_items:
+        return True, 'expected'
+    return False, 'quiet'
+
+
+def update_state(state: Optional[Dict[str, Any]], records: List[Dict],
+                 headers: Dict[str, str], meta: Dict[str, Any], now: float) -> Dict[str, Any]:
+    """요청 1회 결과로 폴링 상태 갱신 (304면 records는 빈 목록)"""
+    state = dict(state or {})
+    timestamps = set(state.get('timestamps', []))
+    for record in records:
+        published = record.get('published')
+        if published:
+            timestamps.add(published.replace(tzinfo=timezone.utc).timestamp())
+
+    state['timestamps'] = sorted(timestamps)[-MAX_TIMESTAMPS:]
+    state['polled_at'] = now
+    state['fresh_until'] = http_fresh_until(headers, now)
+    if 'ttl' in meta:
+        state['ttl'] = meta['ttl']
+    if 'skip_hours' in meta:
+        state['skip_hours'] = meta['skip_hours']
+    return state
+
+
+def merge_entries(cached: List[Dict], fresh: List[Dict], cutoff: datetime, limit: int) -> List[Dict]:
+    """
+    누적 기사 병합 (id/링크 기준 중복 제거, cutoff 이후만, 최신순 limit개)
+
+    새로 받은 레코드가 같은 기사의 이전 레코드를 대체합니다.
+    """
+    merged: Dict[str, Dict] = {}
+    for record in cached + fresh:
+        key = record.get('id') or record.get('link') or record.get('title')
+        merged[key] = record
+
+    recent = [r for r in merged.values() if r.get('published') and r['published'] >= cutoff]
+    recent.sort(key=lambda r: r['published'], reverse=True)
+    return recent[:limit]
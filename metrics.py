@@ -0,0 +1,201 @@
+"""
+실행 지표 (단계별 시간, 피드별 통계, 토큰, 텔레그램 발송)
+스레드 안전한 레지스트리에 기록하고 실행이 끝나면
+JSON 실행 리포트 / Prometheus textfile로 내보냅니다.
+"""
+
+import os
+import json
+import time
+import logging
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PREFIX = 'news_digest'
+
+_Key = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _key(name: str, labels: Dict[str, Any]) -> _Key:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape_label(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class MetricsRegistry:
+    """실행 1회의 지표 저장소"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """새 실행 시작 (이전 기록 삭제)"""
+        with self._lock:
+            self.started_at = time.time()
+            self._timers: Dict[_Key, List[float]] = {}
+            self._counters: Dict[_Key, float] = {}
+            self._gauges: Dict[_Key, float] = {}
+            self._feeds: Dict[str, Dict[str, Any]] = {}
+
+    # ───────────────────────────────────────────────────────────
+    # 기록
+    # ───────────────────────────────────────────────────────────
+
+    def observe(self, name: str, seconds: float, **labels) -> None:
+        """소요 시간 1건 기록"""
+        with self._lock:
+            timer = self._timers.setdefault(_key(name, labels), [0, 0.0, 0.0])
+            timer[0] += 1
+            timer[1] += seconds
+            timer[2] = max(timer[2], seconds)
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """with 블록 소요 시간 기록 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        """카운터 증가"""
+        with self._lock:
+            key = _key(name, labels)
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def gauge(self, name: str, value: float, **labels) -> None:
+        """현재 값 기록"""
+        with self._lock:
+            self._gauges[_key(name, labels)] = value
+
+    def feed(self, name: str, **fields) -> None:
+        """피드별 통계 (숫자는 누적, 그 외는 덮어쓰기)"""
+        with self._lock:
+            record = self._feeds.setdefault(name, {})
+            for field, value in fields.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    record[field] = record.get(field, 0) + value
+                else:
+                    record[field] = value
+
+    # ───────────────────────────────────────────────────────────
+    # 내보내기
+    # ───────────────────────────────────────────────────────────
+
+    def report(self, **extra) -> Dict[str, Any]:
+        """JSON 실행 리포트"""
+        with self._lock:
+            finished = time.time()
+            feeds = {name: dict(record) for name, record in self._feeds.items()}
+            report = {
+                'started_at': datetime.fromtimestamp(self.started_at).isoformat(),
+                'finished_at': datetime.fromtimestamp(finished).isoformat(),
+                'duration_seconds': round(finished - self.started_at, 3),
+                **extra,
+                'timers': [
+                    {'name': name, 'labels': dict(labels), 'count': int(count),
+                     'seconds': round(total, 4), 'max_seconds': round(peak, 4)}
+                    for (name, labels), (count, total, peak) in sorted(self._timers.items())
+                ],
+                'counters': [
+                    {'name': name, 'labels': dict(labels), 'value': value}
+                    for (name, labels), value in sorted(self._counters.items())
+                ],
+                'gauges': [
+                    {'name': name, 'labels': dict(labels), 'value': value}
+                    for (name, labels), value in sorted(self._gauges.items())
+                ],
+                'feeds': feeds,
+            }
+
+        report['slowest_feeds'] = sorted(
+            feeds, key=lambda f: feeds[f].get('seconds', 0), reverse=True
+        )[:10]
+        return report
+
+    def prometheus(self, **extra) -> str:
+        """Prometheus textfile 형식 (node_exporter textfile collector용)"""
+        # 같은 이름의 샘플은 한곳에 모아야 함 (TYPE 1회)
+        families: Dict[str, Tuple[str, List[str]]] = {}
+
+        def emit(name: str, kind: str, labels: Dict[str, Any], value: float) -> None:
+            metric = f"{PREFIX}_{name}"
+            samples = families.setdefault(metric, (kind, []))[1]
+            label_text = ','.join(f'{k}="{_escape_label(v)}"' for k, v in sorted(labels.items()))
+            samples.append(f"{metric}{{{label_text}}} {value}" if label_text else f"{metric} {value}")
+
+        report = self.report(**extra)
+        emit('run_duration_seconds', 'gauge', {}, report['duration_seconds'])
+        emit('run_timestamp_seconds', 'gauge', {}, round(time.time()))
+        for key, value in extra.items():
+            if isinstance(value, (bool, int, float)):
+                emit(f"run_{key}", 'gauge', {}, int(value) if isinstance(value, bool) else value)
+
+        for timer in report['timers']:
+            emit(f"{timer['name']}_seconds_sum", 'counter', timer['labels'], timer['seconds'])
+            emit(f"{timer['name']}_seconds_count", 'counter', timer['labels'], timer['count'])
+            emit(f"{timer['name']}_seconds_max", 'gauge', timer['labels'], timer['max_seconds'])
+        for counter in report['counters']:
+            emit(f"{counter['name']}_total", 'counter', counter['labels'], counter['value'])
+        for gauge in report['gauges']:
+            emit(gauge['name'], 'gauge', gauge['labels'], gauge['value'])
+
+        for feed, record in sorted(report['feeds'].items()):
+            for field, value in sorted(record.items()):
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    emit(f"feed_{field}", 'gauge', {'feed': feed}, value)
+
+        lines = []
+        for metric, (kind, samples) in families.items():
+            lines.append(f"# TYPE {metric} {kind}")
+            lines.extend(samples)
+        return '\n'.join(lines) + '\n'
+
+
+def _write_atomic(path: str, text: str) -> None:
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=target.parent, suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, target)
+
+
+def export(config: Dict, registry: Optional[MetricsRegistry] = None, **extra) -> None:
+    """
+    설정(metrics 섹션)에 따라 리포트 저장
+
+    Args:
+        extra: 리포트에 함께 기록할 실행 정보 (success, run_id 등)
+    """
+    metrics_config = config.get('metrics', {})
+    if not metrics_config.get('enabled', True):
+        return
+    registry = registry or METRICS
+
+    try:
+        json_path = metrics_config.get('json_path')
+        if json_path:
+            _write_atomic(json_path, json.dumps(registry.report(**extra), ensure_ascii=False, indent=2))
+            logger.info(f"📊 실행 리포트 저장: {json_path}")
+
+        prometheus_path = metrics_config.get('prometheus_path')
+        if prometheus_path:
+            _write_atomic(prometheus_path, registry.prometheus(**extra))
+            logger.info(f"📊 Prometheus 지표 저장: {prometheus_path}")
+    except OSError as e:
+        logger.warning(f"⚠️ 지표 저장 실패: {e}")
+
+
+# 프로세스 기본 레지스트리
+METRICS = MetricsRegistry()
@@ -0,0 +1,171 @@
+"""
+모델 캐스케이드 + 헤지 요청 (지연 시간 예산)
+기본 모델이 최근 응답 시간의 백분위(예: p90) 안에 답하지 않으면
+다음 모델에 같은 요청을 동시에 보내고, 먼저 도착한 유효 응답을 사용합니다.
+
+지연 기록은 모델별 최근 N건을 디스크 캐시에 저장해 실행 간에 유지합니다.
+각 요청은 데몬 스레드에서 실행하고, 진 요청은 기다리지 않고 버립니다.
+(프로세스 종료를 막지 않음, 데몬 모드에서는 요청 타임아웃 안에 스스로 끝남)
+"""
+
+import time
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from disk_cache import DiskCache
+from metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+# 이보다 기록이 적으면 백분위 대신 기본 헤지 대기 시간 사용
+MIN_SAMPLES = 5
+
+
+class LatencyHistory:
+    """모델별 최근 응답 시간 (초)"""
+
+    def __init__(self, cache: Optional[DiskCache] = None, size: int = 50):
+        self.cache = cache
+        self.size = size
+        self._samples: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def _load(self, model_name: str) -> List[float]:
+        if model_name not in self._samples:
+            stored = self.cache.get(f"latency:{model_name}") if self.cache else None
+            self._samples[model_name] = list(stored or [])
+        return self._samples[model_name]
+
+    def record(self, model_name: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._load(model_name)
+            samples.append(round(seconds, 3))
+            del samples[:-self.size]
+            if self.cache:
+                self.cache.set(f"latency:{model_name}", samples)
+
+    def percentile(self, model_name: str, percent: float) -> Optional[float]:
+        """최근 응답 시간의 백분위 (기록 부족 시 None)"""
+        with self._lock:
+            samples = sorted(self._load(model_name))
+        if len(samples) < MIN_SAMPLES:
+            return None
+        index = min(len(samples) - 1, max(0, round(percent / 100 * len(samples)) - 1))
+        return samples[index]
+
+
+def _spawn(fn: Callable[..., Any], *args: Any) -> Future:
+    """데몬 스레드에서 fn 실행 → Future (인터프리터 종료 시 기다리지 않음)"""
+    future: Future = Future()
+    future.set_running_or_notify_cancel()
+
+    def run() -> None:
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name='gemini-hedge', daemon=True).start()
+    return future
+
+
+class ModelCascade:
+    """
+    기본 모델 → 대체 모델 순서의 헤지 요청
+
+    Args:
+        models: 모델명 목록 (첫 번째가 기본 모델)
+        get_model: 모델명 → GenerativeModel
+        history: 지연 기록
+        hedge_percentile: 다음 모델을 부를 대기 시간 (현재 모델 지연의 백분위)
+        default_hedge_seconds: 지연 기록이 부족할 때의 대기 시간
+        min_hedge_seconds: 대기 시간 하한 (짧은 기록으로 과도한 헤지 방지)
+        request_timeout: 요청 1건 타임아웃 (초)
+    """
+
+    def __init__(self, models: List[str], get_model: Callable[[str], Any], history: LatencyHistory,
+                 hedge_percentile: float = 90, default_hedge_seconds: float = 20,
+                 min_hedge_seconds: float = 3, request_timeout: float = 120):
+        self.models = models
+        self.get_model = get_model
+        self.history = history
+        self.hedge_percentile = hedge_percentile
+        self.default_hedge_seconds = default_hedge_seconds
+        self.min_hedge_seconds = min_hedge_seconds
+        self.request_timeout = request_timeout
+
+    def hedge_delay(self, model_name: str) -> float:
+        """model_name 요청 후 다음 모델을 부르기까지 대기 시간"""
+        observed = self.history.percentile(model_name, self.hedge_percentile)
+        delay = self.default_hedge_seconds if observed is None else observed
+        return min(max(delay, self.min_hedge_seconds), self.request_timeout)
+
+    def _call(self, model_name: str, prompt: str, generation_config: Dict, phase: str):
+        started = time.perf_counter()
+        with METRICS.timer('gemini_generate', model=model_name, phase=phase):
+            response = self.get_model(model_name).generate_content(
+                prompt,
+                generation_config=generation_config,
+                request_options={'timeout': self.request_timeout}
+            )
+        self.history.record(model_name, time.perf_counter() - started)
+        return response
+
+    def generate(self, prompt: str, generation_config: Dict, phase: str,
+                 accept: Callable[[Any], bool]) -> Tuple[str, Any]:
+        """
+        먼저 도착한 유효 응답 → (모델명, 응답)
+
+        실패/무효 응답이 오면 대기 없이 다음 모델을 부릅니다.
+        모든 응답이 무효면 마지막 응답을 반환하고 (호출 측 검증/재시도),
+        모두 실패하면 마지막 예외를 다시 발생시킵니다.
+        """
+        pending: Dict[Future, str] = {}
+        launched = 0
+        fallback: Optional[Tuple[str, Any]] = None
+        error: Optional[BaseException] = None
+
+        def launch() -> None:
+            nonlocal launched
+            model_name = self.models[launched]
+            if launched:
+                METRICS.inc('gemini_hedges', model=model_name, phase=phase)
+                logger.info(f"  🔀 헤지 요청: {model_name}")
+            pending[_spawn(self._call, model_name, prompt, generation_config, phase)] = model_name
+            launched += 1
+
+        launch()
+        while pending:
+            timeout = self.hedge_delay(self.models[launched - 1]) if launched < len(self.models) else None
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                launch()
+                continue
+
+            for future in done:
+                model_name = pending.pop(future)
+                try:
+                    response = future.result()
+                    valid = accept(response)
+                except Exception as e:
+                    logger.warning(f"  ⚠️ {model_name} 실패: {e}")
+                    error = e
+                    continue
+                if valid:
+                    METRICS.inc('gemini_served', model=model_name, phase=phase)
+                    if pending:
+                        logger.info(f"  ⚡ {model_name} 응답 사용 (나머지 요청 결과는 버림)")
+                    return model_name, response
+                logger.warning(f"  ⚠️ {model_name} 응답 무효")
+                fallback = (model_name, response)
+
+            # 실패/무효 → 남은 모델 즉시 호출
+            if launched < len(self.models):
+                launch()
+
+        if fallback:
+            METRICS.inc('gemini_served', model=fallback[0], phase=phase)
+            return fallback
+        raise error
@@ -6,16 +6,55 @@
 
 import os
 import sys
+import json
+import hashlib
+import multiprocessing
+import argparse
 import logging
 import time
+import re
 import random
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager, nullcontext
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-import feedparser
+from typing import TYPE_CHECKING, Callable, Iterable, List, Dict, Optional, Tuple
+from urllib.parse import urlparse
+from zoneinfo import ZoneInfo
 import requests
-import google.generativeai as genai
-import telegram
-from config_loader import load_config, validate_config
+from config_loader import ConfigLoader, validate_config
+from disk_cache import DiskCache
+from seen_store import SeenStore
+from dedup import cluster_articles
+from token_budget import TokenEstimator, load_estimator, save_estimator, fit_count
+from feed_parser import parse_feed_bytes, parse_feed_entries, parse_feed_stream
+from content_extract import extract_text, trim_to_tokens
+from ranking import rank_articles
+from prompt_codec import INSTRUCTION as LINK_ID_INSTRUCTION, PromptCodec, get_codec
+from model_cascade import LatencyHistory, ModelCascade
+from structured_digest import (
+    FOLLOWUP as STRUCTURED_FOLLOWUP, INSTRUCTION as STRUCTURED_INSTRUCTION,
+    parse_items, render_digest, response_schema,
+)
+from feed_scheduler import PollingPolicy, poll_decision, update_state, merge_entries
+from run_journal import RunJournal, encode_articles, decode_articles
+from digest_profiles import DEFAULT_PROFILE, build_profiles, union_feed_config, select_articles
+from telegram_render import render, split_message
+from metrics import METRICS, export as export_metrics
+from scheduler import build_schedules, next_run, now_in
+from shard_spool import (
+    ShardError, feeds_fingerprint, parse_shard, read_spools, remove_spools, resolve_run_id,
+    select_shard, write_spool,
+)
+
+# google.generativeai / telegram / feedparser는 임포트가 느리므로 (~1초)
+# 사용하는 단계에서 임포트 (--help, --check-config는 바로 종료)
+if TYPE_CHECKING:
+    import google.generativeai as genai
+    import telegram
+    from telegram_delivery import DeliveryQueue
 
 # ═══════════════════════════════════════════════════════════════
 # 로깅 설정
@@ -91,15 +130,58 @@ def validate_environment() -> Dict[str, str]:
     return env_vars
 
 # ═══════════════════════════════════════════════════════════════
-# 텔레그램 연결 검증
+# 텔레그램 / Gemini 연결 검증 (결과 캐시)
 # ═══════════════════════════════════════════════════════════════
 
-def validate_telegram(token: str, chat_id: str) -> telegram.Bot:
-    """텔레그램 설정 검증"""
+def get_credential_cache(config: Dict) -> Optional[DiskCache]:
+    """연결 검증 결과 캐시 (비활성화 시 None)"""
+    cache_config = config.get('cache', {})
+    hours = cache_config.get('credential_hours', 24)
+    if not cache_config.get('enabled', True) or not hours:
+        return None
+    
+    return DiskCache(
+        os.path.join(cache_config.get('directory', '.cache'), 'credentials'),
+        max_age_seconds=hours * 3600
+    )
+
+def credential_key(service: str, *secrets: str) -> str:
+    """검증 캐시 키 (캐시 파일에 키가 평문 저장되므로 해시만 사용)"""
+    digest = hashlib.sha256('\0'.join(secrets).encode('utf-8')).hexdigest()
+    return f"{service}:{digest}"
+
+def forget_credentials(config: Dict, env_vars: Dict[str, str]) -> None:
+    """검증 캐시 삭제 (실행 실패 시 다음 실행에서 다시 검증)"""
+    cache = get_credential_cache(config)
+    if cache:
+        cache.delete(credential_key('telegram', env_vars['TELEGRAM_BOT_TOKEN'], env_vars['TELEGRAM_CHAT_ID']))
+        cache.delete(credential_key('gemini', env_vars['GEMINI_API_KEY'],
+                                    config.get('ai', {}).get('model', 'gemini-2.5-flash')))
+
+def validate_telegram(token: str, chat_id: str, con_pool_size: int = 8,
+                      cache: Optional[DiskCache] = None) -> 'telegram.Bot':
+    """
+    텔레그램 설정 검증
+    
+    Args:
+        cache: 검증 결과 캐시 (유효 기간 내에는 get_me/get_chat 호출 생략)
+    """
+    import telegram
+    from telegram.utils.request import Request
+    
+    # 동시 발송 스레드 수만큼 연결 풀 확보
+    request = Request(con_pool_size=con_pool_size)
+    
+    key = credential_key('telegram', token, chat_id)
+    cached = cache.get(key) if cache else None
+    if cached:
+        logger.info(f"✅ 텔레그램 검증 생략 (캐시): @{cached['username']}, {cached['chat_type']}")
+        return telegram.Bot(token=token, request=request)
+    
     logger.info("🔍 텔레그램 연결 검증 중...")
     
     try:
-        bot = telegram.Bot(token=token)
+        bot = telegram.Bot(token=token, request=request)
         
         # 봇 정보 확인
         bot_info = bot.get_me()
@@ -116,6 +198,8 @@ def validate_telegram(token: str, chat_id: str) -> telegram.Bot:
             logger.error("  - 그룹: @getmyid_bot 사용")
             sys.exit(1)
         
+        if cache:
+            cache.set(key, {'username': bot_info.username, 'chat_type': chat.type})
         logger.info("✅ 텔레그램 검증 완료")
         return bot
         
@@ -127,61 +211,484 @@ def validate_telegram(token: str, chat_id: str) -> telegram.Bot:
         logger.error(f"❌ 텔레그램 검증 실패: {e}")
         sys.exit(1)
 
+def validate_gemini(api_key: str, model_name: str, cache: Optional[DiskCache] = None) -> None:
+    """
+    Gemini API 키 / 모델명 검증 (결과 캐시)
+    
+    캐시가 유효하면 google.generativeai 임포트도 요약 단계까지 미룹니다.
+    네트워크 오류는 경고만 남기고 계속 진행합니다.
+    """
+    key = credential_key('gemini', api_key, model_name)
+    if cache and cache.get(key):
+        logger.info(f"✅ Gemini 검증 생략 (캐시): {model_name}")
+        return
+    
+    logger.info("🔍 Gemini 연결 검증 중...")
+    import google.generativeai as genai
+    from google.api_core import exceptions as google_exceptions
+    
+    try:
+        genai.configure(api_key=api_key)
+        genai.get_model(model_name if model_name.startswith('models/') else f"models/{model_name}")
+    except (google_exceptions.PermissionDenied, google_exceptions.Unauthenticated,
+            google_exceptions.InvalidArgument) as e:
+        logger.error(f"❌ Gemini API 키가 잘못되었습니다: {e}")
+        sys.exit(1)
+    except google_exceptions.NotFound:
+        logger.error(f"❌ Gemini 모델을 찾을 수 없습니다: {model_name}")
+        sys.exit(1)
+    except Exception as e:
+        logger.warning(f"⚠️ Gemini 검증 실패, 계속 진행: {e}")
+        return
+    
+    if cache:
+        cache.set(key, True)
+    logger.info(f"✅ Gemini 검증 완료: {model_name}")
+
+# ═══════════════════════════════════════════════════════════════
+# HTTP 세션 + 동시성 제한 (전역 / 호스트별)
+# ═══════════════════════════════════════════════════════════════
+
+_session_lock = threading.Lock()
+_http_session: Optional[requests.Session] = None
+
+def get_http_session(config: Dict) -> requests.Session:
+    """공유 HTTP 세션 반환 (커넥션 풀 재사용)"""
+    global _http_session
+    
+    with _session_lock:
+        if _http_session is None:
+            pool_size = config.get('collection', {}).get('max_concurrent_feeds', 8)
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=pool_size,
+                pool_maxsize=pool_size
+            )
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _http_session = session
+        return _http_session
+
+class HostLimiter:
+    """전역 + 호스트별 동시 요청 수 제한"""
+    
+    def __init__(self, max_total: int = 8, max_per_host: int = 2):
+        self._global = threading.BoundedSemaphore(max(1, max_total))
+        self._max_per_host = max(1, max_per_host)
+        self._hosts: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_config(cls, config: Dict) -> 'HostLimiter':
+        """설정에서 제한값 로드"""
+        collection_config = config.get('collection', {})
+        return cls(
+            max_total=collection_config.get('max_concurrent_feeds', 8),
+            max_per_host=collection_config.get('max_per_host', 2)
+        )
+    
+    def _host_semaphore(self, url: str) -> threading.BoundedSemaphore:
+        host = (urlparse(url).hostname or '').lower()
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = threading.BoundedSemaphore(self._max_per_host)
+            return self._hosts[host]
+    
+    @contextmanager
+    def slot(self, url: str):
+        """요청 1건 동안 전역/호스트 슬롯 점유 (대기 중에는 점유하지 않음)"""
+        host_semaphore = self._host_semaphore(url)
+        with host_semaphore:
+            with self._global:
+                yield
+
 # ═══════════════════════════════════════════════════════════════
 # RSS 수집 (재시도 로직 + User-Agent 로테이션)
 # ═══════════════════════════════════════════════════════════════
 
-def fetch_rss_with_retry(url: str, config: Dict) -> Optional[str]:
-    """재시도 로직이 있는 RSS 수집"""
+def _retry_after_seconds(response: requests.Response, default: float = 60) -> float:
+    """Retry-After 헤더 해석 (초 단위만 지원, 최대 default)"""
+    value = response.headers.get('Retry-After', '')
+    try:
+        return min(max(float(value), 0), default)
+    except ValueError:
+        return default
+
+def request_feed(url: str, config: Dict,
+                 session: Optional[requests.Session] = None,
+                 limiter: Optional[HostLimiter] = None,
+                 extra_headers: Optional[Dict[str, str]] = None,
+                 stream: bool = False, name: Optional[str] = None) -> Optional[requests.Response]:
+    """재시도 로직이 있는 RSS 요청 (200 또는 304 응답 반환, 지표는 name 또는 url로 기록)"""
     collection_config = config.get('collection', {})
     timeout = collection_config.get('request_timeout', 10)
     max_retries = collection_config.get('max_retries', 3)
     rotate_ua = collection_config.get('rotate_user_agent', True)
+    http = session or requests
     
+    metric_name = name or url
     for attempt in range(max_retries):
+        METRICS.feed(metric_name, attempts=1)
         try:
             # User-Agent 로테이션
-            headers = {}
+            headers = dict(extra_headers or {})
             if rotate_ua:
                 headers['User-Agent'] = get_random_user_agent()
             
             logger.debug(f"RSS 수집 시도 {attempt+1}/{max_retries}: {url}")
             
-            response = requests.get(
-                url,
-                timeout=timeout,
-                headers=headers
-            )
+            # 슬롯은 요청 중에만 점유 → 백오프 대기가 다른 피드를 막지 않음
+            with (limiter.slot(url) if limiter else nullcontext()), \
+                    METRICS.timer('feed_request'):
+                response = http.get(
+                    url,
+                    timeout=timeout,
+                    headers=headers,
+                    stream=stream
+                )
+            METRICS.inc('feed_http_responses', status=response.status_code)
+            METRICS.feed(metric_name, status=str(response.status_code))
             
-            # 상태 코드별 처리
-            if response.status_code == 403:
+            # 상태 코드별 처리 (stream=True면 본문을 읽지 않는 응답은 직접 닫아 연결 반환)
+            if response.status_code == 304:
+                logger.debug(f"♻️ 변경 없음 (304): {url}")
+                return response  # 헤더만 사용, 호출 측에서 닫음
+            elif response.status_code == 403:
                 logger.warning(f"🚫 차단됨 (403): {url}")
+                response.close()
                 return None  # 즉시 포기
             elif response.status_code == 429:
                 logger.warning(f"⏱️ Rate Limit (429): {url}")
                 if attempt < max_retries - 1:
-                    time.sleep(60)  # 1분 대기
+                    delay = _retry_after_seconds(response)
+                    response.close()
+                    time.sleep(delay)  # 기본 1분 대기
                     continue
             
-            response.raise_for_status()
+            try:
+                response.raise_for_status()
+            except requests.HTTPError:
+                response.close()
+                raise
             logger.debug(f"✅ RSS 수집 성공: {url}")
-            return response.text
+            return response
             
         except requests.Timeout:
+            METRICS.inc('feed_http_errors', kind='timeout')
+            METRICS.feed(metric_name, status='timeout')
             logger.warning(f"⏱️ 타임아웃 ({attempt+1}/{max_retries}): {url}")
             if attempt < max_retries - 1:
                 time.sleep(2 ** attempt)  # 지수 백오프
                 
         except requests.RequestException as e:
+            METRICS.inc('feed_http_errors', kind=type(e).__name__)
+            METRICS.feed(metric_name, status='error')
             logger.error(f"❌ RSS 수집 실패: {url} - {e}")
             if attempt == max_retries - 1:
                 return None
     
     return None
 
-def fetch_all_rss(config: Dict) -> List[Dict]:
-    """모든 RSS 피드 수집"""
-    logger.info("📰 RSS 피드 수집 시작...")
+def fetch_rss_with_retry(url: str, config: Dict,
+                         session: Optional[requests.Session] = None,
+                         limiter: Optional[HostLimiter] = None) -> Optional[str]:
+    """재시도 로직이 있는 RSS 수집"""
+    response = request_feed(url, config, session, limiter)
+    if response is None or response.status_code == 304:
+        return None
+    return response.text
+
+# ═══════════════════════════════════════════════════════════════
+# 피드 캐시 (ETag / Last-Modified 조건부 요청)
+# ═══════════════════════════════════════════════════════════════
+
+def get_feed_cache(config: Dict) -> Optional[DiskCache]:
+    """피드 캐시 생성 (비활성화 시 None)"""
+    cache_config = config.get('cache', {})
+    feed_config = cache_config.get('feeds', {})
+    
+    if not cache_config.get('enabled', True) or not feed_config.get('enabled', True):
+        return None
+    
+    return DiskCache(
+        os.path.join(cache_config.get('directory', '.cache'), 'feeds'),
+        max_age_seconds=feed_config.get('max_age_hours', 72) * 3600,
+        max_bytes=int(feed_config.get('max_size_mb', 50) * 1024 * 1024)
+    )
+
+def _records_to_cache(records: List[Dict]) -> List[Dict]:
+    return [
+        {**r, 'published': r['published'].isoformat() if r['published'] else None}
+        for r in records
+    ]
+
+def _records_from_cache(records: List[Dict]) -> List[Dict]:
+    return [
+        {**r, 'published': datetime.fromisoformat(r['published']) if r['published'] else None}
+        for r in records
+    ]
+
+# ═══════════════════════════════════════════════════════════════
+# 파싱 프로세스 풀 (CPU 작업을 다운로드와 병렬로)
+# ═══════════════════════════════════════════════════════════════
+
+_parse_pool_lock = threading.Lock()
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+def _available_cores() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+def get_parse_pool(config: Dict) -> Optional[ProcessPoolExecutor]:
+    """
+    피드 파싱 프로세스 풀 (collection.parse_workers, 0이면 None)
+    
+    프로세스 수명 동안 1개를 재사용합니다 (데몬 모드에서도 재시작 비용 없음).
+    수집 스레드가 있는 상태에서 fork하지 않도록 spawn으로 시작합니다.
+    """
+    global _parse_pool
+    workers = config.get('collection', {}).get('parse_workers', 0)
+    if workers == 'auto':
+        workers = _available_cores()
+    if not workers:
+        return None
+    
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            logger.debug(f"파싱 프로세스 {workers}개 시작")
+        return _parse_pool
+
+# 항목 닫는 태그 (RSS </item>, Atom </entry>, 네임스페이스 접두어 포함)
+_ENTRY_END_RE = re.compile(rb'</(?:[\w.-]+:)?(?:item|entry)\s*>')
+
+def _read_body(response: requests.Response, name: str, max_bytes: int,
+               max_entries: Optional[int] = None) -> bytes:
+    """
+    본문을 max_bytes까지 읽고 연결 종료
+    
+    max_entries개 항목이 닫히면 더 받지 않습니다 (스트리밍 파서와 같은 조기 중단).
+    """
+    received = []
+    size = 0
+    entries = 0
+    tail = b''
+    try:
+        for chunk in _counted(response.iter_content(chunk_size=64 * 1024), name):
+            received.append(chunk)
+            size += len(chunk)
+            if size >= max_bytes:
+                break
+            if max_entries:
+                # 조각 경계에 걸친 태그도 세고, 이전 꼬리 안에서 끝난 태그는 중복 제외
+                window = tail + chunk
+                entries += sum(1 for m in _ENTRY_END_RE.finditer(window) if m.end() > len(tail))
+                if entries >= max_entries:
+                    break
+                tail = window[-64:]
+    finally:
+        response.close()
+    return b''.join(received)[:max_bytes]
+
+def parse_in_pool(pool: ProcessPoolExecutor, content: bytes, max_entries: int,
+                  cutoff_time: datetime, max_bytes: int, meta: Dict) -> List[Dict]:
+    """프로세스 풀에서 파싱 (풀이 망가지면 현재 스레드에서 파싱)"""
+    try:
+        records, channel_meta = pool.submit(
+            parse_feed_bytes, content, max_entries, cutoff_time, max_bytes
+        ).result()
+    except BrokenProcessPool as e:
+        logger.warning(f"⚠️ 파싱 프로세스 오류, 현재 프로세스에서 파싱: {e}")
+        records, channel_meta = parse_feed_bytes(content, max_entries, cutoff_time, max_bytes)
+    meta.update(channel_meta)
+    return records
+
+def _counted(chunks: Iterable[bytes], name: str) -> Iterable[bytes]:
+    """다운로드 바이트 수 기록"""
+    for chunk in chunks:
+        METRICS.feed(name, bytes=len(chunk))
+        yield chunk
+
+def collect_feed(feed: Dict, config: Dict, cutoff_time: datetime,
+                 session: Optional[requests.Session] = None,
+                 limiter: Optional[HostLimiter] = None,
+                 feed_cache: Optional[DiskCache] = None,
+                 background: bool = False) -> List[Dict]:
+    """
+    단일 피드 수집 + 파싱 + 시간 필터링 (피드별 소요 시간 기록)
+    
+    Args:
+        background: 다이제스트 사이 폴링 (바쁜 피드만 요청해 캐시에 누적)
+    """
+    started = time.perf_counter()
+    try:
+        return _collect_feed(feed, config, cutoff_time, session, limiter, feed_cache, background)
+    finally:
+        METRICS.feed(feed.get('name'), seconds=round(time.perf_counter() - started, 4))
+
+def _recent_articles(name: str, records: List[Dict], cutoff_time: datetime) -> List[Dict]:
+    """시간 필터링 + 기사 dict 변환"""
+    recent_articles = []
+    for record in records:
+        pub_datetime = record['published']
+        if pub_datetime and pub_datetime >= cutoff_time:
+            recent_articles.append({
+                'source': name,
+                'title': record['title'],
+                'link': record['link'],
+                'guid': record.get('id', ''),
+                'published': pub_datetime
+            })
+    return recent_articles
+
+def _collect_feed(feed: Dict, config: Dict, cutoff_time: datetime,
+                  session: Optional[requests.Session],
+                  limiter: Optional[HostLimiter],
+                  feed_cache: Optional[DiskCache],
+                  background: bool = False) -> List[Dict]:
+    name = feed.get('name')
+    url = feed.get('url')
+    collection_config = config.get('collection', {})
+    max_per_source = collection_config.get('max_articles_per_source', 20)
+    policy = PollingPolicy(config)
+    polling = policy.enabled and feed_cache is not None
+    
+    # 캐시된 검증자로 조건부 요청 (max_per_source가 바뀌면 캐시 무시)
+    cached = feed_cache.get(url) if feed_cache else None
+    if cached and cached.get('max_entries') != max_per_source:
+        cached = None
+    
+    # 적응형 폴링: 새 기사 가능성이 낮으면 캐시된 기사 사용
+    now = time.time()
+    poll_state = cached.get('poll') if cached else None
+    if polling:
+        due, reason = poll_decision(poll_state, now, max_per_source, policy, background)
+        METRICS.inc('feed_polls', decision='fetch' if due else 'skip', reason=reason)
+        if not due:
+            if background or not cached:
+                return []
+            METRICS.feed(name, cache='skipped')
+            logger.info(f"  💤 {name}: 요청 생략 ({reason}), 캐시된 기사 사용")
+            return _recent_articles(name, _records_from_cache(cached['entries']), cutoff_time)
+    elif background:
+        return []
+    
+    logger.info(f"  📡 {name} 수집 중...")
+    
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+    
+    # RSS 수집 (파싱 풀이 있으면 본문을 받아 풀에서 파싱)
+    parse_pool = get_parse_pool(config)
+    streaming = collection_config.get('streaming_parser', True) or parse_pool is not None
+    response = request_feed(url, config, session, limiter, headers, stream=streaming, name=name)
+    if response is not None and response.status_code == 304:
+        response.close()  # 본문 없음, 헤더는 닫은 뒤에도 사용 가능
+    if response is None or (response.status_code == 304 and not cached):
+        logger.warning(f"  ⚠️ {name}: 수집 실패")
+        return []
+    
+    # 파싱 (304면 캐시된 레코드 재사용)
+    meta = {}
+    try:
+        if response.status_code == 304:
+            fresh = []
+            records = _records_from_cache(cached['entries'])
+            METRICS.feed(name, cache='hit')
+            logger.debug(f"  ♻️ {name}: 캐시 사용")
+        elif parse_pool is not None:
+            # 다운로드는 수집 스레드, 파싱은 프로세스 풀 (다른 피드 다운로드와 동시 진행)
+            max_bytes = int(collection_config.get('max_feed_size_mb', 5) * 1024 * 1024)
+            with limiter.slot(url) if limiter else nullcontext():
+                content = _read_body(response, name, max_bytes, max_per_source)
+            with METRICS.timer('feed_parse'):
+                fresh = records = parse_in_pool(parse_pool, content, max_per_source,
+                                                cutoff_time, max_bytes, meta)
+            del content
+        elif streaming:
+            # 필요한 만큼만 읽고 연결 종료 (피드 크기와 무관한 메모리/시간)
+            max_bytes = int(collection_config.get('max_feed_size_mb', 5) * 1024 * 1024)
+            with (limiter.slot(url) if limiter else nullcontext()), METRICS.timer('feed_parse'):
+                try:
+                    fresh = records = parse_feed_stream(
+                        _counted(response.iter_content(chunk_size=16 * 1024), name),
+                        max_per_source,
+                        cutoff_time,
+                        max_bytes,
+                        meta
+                    )
+                finally:
+                    response.close()
+        else:
+            METRICS.feed(name, bytes=len(response.content))
+            with METRICS.timer('feed_parse'):
+                fresh = records = parse_feed_entries(response.content, max_per_source, meta)
+        
+        if polling:
+            # 이전 수집분과 누적 (바쁜 피드가 max_per_source에 잘리지 않도록)
+            if cached and fresh:
+                records = merge_entries(_records_from_cache(cached['entries']), fresh,
+                                        cutoff_time, policy.max_accumulated)
+            poll_state = update_state(poll_state, fresh, response.headers, meta, now)
+        
+        # 검증자가 있으면 다음 실행의 조건부 요청용으로 저장 (폴링 시 상태도 저장)
+        validators = response.headers.get('ETag') or response.headers.get('Last-Modified')
+        if feed_cache and (polling or (response.status_code != 304 and validators)):
+            feed_cache.set(url, {
+                'etag': response.headers.get('ETag') or (cached or {}).get('etag'),
+                'last_modified': response.headers.get('Last-Modified') or (cached or {}).get('last_modified'),
+                'max_entries': max_per_source,
+                'entries': _records_to_cache(records),
+                'poll': poll_state
+            })
+        
+        if background:
+            logger.info(f"  🔄 {name}: 백그라운드 수집 {len(fresh)}개 (누적 {len(records)}개)")
+            return []
+        
+        # 시간 필터링
+        recent_articles = _recent_articles(name, records, cutoff_time)
+        
+        METRICS.feed(name, entries=len(records), kept=len(recent_articles),
+                     dropped_old=len(records) - len(recent_articles))
+        logger.info(f"  ✅ {name}: {len(recent_articles)}개 수집")
+        return recent_articles
+        
+    except Exception as e:
+        METRICS.feed(name, status='parse_error')
+        logger.error(f"  ❌ {name}: 파싱 실패 - {e}")
+        return []
+
+def limit_articles(articles: List[Dict], max_total: int) -> List[Dict]:
+    """전체 개수 제한 (초과 시 최신순)"""
+    if len(articles) > max_total:
+        articles = sorted(articles, key=lambda x: x['published'], reverse=True)
+        articles = articles[:max_total]
+    return articles
+
+def fetch_all_rss(config: Dict, seen_store: Optional[SeenStore] = None,
+                  limit_total: bool = True, background: bool = False) -> List[Dict]:
+    """
+    모든 RSS 피드 수집
+    
+    Args:
+        seen_store: 있으면 이미 발송된 기사 제외
+        limit_total: False면 max_total_articles 제한 생략 (다이제스트별로 적용)
+        background: 다이제스트 사이 폴링 (바쁜 피드만 캐시에 누적, 빈 목록 반환)
+    """
+    if background:
+        logger.debug("🔄 백그라운드 폴링...")
+    else:
+        logger.info("📰 RSS 피드 수집 시작...")
     
     feeds = config.get('rss_feeds', [])
     enabled_feeds = [f for f in feeds if f.get('enabled', False)]
@@ -190,119 +697,620 @@ def fetch_all_rss(config: Dict) -> List[Dict]:
         logger.warning("⚠️ 활성화된 RSS 피드가 없습니다")
         return []
     
-    logger.info(f"📡 {len(enabled_feeds)}개 소스에서 수집 중...")
+    if not background:
+        logger.info(f"📡 {len(enabled_feeds)}개 소스에서 수집 중...")
+    
+    per_feed = collect_feeds(config, enabled_feeds, background)
+    if background:
+        return []
     
+    # 피드 순서대로 병합 (결정적 순서 유지)
     all_articles = []
+    for recent_articles in per_feed:
+        all_articles.extend(recent_articles)
+    
+    # 이전 다이제스트에 포함된 기사 제외
+    if seen_store:
+        before = len(all_articles)
+        all_articles = seen_store.filter_new(all_articles)
+        logger.info(f"  ♻️ 이미 발송된 기사 {before - len(all_articles)}개 제외")
+    
+    # 전체 개수 제한
+    if limit_total:
+        max_total = config.get('collection', {}).get('max_total_articles', 60)
+        all_articles = limit_articles(all_articles, max_total)
+    
+    logger.info(f"✅ 총 {len(all_articles)}개 기사 수집 완료")
+    return all_articles
+
+def collect_feeds(config: Dict, enabled_feeds: List[Dict], background: bool = False) -> List[List[Dict]]:
+    """피드 목록 수집 → 피드별 기사 목록 (입력 순서 유지)"""
     collection_config = config.get('collection', {})
-    max_per_source = collection_config.get('max_articles_per_source', 20)
-    max_total = collection_config.get('max_total_articles', 60)
     hours_threshold = collection_config.get('hours_threshold', 24)
+    concurrent = collection_config.get('concurrent_fetch', True)
     
     cutoff_time = datetime.now() - timedelta(hours=hours_threshold)
+    feed_cache = get_feed_cache(config)
     
-    for feed in enabled_feeds:
-        name = feed.get('name')
-        url = feed.get('url')
-        
-        logger.info(f"  📡 {name} 수집 중...")
+    if concurrent and len(enabled_feeds) > 1:
+        # 동시 수집: 소요 시간 ≈ 가장 느린 피드
+        session = get_http_session(config)
+        limiter = HostLimiter.from_config(config)
+        # 스레드는 넉넉히 (백오프 대기용), 실제 요청 수는 limiter가 제한
+        max_workers = min(len(enabled_feeds), 4 * collection_config.get('max_concurrent_feeds', 8))
+        with ThreadPoolExecutor(max_workers=max_workers,
+                                thread_name_prefix='rss') as executor:
+            per_feed = list(executor.map(
+                lambda f: collect_feed(f, config, cutoff_time, session, limiter, feed_cache, background),
+                enabled_feeds
+            ))
+    else:
+        per_feed = [collect_feed(f, config, cutoff_time, feed_cache=feed_cache, background=background)
+                    for f in enabled_feeds]
+    
+    if feed_cache:
+        feed_cache.evict()
+    return per_feed
+
+# ═══════════════════════════════════════════════════════════════
+# 분산 수집 (--shard i/N → 스풀 → --merge)
+# ═══════════════════════════════════════════════════════════════
+
+def _spool_dir(config: Dict) -> str:
+    return config.get('collection', {}).get('spool_dir', '.spool')
+
+def _spool_max_age(config: Dict) -> float:
+    """수집 기간보다 오래된 스풀은 다른 실행의 잔재로 간주"""
+    return config.get('collection', {}).get('hours_threshold', 24) * 3600
+
+def collect_shard(config: Dict, index: int, count: int, run_id: str) -> bool:
+    """샤드에 배정된 피드만 수집해 스풀 파일로 저장 (요약/발송 없음)"""
+    METRICS.reset()
+    success = False
+    try:
+        profiles = build_profiles(config, os.environ.get('TELEGRAM_CHAT_ID', ''))
+        feeds = union_feed_config(config, profiles).get('rss_feeds', [])
+        enabled_feeds = [f for f in feeds if f.get('enabled', False)]
+        shard_feeds = select_shard(enabled_feeds, index, count)
+        logger.info(f"🧩 샤드 {index}/{count}: 피드 {len(shard_feeds)}/{len(enabled_feeds)}개 수집")
         
-        # RSS 수집
-        content = fetch_rss_with_retry(url, config)
-        if not content:
-            logger.warning(f"  ⚠️ {name}: 수집 실패")
-            continue
+        with METRICS.timer('stage', stage='collect'):
+            per_feed = collect_feeds(config, shard_feeds) if shard_feeds else []
         
-        # 파싱
-        try:
-            parsed = feedparser.parse(content)
-            entries = parsed.entries[:max_per_source]
-            
-            # 시간 필터링
-            recent_articles = []
-            for entry in entries:
-                pub_date = entry.get('published_parsed')
-                if pub_date:
-                    pub_datetime = datetime(*pub_date[:6])
-                    if pub_datetime >= cutoff_time:
-                        recent_articles.append({
-                            'source': name,
-                            'title': entry.get('title', '제목 없음'),
-                            'link': entry.get('link', ''),
-                            'published': pub_datetime
-                        })
-            
-            all_articles.extend(recent_articles)
-            logger.info(f"  ✅ {name}: {len(recent_articles)}개 수집")
-            
-        except Exception as e:
-            logger.error(f"  ❌ {name}: 파싱 실패 - {e}")
+        path = write_spool(
+            _spool_dir(config), run_id, index, count, feeds_fingerprint(feeds),
+            {f['name']: articles for f, articles in zip(shard_feeds, per_feed)}
+        )
+        total = sum(len(articles) for articles in per_feed)
+        logger.info(f"✅ 샤드 {index}/{count}: 기사 {total}개 → {path}")
+        success = True
+        return True
+    finally:
+        export_metrics(config, success=success, shard=f"{index}/{count}")
+
+def load_spooled_articles(config: Dict, run_id: str) -> List[Dict]:
+    """실행 1회의 샤드 스풀 병합 → 단일 프로세스 수집과 같은 순서의 기사 목록"""
+    feeds = config.get('rss_feeds', [])
+    per_feed = read_spools(_spool_dir(config), run_id, feeds_fingerprint(feeds), _spool_max_age(config))
     
-    # 전체 개수 제한
-    if len(all_articles) > max_total:
-        all_articles = sorted(all_articles, key=lambda x: x['published'], reverse=True)
-        all_articles = all_articles[:max_total]
+    all_articles = []
+    for feed in feeds:
+        if feed.get('enabled', False):
+            all_articles.extend(per_feed.get(feed.get('name'), []))
     
-    logger.info(f"✅ 총 {len(all_articles)}개 기사 수집 완료")
+    logger.info(f"✅ 총 {len(all_articles)}개 기사 병합 완료")
     return all_articles
 
 # ═══════════════════════════════════════════════════════════════
-# Gemini AI 요약 (토큰 카운팅 + 스마트 자르기)
+# 기사 본문 보강 (선택, 동시 수집 + 본문 캐시)
 # ═══════════════════════════════════════════════════════════════
 
-def count_tokens(model, text: str) -> int:
-    """토큰 수 계산"""
+def get_content_cache(config: Dict) -> Optional[DiskCache]:
+    """기사 본문 캐시 (URL별, 비활성화 시 None)"""
+    cache_config = config.get('cache', {})
+    if not cache_config.get('enabled', True):
+        return None
+    
+    content_config = config.get('content', {})
+    return DiskCache(
+        os.path.join(cache_config.get('directory', '.cache'), 'content'),
+        max_age_seconds=content_config.get('cache_days', 30) * 86400,
+        max_bytes=int(content_config.get('cache_size_mb', 50) * 1024 * 1024)
+    )
+
+def fetch_article_text(url: str, config: Dict, session: requests.Session,
+                       limiter: HostLimiter) -> Optional[str]:
+    """
+    기사 페이지 → 본문 텍스트 (용량/시간 상한까지만 읽음)
+    
+    Returns:
+        본문 ('' = 본문 없음/영구 오류), None = 일시 오류 (캐시하지 않음)
+    """
+    content_config = config.get('content', {})
+    timeout = content_config.get('page_timeout', 5)
+    max_bytes = int(content_config.get('max_page_kb', 512) * 1024)
+    
+    received = []
     try:
-        result = model.count_tokens(text)
-        return result.total_tokens
-    except:
-        # 대략적 계산 (영어: 4자/토큰, 한국어: 2자/토큰)
-        return len(text) // 3
+        with limiter.slot(url), METRICS.timer('content_request'):
+            deadline = time.monotonic() + timeout
+            response = session.get(url, timeout=timeout, stream=True,
+                                   headers={'User-Agent': get_random_user_agent()})
+            try:
+                if response.status_code >= 500 or response.status_code == 429:
+                    return None
+                if response.status_code >= 400:
+                    return ''
+                if 'html' not in response.headers.get('Content-Type', 'text/html'):
+                    return ''
+                
+                size = 0
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    received.append(chunk)
+                    size += len(chunk)
+                    if size >= max_bytes or time.monotonic() > deadline:
+                        break
+            finally:
+                response.close()
+    except requests.RequestException as e:
+        logger.debug(f"본문 요청 실패: {url} - {e}")
+        return None
+    
+    with METRICS.timer('content_extract'):
+        return extract_text(b''.join(received)[:max_bytes])
 
-def smart_truncate_articles(model, articles: List[Dict], config: Dict, max_tokens: int = 30000) -> List[Dict]:
-    """토큰 제한 내로 기사 수 조정"""
+def enrich_articles(articles: List[Dict], config: Dict) -> List[Dict]:
+    """
+    앞쪽 max_articles개 기사에 본문 추가 ('content', 기사별 토큰 예산 이내)
+    
+    본문은 URL별로 캐시되어 같은 기사는 실행 간 한 번만 요청합니다.
+    """
+    content_config = config.get('content', {})
+    if not content_config.get('enabled', False) or not articles:
+        return articles
+    
+    max_articles = content_config.get('max_articles', 60)
+    max_tokens = content_config.get('max_tokens_per_article', 200)
+    targets = articles[:max_articles]
+    
+    cache = get_content_cache(config)
+    session = get_http_session(config)
+    limiter = HostLimiter(
+        max_total=content_config.get('max_concurrent', 8),
+        max_per_host=config.get('collection', {}).get('max_per_host', 2)
+    )
+    model_name = config.get('ai', {}).get('model', 'gemini-2.5-flash')
+    estimator, _ = load_estimator(get_token_cache(config), model_name)
+    
+    def enrich(article: Dict) -> Dict:
+        url = article.get('link')
+        if not url:
+            return article
+        text = cache.get(url) if cache else None
+        if text is None:
+            text = fetch_article_text(url, config, session, limiter)
+            METRICS.inc('content_pages', result='failed' if text is None else 'fetched')
+            if text is None:
+                return article
+            if cache:
+                cache.set(url, text)
+        else:
+            METRICS.inc('content_pages', result='cached')
+        if not text:
+            return article
+        return {**article, 'content': trim_to_tokens(text, max_tokens, estimator)}
+    
+    logger.info(f"📄 기사 본문 수집 중... ({len(targets)}개)")
+    # 스레드는 넉넉히, 실제 요청 수는 limiter가 제한
+    with ThreadPoolExecutor(max_workers=min(len(targets), 4 * content_config.get('max_concurrent', 8)),
+                            thread_name_prefix='content') as executor:
+        enriched = list(executor.map(enrich, targets))
+    
+    if cache:
+        cache.evict()
+    
+    with_content = sum(1 for a in enriched if a.get('content'))
+    logger.info(f"✅ 본문 추가: {with_content}/{len(targets)}개")
+    return enriched + articles[max_articles:]
+
+# ═══════════════════════════════════════════════════════════════
+# 유사 기사 병합 (MinHash + LSH)
+# ═══════════════════════════════════════════════════════════════
+
+def dedupe_articles(articles: List[Dict], config: Dict) -> List[Dict]:
+    """같은 기사를 보도한 여러 매체를 대표 기사 1개로 병합"""
+    dedup_config = config.get('dedup', {})
+    if not dedup_config.get('enabled', True) or len(articles) < 2:
+        return articles
+    
+    priorities = {
+        f.get('name'): f.get('priority', 999)
+        for f in config.get('rss_feeds', [])
+    }
+    merged, removed = cluster_articles(
+        articles,
+        threshold=dedup_config.get('similarity_threshold', 0.5),
+        num_perm=dedup_config.get('num_perm', 64),
+        priorities=priorities
+    )
+    
+    if removed:
+        saved_tokens = sum(estimate_tokens(format_article_line(a)) for a in removed)
+        logger.info(f"🔗 유사 기사 병합: {len(articles)}개 → {len(merged)}개 "
+                    f"(약 {saved_tokens:,} 토큰 절약)")
+    return merged
+
+# ═══════════════════════════════════════════════════════════════
+# Gemini AI 요약 (토큰 카운팅 + 스마트 자르기)
+# ═══════════════════════════════════════════════════════════════
+
+def format_article_line(article: Dict, ref: Optional[str] = None) -> str:
+    """프롬프트용 기사 1건 포맷 (ref가 있으면 링크 대신 기사 ID, ''이면 링크 생략)"""
+    if ref is None:
+        line = f"[{article['source']}] {article['title']}\n링크: {article['link']}"
+    elif ref:
+        line = f"[{ref}] [{article['source']}] {article['title']}"
+    else:
+        line = f"[{article['source']}] {article['title']}"
+    if article.get('content'):
+        line += f"\n내용: {article['content']}"
+    if article.get('alt_sources'):
+        line += f"\n동일 보도: {', '.join(article['alt_sources'])}"
+    return line
+
+def format_articles_text(articles: List[Dict], codec: Optional[PromptCodec] = None,
+                         instruction: bool = True) -> str:
+    """프롬프트 {articles_text} (코덱이 있으면 링크 대신 기사 ID + 안내)"""
+    if codec is None:
+        return "\n\n".join(format_article_line(a) for a in articles)
+    lines = [format_article_line(a, ref) for ref, a in zip(codec.ids(), articles)]
+    return "\n\n".join(([LINK_ID_INSTRUCTION] if instruction else []) + lines)
+
+def structured_output_enabled(config: Dict) -> bool:
+    return config.get('ai', {}).get('structured_output', {}).get('enabled', False)
+
+def build_summary_prompt(articles: List[Dict], config: Dict, codec: Optional[PromptCodec]) -> str:
+    """최종 요약 프롬프트 (구조화 출력이면 prompts.structured + JSON 형식 안내)"""
     ai_config = config.get('ai', {})
     prompts = config.get('prompts', {})
+    structured = structured_output_enabled(config)
     
-    # 프롬프트 준비
-    prompt_template = prompts.get('summary', '')
-    summary_count = ai_config.get('summary_count', 10)
-    hours_threshold = config.get('collection', {}).get('hours_threshold', 24)
-    language = ai_config.get('language', 'ko')
+    prompt_template = prompts.get('structured' if structured else 'summary', '')
+    prompt = prompt_template.format(
+        summary_count=ai_config.get('summary_count', 10),
+        hours_threshold=config.get('collection', {}).get('hours_threshold', 24),
+        language=ai_config.get('language', 'ko'),
+        articles_text=format_articles_text(articles, codec, instruction=not structured)
+    )
+    return prompt + STRUCTURED_INSTRUCTION if structured else prompt
+
+def estimate_tokens(text: str) -> int:
+    """로컬 토큰 수 추정 (보정 전 기본 비율)"""
+    return TokenEstimator().estimate(text)
+
+def get_token_cache(config: Dict) -> Optional[DiskCache]:
+    """토큰 보정값 캐시 (비활성화 시 None)"""
+    cache_config = config.get('cache', {})
+    if not cache_config.get('enabled', True):
+        return None
+    
+    return DiskCache(
+        os.path.join(cache_config.get('directory', '.cache'), 'tokens'),
+        max_age_seconds=cache_config.get('token_calibration_days', 7) * 86400
+    )
+
+def smart_truncate_articles(model, articles: List[Dict], config: Dict, max_tokens: int = 30000) -> List[Dict]:
+    """토큰 제한 내로 기사 수 조정 (원격 호출 최대 1회)"""
+    model_name = config.get('ai', {}).get('model', 'gemini-2.5-flash')
     
-    # 기사 텍스트 포맷팅
+    # 기사 텍스트 포맷팅 (summarize_with_gemini와 같은 형식)
     def format_articles(arts):
-        articles_text = "\n\n".join([
-            f"[{a['source']}] {a['title']}\n링크: {a['link']}"
-            for a in arts
-        ])
-        return prompt_template.format(
-            summary_count=summary_count,
-            hours_threshold=hours_threshold,
-            language=language,
-            articles_text=articles_text
-        )
+        return build_summary_prompt(arts, config, get_codec(config, arts))
     
-    # 초기 토큰 계산
-    full_prompt = format_articles(articles)
-    current_tokens = count_tokens(model, full_prompt)
+    # 보정된 추정기 로드 (캐시 없으면 실측 1회로 보정)
+    token_cache = get_token_cache(config)
+    estimator, calibrated = load_estimator(token_cache, model_name)
+    if not calibrated:
+        full_prompt = format_articles(articles)
+        try:
+            with METRICS.timer('gemini_count_tokens', model=model_name):
+                actual = model.count_tokens(full_prompt).total_tokens
+            estimator.calibrate(full_prompt, actual)
+            save_estimator(token_cache, model_name, estimator)
+            logger.debug(f"  토큰 추정 보정: x{estimator.scale:.3f}")
+        except Exception as e:
+            logger.debug(f"  토큰 실측 실패, 기본 추정 사용: {e}")
+    
+    # 기사별 비용은 한 번만 계산 (구분자 "\n\n" 포함)
+    base_tokens = estimator.estimate(format_articles([]))
+    separator_tokens = estimator.estimate("\n\n")
+    codec = get_codec(config, articles)
+    refs = codec.ids() if codec else [None] * len(articles)
+    costs = [estimator.estimate(format_article_line(a, ref)) + separator_tokens
+             for a, ref in zip(articles, refs)]
+    current_tokens = base_tokens + sum(costs)
     
     logger.info(f"📊 초기 토큰 수: {current_tokens:,}")
     
-    # 토큰 초과 시 기사 축소
+    # 토큰 초과 시 기사 축소 (누적합 + 이분 탐색, 최소 10개 유지)
     if current_tokens > max_tokens:
         logger.warning(f"⚠️ 토큰 수 많음 ({current_tokens:,}), 기사 축소 중...")
         
-        while current_tokens > max_tokens and len(articles) > 10:
-            articles = articles[:-5]  # 마지막 5개 제거
-            full_prompt = format_articles(articles)
-            current_tokens = count_tokens(model, full_prompt)
+        keep = max(fit_count(costs, max_tokens - base_tokens), min(len(articles), 10))
+        articles = articles[:keep]
+        current_tokens = base_tokens + sum(costs[:keep])
         
         logger.info(f"✅ 축소 완료: {len(articles)}개 기사, {current_tokens:,} 토큰")
     
     return articles
 
-def summarize_with_gemini(articles: List[Dict], config: Dict, api_key: str) -> str:
-    """Gemini AI로 뉴스 요약"""
+# ═══════════════════════════════════════════════════════════════
+# 맵리듀스 요약 (대량 기사: 배치별 후보 선별 → 최종 요약)
+# ═══════════════════════════════════════════════════════════════
+
+DEFAULT_MAP_PROMPT = """아래 뉴스 목록에서 다음 기준에 가장 부합하는 기사 {candidate_count}개를 고르세요.
+
+기준: {criteria}
+
+기사 번호만 중요도 순으로 쉼표로 구분해 출력하세요. (예: 3, 12, 7)
+
+{articles_text}"""
+
+def split_batches(articles: List[Dict], estimator: TokenEstimator, batch_tokens: int) -> List[List[Dict]]:
+    """토큰 예산 단위로 기사 배치 분할 (순서 유지)"""
+    batches = []
+    current = []
+    current_tokens = 0
+    
+    for article in articles:
+        cost = estimator.estimate(format_article_line(article)) + 2
+        if current and current_tokens + cost > batch_tokens:
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(article)
+        current_tokens += cost
+    
+    if current:
+        batches.append(current)
+    return batches
+
+def _select_from_batch(model, batch: List[Dict], config: Dict, batch_no: int) -> List[Dict]:
+    """배치 1개에서 후보 기사 선별 (개별 재시도, 최종 실패 시 앞쪽 기사 사용)"""
+    ai_config = config.get('ai', {})
+    map_config = ai_config.get('map_reduce', {})
+    candidate_count = map_config.get('candidates_per_batch', ai_config.get('summary_count', 10))
+    template = config.get('prompts', {}).get('map') or DEFAULT_MAP_PROMPT
+    
+    if len(batch) <= candidate_count:
+        return batch
+    
+    # 번호로 고르므로 링크 불필요 (short_link_ids 사용 시 생략)
+    ref = '' if ai_config.get('short_link_ids', False) else None
+    articles_text = "\n\n".join(
+        f"{i}. {format_article_line(a, ref)}" for i, a in enumerate(batch, 1)
+    )
+    prompt = template.format(
+        candidate_count=candidate_count,
+        criteria=map_config.get('criteria', '중요한 경제, 비지니스 뉴스'),
+        articles_text=articles_text
+    )
+    
+    max_retries = 3
+    for attempt in range(max_retries):
+        try:
+            with METRICS.timer('gemini_generate', model=model.model_name, phase='map'):
+                response = model.generate_content(
+                    prompt,
+                    generation_config={'temperature': 0.0, 'max_output_tokens': 256}
+                )
+            record_gemini_usage(response, model.model_name, 'map')
+            
+            selected = []
+            for number in re.findall(r'\d+', response.text):
+                index = int(number) - 1
+                if 0 <= index < len(batch) and batch[index] not in selected:
+                    selected.append(batch[index])
+            
+            if selected:
+                logger.info(f"  🗂️ 배치 {batch_no}: {len(batch)}개 → {len(selected[:candidate_count])}개 후보")
+                return selected[:candidate_count]
+            raise ValueError("기사 번호 없음")
+            
+        except Exception as e:
+            logger.warning(f"  ⚠️ 배치 {batch_no} 시도 {attempt+1}/{max_retries}: {e}")
+            if attempt < max_retries - 1:
+                time.sleep(2 ** attempt)
+    
+    logger.warning(f"  ⚠️ 배치 {batch_no}: 선별 실패, 최신 {candidate_count}개 사용")
+    return batch[:candidate_count]
+
+def map_reduce_candidates(model, articles: List[Dict], config: Dict) -> List[Dict]:
+    """배치별 후보 선별을 병렬 실행 → 최종 요약에 넣을 후보 목록"""
+    ai_config = config.get('ai', {})
+    map_config = ai_config.get('map_reduce', {})
+    
+    estimator, _ = load_estimator(get_token_cache(config), ai_config.get('model', 'gemini-2.5-flash'))
+    batches = split_batches(articles, estimator, map_config.get('batch_tokens', 8000))
+    
+    if len(batches) < 2:
+        return articles
+    
+    logger.info(f"🗂️ 맵리듀스: {len(articles)}개 기사 → {len(batches)}개 배치")
+    
+    with ThreadPoolExecutor(max_workers=map_config.get('max_workers', 4),
+                            thread_name_prefix='map') as executor:
+        results = list(executor.map(
+            lambda item: _select_from_batch(model, item[1], config, item[0]),
+            enumerate(batches, 1)
+        ))
+    
+    # 배치 순서대로 병합 (결정적 순서)
+    candidates = [a for selected in results for a in selected]
+    logger.info(f"✅ 후보 {len(candidates)}개 선별 완료")
+    return candidates
+
+# ═══════════════════════════════════════════════════════════════
+# 응답 캐시 (동일 입력 재실행 시 API 호출 생략)
+# ═══════════════════════════════════════════════════════════════
+
+_model_lock = threading.Lock()
+_models: Dict[Tuple[str, str], 'genai.GenerativeModel'] = {}
+
+def get_gemini_model(api_key: str, model_name: str) -> 'genai.GenerativeModel':
+    """Gemini 모델 (API 키/모델명별 1개, 프로세스 수명 동안 재사용)"""
+    with _model_lock:
+        key = (api_key, model_name)
+        if key not in _models:
+            import google.generativeai as genai
+            genai.configure(api_key=api_key)
+            _models[key] = genai.GenerativeModel(model_name)
+        return _models[key]
+
+def get_model_cascade(config: Dict, api_key: str) -> Optional[ModelCascade]:
+    """ai.cascade가 켜져 있으면 기본 모델 + 대체 모델 캐스케이드 (비활성화 시 None)"""
+    ai_config = config.get('ai', {})
+    cascade_config = ai_config.get('cascade', {})
+    if not cascade_config.get('enabled', False):
+        return None
+    
+    primary = ai_config.get('model', 'gemini-2.5-flash')
+    models = [primary] + [m for m in cascade_config.get('fallback_models', []) if m != primary]
+    
+    cache_config = config.get('cache', {})
+    cache = DiskCache(os.path.join(cache_config.get('directory', '.cache'), 'latency')) \
+        if cache_config.get('enabled', True) else None
+    
+    return ModelCascade(
+        models,
+        lambda name: get_gemini_model(api_key, name),
+        LatencyHistory(cache, cascade_config.get('history_size', 50)),
+        hedge_percentile=cascade_config.get('hedge_percentile', 90),
+        default_hedge_seconds=cascade_config.get('default_hedge_seconds', 20),
+        min_hedge_seconds=cascade_config.get('min_hedge_seconds', 3),
+        request_timeout=cascade_config.get('request_timeout', 120)
+    )
+
+def record_gemini_usage(response, model_name: str, phase: str) -> None:
+    """응답의 입력/출력 토큰 수 기록 (usage_metadata가 없으면 생략)"""
+    try:
+        usage = response.usage_metadata
+        METRICS.inc('gemini_prompt_tokens', usage.prompt_token_count, model=model_name, phase=phase)
+        METRICS.inc('gemini_output_tokens', usage.candidates_token_count, model=model_name, phase=phase)
+    except Exception:
+        pass
+
+def get_response_cache(config: Dict) -> Optional[DiskCache]:
+    """Gemini 응답 캐시 (비활성화 시 None)"""
+    cache_config = config.get('cache', {})
+    response_config = cache_config.get('responses', {})
+    
+    if not cache_config.get('enabled', True) or not response_config.get('enabled', True):
+        return None
+    
+    return DiskCache(
+        os.path.join(cache_config.get('directory', '.cache'), 'responses'),
+        max_age_seconds=response_config.get('ttl_hours', 24) * 3600,
+        max_bytes=int(response_config.get('max_size_mb', 20) * 1024 * 1024)
+    )
+
+def response_cache_key(model_name: str, generation_config: Dict, prompt: str) -> str:
+    """모델명 + 생성 설정 + 최종 프롬프트 해시"""
+    payload = json.dumps(
+        {'model': model_name, 'config': generation_config, 'prompt': prompt},
+        sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def generate_structured_summary(model, model_name: str, prompt: str, codec: PromptCodec,
+                                config: Dict, generation_config: Dict,
+                                cascade: Optional[ModelCascade] = None) -> Optional[str]:
+    """
+    구조화 출력 요약 (JSON 스키마 응답 → 항목 검증 → 템플릿 렌더링)
+    
+    유효한 항목이 summary_count보다 적으면 이미 고른 기사를 제외하고
+    빠진 개수만 재요청합니다 (최대 max_followups회).
+    API 오류(503, 타임아웃 등)는 재요청 횟수와 별개로 요청마다 최대 3회 재시도합니다.
+    cascade가 있으면 유효 항목이 하나라도 있는 첫 응답을 사용합니다.
+    """
+    ai_config = config.get('ai', {})
+    max_followups = ai_config.get('structured_output', {}).get('max_followups', 2)
+    wanted = min(ai_config.get('summary_count', 10), len(codec.refs))
+    items: List[Dict] = []
+    max_retries = 3
+    
+    def request_items(request: str, remaining: List[str], phase: str) -> Optional[Tuple[List[Dict], List[str]]]:
+        """요청 1건 → (유효 항목, 문제 목록), API 오류가 계속되면 None"""
+        request_config = {
+            **generation_config,
+            'response_mime_type': 'application/json',
+            'response_schema': response_schema(remaining),
+        }
+        for attempt in range(max_retries):
+            try:
+                served_by = model_name
+                if cascade:
+                    served_by, response = cascade.generate(
+                        request, request_config, phase,
+                        accept=lambda r: bool(parse_items(r.text, remaining)[0])
+                    )
+                else:
+                    with METRICS.timer('gemini_generate', model=model_name, phase=phase):
+                        response = model.generate_content(request, generation_config=request_config)
+                record_gemini_usage(response, served_by, phase)
+                return parse_items(response.text, remaining)
+            except Exception as e:
+                logger.error(f"  ❌ 시도 {attempt+1}/{max_retries}: {e}")
+                if attempt < max_retries - 1:
+                    time.sleep(2 ** attempt)
+        return None
+    
+    for _ in range(1 + max_followups):
+        missing = wanted - len(items)
+        if missing <= 0:
+            break
+        selected = [item['id'] for item in items]
+        remaining = [ref for ref in codec.ids() if ref not in selected]
+        
+        request = prompt
+        phase = 'structured'
+        if items:
+            request += STRUCTURED_FOLLOWUP.format(selected=', '.join(selected), missing=missing)
+            phase = 'followup'
+            logger.info(f"  🔄 누락 항목 {missing}개 재요청")
+        
+        result = request_items(request, remaining, phase)
+        if result is None:
+            break
+        new_items, problems = result
+        
+        METRICS.inc('structured_items', len(new_items), result='valid')
+        if problems:
+            METRICS.inc('structured_items', len(problems), result='invalid')
+            logger.warning(f"  ⚠️ 항목 {len(problems)}개 제외: {'; '.join(problems[:3])}")
+        items.extend(new_items[:missing])
+    
+    if not items:
+        logger.error("❌ 구조화 출력 최종 실패")
+        return None
+    if len(items) < wanted:
+        logger.warning(f"  ⚠️ 항목 부족: {len(items)}/{wanted}개로 발송")
+    
+    summary = render_digest(items, codec, config.get('prompts', {}).get('digest_template'))
+    logger.info(f"✅ 요약 생성 완료 (구조화 출력, {len(items)}개 항목, {len(summary)}자)")
+    return summary
+
+def summarize_with_gemini(articles: List[Dict], config: Dict, api_key: str,
+                          use_cache: bool = True,
+                          journal: Optional[RunJournal] = None,
+                          stream_handler: Optional['ProgressiveSender'] = None) -> str:
+    """
+    Gemini AI로 뉴스 요약
+    
+    Args:
+        use_cache: False면 응답 캐시 조회 생략
+        journal: 있으면 최종 프롬프트를 체크포인트로 저장/재사용
+        stream_handler: 있으면 stream=True로 생성하며 조각을 전달 (검증 실패 시 rollback)
+    """
     if not articles:
         logger.warning("⚠️ 요약할 기사가 없습니다")
         return None
@@ -310,36 +1318,78 @@ def summarize_with_gemini(articles: List[Dict], config: Dict, api_key: str) -> s
     logger.info("🤖 Gemini AI 요약 생성 중...")
     
     ai_config = config.get('ai', {})
-    prompts = config.get('prompts', {})
-    
-    # Gemini 설정
-    genai.configure(api_key=api_key)
+    structured = structured_output_enabled(config)
     
+    # Gemini 설정 (데몬 모드에서는 모델 재사용)
     model_name = ai_config.get('model', 'gemini-2.5-flash')
-    model = genai.GenerativeModel(model_name)
+    model = get_gemini_model(api_key, model_name)
     
     logger.info(f"  🤖 모델: {model_name}")
     
-    # 토큰 제한 확인 및 축소
-    articles = smart_truncate_articles(model, articles, config)
+    if journal and journal.has('prompt'):
+        prompt = journal.get('prompt')
+        refs = journal.get('prompt_refs')
+        codec = PromptCodec(refs) if refs else None
+        logger.info("  ⏭️ 저장된 프롬프트 사용 (재개)")
+    else:
+        # 대량 기사는 배치별 후보 선별 후 최종 요약 (잘라내지 않음)
+        if ai_config.get('map_reduce', {}).get('enabled', False):
+            articles = map_reduce_candidates(model, articles, config)
+        
+        # 토큰 제한 확인 및 축소
+        articles = smart_truncate_articles(model, articles, config)
+        
+        # 프롬프트 생성 (링크 대신 짧은 기사 ID, 생성 후 복원)
+        codec = get_codec(config, articles)
+        prompt = build_summary_prompt(articles, config, codec)
+        if journal:
+            # 실제로 프롬프트에 들어간 기사만 발송 이력 대상 (축소/맵리듀스로 빠진 기사 제외)
+            journal.save('prompt_links', covered_links(articles))
+            journal.save('prompt_refs', codec.to_dict() if codec else None)
+            journal.save('prompt', prompt)
+    
+    generation_config = {
+        'temperature': ai_config.get('temperature', 0.3),
+        'top_p': ai_config.get('top_p', 0.9),
+        'top_k': ai_config.get('top_k', 40),
+        'max_output_tokens': ai_config.get('max_output_tokens', 2048),
+    }
     
-    # 프롬프트 생성
-    prompt_template = prompts.get('summary', '')
-    summary_count = ai_config.get('summary_count', 10)
-    hours_threshold = config.get('collection', {}).get('hours_threshold', 24)
-    language = ai_config.get('language', 'ko')
+    # 구조화 출력은 렌더링 템플릿도 결과에 영향
+    digest_template = config.get('prompts', {}).get('digest_template') or {}
+    cache_config = {**generation_config, 'digest_template': digest_template} if structured \
+        else generation_config
     
-    articles_text = "\n\n".join([
-        f"[{a['source']}] {a['title']}\n링크: {a['link']}"
-        for a in articles
-    ])
+    # 캐시 조회 (동일 모델/설정/프롬프트)
+    response_cache = get_response_cache(config)
+    cache_key = response_cache_key(model_name, cache_config, prompt)
+    if response_cache and use_cache:
+        cached_summary = response_cache.get(cache_key)
+        if cached_summary:
+            METRICS.inc('gemini_cache_hits')
+            logger.info(f"♻️ 캐시된 요약 사용 ({len(cached_summary)}자)")
+            return cached_summary
     
-    prompt = prompt_template.format(
-        summary_count=summary_count,
-        hours_threshold=hours_threshold,
-        language=language,
-        articles_text=articles_text
-    )
+    # 구조화 출력: 항목 검증 + 누락분만 재요청 (길이 기준 재시도 없음)
+    if structured and codec is not None:
+        if stream_handler:
+            logger.info("  ℹ️ 구조화 출력은 완성 후 일괄 발송 (스트리밍 미사용)")
+        summary = generate_structured_summary(model, model_name, prompt, codec, config, generation_config,
+                                              get_model_cascade(config, api_key))
+        if summary and response_cache:
+            response_cache.set(cache_key, summary)
+            response_cache.evict()
+        return summary
+    
+    # 🔥 핵심 수정: 응답 검증 강화!
+    MIN_EXPECTED_LENGTH = 800  # 10개 뉴스 최소 길이
+    
+    def decode(text: str, report: bool = True) -> str:
+        text = text.strip()
+        return codec.decode(text, report) if codec else text
+    
+    # 모델 캐스케이드 (스트리밍은 중복 발송을 피하려고 기본 모델만 사용)
+    cascade = None if stream_handler else get_model_cascade(config, api_key)
     
     # AI 요약 생성
     max_retries = 3
@@ -347,25 +1397,37 @@ def summarize_with_gemini(articles: List[Dict], config: Dict, api_key: str) -> s
         try:
             logger.debug(f"  요약 생성 시도 {attempt+1}/{max_retries}")
             
-            generation_config = {
-                'temperature': ai_config.get('temperature', 0.3),
-                'top_p': ai_config.get('top_p', 0.9),
-                'top_k': ai_config.get('top_k', 40),
-                'max_output_tokens': ai_config.get('max_output_tokens', 2048),
-            }
-            
-            response = model.generate_content(
-                prompt,
-                generation_config=generation_config
-            )
-            
-            summary = response.text.strip()
-            
-            # 🔥 핵심 수정: 응답 검증 강화!
-            MIN_EXPECTED_LENGTH = 800  # 10개 뉴스 최소 길이
+            served_by = model_name
+            if stream_handler:
+                # 스트리밍: 받는 즉시 텔레그램으로 전달
+                with METRICS.timer('gemini_generate', model=model_name, phase='summary'):
+                    response = model.generate_content(
+                        prompt,
+                        generation_config=generation_config,
+                        stream=True
+                    )
+                    texts = (chunk.text for chunk in response)
+                    summary = stream_handler(codec.decode_stream(texts) if codec else texts).strip()
+            elif cascade:
+                # 먼저 도착한 충분한 길이의 응답 사용
+                served_by, response = cascade.generate(
+                    prompt, generation_config, 'summary',
+                    accept=lambda r: len(decode(r.text, report=False)) >= MIN_EXPECTED_LENGTH
+                )
+                summary = decode(response.text)
+            else:
+                with METRICS.timer('gemini_generate', model=model_name, phase='summary'):
+                    response = model.generate_content(
+                        prompt,
+                        generation_config=generation_config
+                    )
+                summary = decode(response.text)
+            record_gemini_usage(response, served_by, 'summary')
             
             if not summary or len(summary) < MIN_EXPECTED_LENGTH:
                 logger.warning(f"  ⚠️ 응답 부족: {len(summary)}자 (최소 {MIN_EXPECTED_LENGTH}자 필요)")
+                if stream_handler:
+                    stream_handler.rollback()
                 if attempt < max_retries - 1:
                     logger.info(f"  🔄 재시도 {attempt+1}/{max_retries}")
                     time.sleep(2 ** attempt)  # 지수 백오프
@@ -374,11 +1436,16 @@ def summarize_with_gemini(articles: List[Dict], config: Dict, api_key: str) -> s
                     # 최종 시도도 실패
                     raise ValueError(f"응답 길이 부족: {len(summary)}자")
             
-            logger.info(f"✅ 요약 생성 완료 ({len(summary)}자)")
+            logger.info(f"✅ 요약 생성 완료 ({len(summary)}자, {served_by})")
+            if response_cache:
+                response_cache.set(cache_key, summary)
+                response_cache.evict()
             return summary
             
         except Exception as e:
             logger.error(f"  ❌ 시도 {attempt+1}/{max_retries}: {e}")
+            if stream_handler:
+                stream_handler.rollback()
             if attempt < max_retries - 1:
                 time.sleep(2 ** attempt)
     
@@ -386,144 +1453,726 @@ def summarize_with_gemini(articles: List[Dict], config: Dict, api_key: str) -> s
     return None
 
 # ═══════════════════════════════════════════════════════════════
-# 텔레그램 발송 (Markdown Escape + 에러 처리)
+# 텔레그램 발송 (서식 변환 + 에러 처리)
 # ═══════════════════════════════════════════════════════════════
 
-def escape_markdown(text: str) -> str:
-    """Markdown v2 특수문자 이스케이프"""
-    special_chars = ['_', '*', '[', ']', '(', ')', '~', '`', '>', '#', '+', '-', '=', '|', '{', '}', '.', '!']
-    for char in special_chars:
-        text = text.replace(char, f'\\{char}')
-    return text
-
-def send_to_telegram(bot: telegram.Bot, chat_id: str, message: str, config: Dict) -> bool:
-    """텔레그램으로 메시지 발송"""
-    logger.info("📱 텔레그램 발송 중...")
+def _deliver_formatted(bot: 'telegram.Bot', chat_id: str, text: str, config: Dict,
+                       message_id: Optional[int] = None) -> int:
+    """서식 적용 발송/수정 (파싱 실패 시 plain text) → message_id"""
+    import telegram
     
     telegram_config = config.get('telegram', {})
-    max_length = telegram_config.get('max_message_length', 4000)
     parse_mode = telegram_config.get('parse_mode', 'Markdown')
     disable_preview = telegram_config.get('disable_preview', True)
     should_escape = telegram_config.get('escape_markdown', True)
     
-    # 메시지 분할
-    if len(message) > max_length:
-        logger.warning(f"⚠️ 메시지 길이 초과 ({len(message)}자), 분할 발송")
-        messages = [message[i:i+max_length] for i in range(0, len(message), max_length)]
-    else:
-        messages = [message]
+    formatted = render(text, parse_mode, should_escape)
     
-    # 발송
-    for i, msg in enumerate(messages):
-        try:
-            # Markdown escape
-            if should_escape and parse_mode == 'Markdown':
-                msg_escaped = escape_markdown(msg)
-            else:
-                msg_escaped = msg
-            
-            bot.send_message(
-                chat_id=chat_id,
-                text=msg_escaped,
-                parse_mode=parse_mode,
-                disable_web_page_preview=disable_preview
-            )
+    def deliver(body, mode):
+        if message_id is None:
+            return bot.send_message(chat_id=chat_id, text=body, parse_mode=mode,
+                                    disable_web_page_preview=disable_preview).message_id
+        bot.edit_message_text(text=body, chat_id=chat_id, message_id=message_id,
+                              parse_mode=mode, disable_web_page_preview=disable_preview)
+        return message_id
+    
+    try:
+        return deliver(formatted, parse_mode)
+    except telegram.error.BadRequest as e:
+        if "not modified" in str(e).lower():
+            return message_id
+        if "can't parse" not in str(e).lower():
+            raise
+        logger.warning(f"  ⚠️ Markdown 파싱 실패, plain text로 재시도")
+        return deliver(text, None)
+
+class ProgressiveSender:
+    """
+    스트리밍 응답 점진 발송
+    
+    완성된 항목(빈 줄 단위)이 생길 때마다 현재 메시지를 plain text로 수정하고,
+    다음 메시지로 넘어간 메시지는 서식을 적용해 확정합니다.
+    확정된 메시지 집합은 split_message(전체 요약)과 동일합니다.
+    """
+    
+    def __init__(self, bot: 'telegram.Bot', chat_id: str, config: Dict,
+                 on_delivered: Optional[Callable[[int], None]] = None,
+                 on_rollback: Optional[Callable[[], None]] = None,
+                 on_sent: Optional[Callable[[List[int]], None]] = None):
+        telegram_config = config.get('telegram', {})
+        self.bot = bot
+        self.chat_id = chat_id
+        self.config = config
+        self.max_length = telegram_config.get('max_message_length', 4000)
+        self.parse_mode = telegram_config.get('parse_mode', 'Markdown')
+        self.escape = telegram_config.get('escape_markdown', True)
+        self.edit_interval = telegram_config.get('stream_edit_interval', 1.0)
+        self.on_delivered = on_delivered
+        self.on_rollback = on_rollback
+        self.on_sent = on_sent
+        self.message_ids: List[int] = []
+        self.completed = False
+        self._first_sent_at = None
+    
+    def _show(self, index: int, preview: str) -> None:
+        """작성 중 메시지 미리보기 (서식 없음)"""
+        import telegram
+        
+        disable_preview = self.config.get('telegram', {}).get('disable_preview', True)
+        if index < len(self.message_ids):
+            try:
+                self.bot.edit_message_text(text=preview, chat_id=self.chat_id,
+                                           message_id=self.message_ids[index],
+                                           disable_web_page_preview=disable_preview)
+            except telegram.error.BadRequest as e:
+                if "not modified" not in str(e).lower():
+                    raise
+        else:
+            message = self.bot.send_message(chat_id=self.chat_id, text=preview,
+                                            disable_web_page_preview=disable_preview)
+            self._track(message.message_id)
+            if self._first_sent_at is None:
+                self._first_sent_at = time.time()
+    
+    def _finalize(self, index: int, text: str) -> None:
+        """메시지 확정 (서식 적용)"""
+        message_id = self.message_ids[index] if index < len(self.message_ids) else None
+        with METRICS.timer('telegram_send'):
+            message_id = _deliver_formatted(self.bot, self.chat_id, text, self.config, message_id)
+        METRICS.inc('telegram_messages', status='sent')
+        if index >= len(self.message_ids):
+            self._track(message_id)
+        logger.info(f"  ✅ 메시지 {index+1} 발송 완료 (스트리밍)")
+        if self.on_delivered:
+            self.on_delivered(index)
+    
+    def _track(self, message_id: int) -> None:
+        """보낸 메시지 ID 기록 (중단 후 --resume 시 정리용)"""
+        self.message_ids.append(message_id)
+        if self.on_sent:
+            self.on_sent(list(self.message_ids))
+    
+    def _split(self, text: str) -> List[str]:
+        return split_message(text, self.max_length, self.parse_mode, self.escape)
+    
+    def __call__(self, pieces: Iterable[str]) -> str:
+        """응답 조각을 받아 점진 발송 → 전체 텍스트 반환"""
+        self.completed = False
+        started = time.time()
+        buffer = ''
+        index = 0
+        last_edit = 0.0
+        last_preview = ''
+        
+        for piece in pieces:
+            buffer += piece
+            text = buffer.lstrip()
             
-            logger.info(f"  ✅ 메시지 {i+1}/{len(messages)} 발송 완료")
+            # 완성된 항목까지만 분할 (마지막 조각 외에는 이후 내용과 무관하게 불변)
+            boundary = text.rfind('\n\n')
+            if boundary <= 0:
+                continue
+            chunks = self._split(text[:boundary])
             
-            if i < len(messages) - 1:
-                time.sleep(telegram_config.get('send_interval', 0.5))
+            # 다음 메시지로 넘어간 메시지 확정
+            while index < len(chunks) - 1:
+                self._finalize(index, chunks[index])
+                index += 1
+                last_preview = ''
             
-        except telegram.error.BadRequest as e:
-            # Markdown 파싱 실패 시 plain text로 재시도
-            if "can't parse" in str(e).lower():
-                logger.warning(f"  ⚠️ Markdown 파싱 실패, plain text로 재시도")
-                try:
-                    bot.send_message(
-                        chat_id=chat_id,
-                        text=msg,  # 원본 그대로
-                        disable_web_page_preview=disable_preview
-                    )
-                    logger.info(f"  ✅ Plain text 발송 성공")
-                except Exception as e2:
-                    logger.error(f"  ❌ 재시도 실패: {e2}")
-                    return False
-            else:
-                logger.error(f"  ❌ 발송 실패: {e}")
-                return False
+            # 현재 메시지: 완성된 항목까지 미리보기
+            preview = chunks[-1] if chunks else ''
+            if preview and preview != last_preview and time.time() - last_edit >= self.edit_interval:
+                self._show(index, preview)
+                last_preview = preview
+                last_edit = time.time()
+        
+        summary = buffer.strip()
+        messages = self._split(summary)
+        for i in range(index, len(messages)):
+            self._finalize(i, messages[i])
+        
+        if self._first_sent_at is not None:
+            logger.info(f"  ⚡ 첫 메시지까지 {self._first_sent_at - started:.1f}초")
+        self.completed = True
+        return summary
+    
+    def rollback(self) -> None:
+        """발송한 메시지 삭제 (재시도 전 정리)"""
+        _delete_messages(self.bot, self.chat_id, self.message_ids)
+        self.message_ids = []
+        self.completed = False
+        self._first_sent_at = None
+        if self.on_sent:
+            self.on_sent([])
+        if self.on_rollback:
+            self.on_rollback()
+
+def _delete_messages(bot: 'telegram.Bot', chat_id: str, message_ids: Iterable[int]) -> None:
+    """메시지 삭제 (실패는 경고만)"""
+    for message_id in message_ids:
+        try:
+            bot.delete_message(chat_id=chat_id, message_id=message_id)
         except Exception as e:
-            logger.error(f"  ❌ 발송 실패: {e}")
-            return False
+            logger.warning(f"  ⚠️ 메시지 삭제 실패: {e}")
+
+def _discard_streamed(bot: 'telegram.Bot', journal: RunJournal, name: str) -> None:
+    """
+    중단된 스트리밍이 남긴 메시지 정리 (--resume)
     
-    logger.info(f"✅ 전체 메시지 발송 완료 ({len(messages)}개)")
-    return True
+    요약이 저장돼 있으면 확정되지 않은 메시지(작성 중 미리보기)만,
+    요약을 새로 만들면 전부 삭제합니다. (다시 발송할 때 중복 방지)
+    """
+    streamed = journal.get('streamed')
+    if not streamed or not streamed.get('message_ids'):
+        return
+    message_ids = streamed['message_ids']
+    if journal.has('summary'):
+        delivered = journal.delivered
+        message_ids = [m for i, m in enumerate(message_ids) if i not in delivered]
+    if message_ids:
+        logger.info(f"🧹 [{name}] 이전 스트리밍 메시지 {len(message_ids)}개 삭제")
+        _delete_messages(bot, streamed['chat_id'], message_ids)
+    journal.save('streamed', None)
+
+def _build_delivery(bot: 'telegram.Bot', message: str, config: Dict) -> Tuple['DeliveryQueue', List[str]]:
+    """발송 큐 + 분할된 메시지"""
+    from telegram_delivery import DeliveryQueue
+    
+    telegram_config = config.get('telegram', {})
+    max_length = telegram_config.get('max_message_length', 4000)
+    
+    # 메시지 분할 (변환 후 길이 기준, 항목/줄 경계)
+    messages = split_message(
+        message,
+        max_length,
+        telegram_config.get('parse_mode', 'Markdown'),
+        telegram_config.get('escape_markdown', True)
+    )
+    if len(messages) > 1:
+        logger.warning(f"⚠️ 메시지 길이 초과 ({len(message)}자), {len(messages)}개로 분할 발송")
+    
+    queue = DeliveryQueue(
+        lambda chat_id, text: _deliver_formatted(bot, chat_id, text, config),
+        config
+    )
+    return queue, messages
+
+def broadcast_to_telegram(bot: 'telegram.Bot', chat_ids: List[str], message: str, config: Dict,
+                          journals: Optional[Dict[str, RunJournal]] = None) -> Dict[str, bool]:
+    """
+    여러 채팅으로 동시 발송 (전역/채팅별 속도 제한, 채팅 내 순서 유지)
+    
+    Args:
+        journals: 채팅별 발송 기록 (이미 보낸 메시지는 건너뜀)
+    
+    Returns:
+        {chat_id: 성공 여부}
+    """
+    from telegram_delivery import DeliveryJob
+    
+    logger.info(f"📱 텔레그램 발송 중... (채팅 {len(chat_ids)}개)")
+    journals = journals or {}
+    queue, messages = _build_delivery(bot, message, config)
+    
+    jobs = [
+        DeliveryJob(
+            chat_id,
+            messages,
+            delivered=journals[chat_id].delivered if chat_id in journals else None,
+            on_delivered=journals[chat_id].mark_delivered if chat_id in journals else None
+        )
+        for chat_id in chat_ids
+    ]
+    results = dict(zip(chat_ids, queue.deliver(jobs)))
+    
+    succeeded = sum(results.values())
+    logger.info(f"✅ 발송 완료: 채팅 {succeeded}/{len(chat_ids)}개 (메시지 {len(messages)}개씩)")
+    return results
 
 # ═══════════════════════════════════════════════════════════════
 # 메인 실행
 # ═══════════════════════════════════════════════════════════════
 
-def main():
-    """메인 실행 함수"""
+def covered_links(articles: List[Dict]) -> List[str]:
+    """기사 링크 + 유사 기사로 병합된 링크 (발송 이력 기록 대상)"""
+    links = []
+    for article in articles:
+        links.append(article.get('link'))
+        links.extend(article.get('duplicate_links') or [])
+    return links
+
+def prepare_digest_articles(profile: Dict, collected: List[Dict],
+                            seen_store: Optional[SeenStore] = None,
+                            namespace: str = '') -> Tuple[List[Dict], List[Dict]]:
+    """
+    다이제스트 1개의 입력 기사 준비
+    
+    Returns:
+        (선택된 기사, 유사 기사 병합 후 기사)
+    """
+    name = profile['name']
+    profile_config = profile['config']
+    max_total = profile_config.get('collection', {}).get('max_total_articles', 60)
+    
+    selected = select_articles(collected, profile)
+    METRICS.gauge('digest_articles', len(selected), digest=name, step='collected')
+    if seen_store:
+        before = len(selected)
+        selected = seen_store.filter_new(selected, namespace)
+        METRICS.gauge('digest_articles', len(selected), digest=name, step='new')
+        logger.info(f"  ♻️ [{name}] 이미 발송된 기사 {before - len(selected)}개 제외")
+    
+    ranking_config = profile_config.get('ranking', {})
+    if ranking_config.get('enabled', False):
+        # 점수순 후보 풀 → 풀 안에서만 병합 → 매체 수 반영해 다시 점수순 상위 top_k
+        # (MinHash 병합 대상을 새 기사 전체가 아닌 top_k × pool_factor개로 제한)
+        top_k = min(ranking_config.get('top_k', 40), max_total)
+        pool_size = top_k * ranking_config.get('pool_factor', 3)
+        with METRICS.timer('rank'):
+            pool = rank_articles(selected, profile_config)[:pool_size]
+        METRICS.gauge('digest_articles', len(pool), digest=name, step='pooled')
+        articles = dedupe_articles(pool, profile_config)
+        METRICS.gauge('digest_articles', len(articles), digest=name, step='deduped')
+        with METRICS.timer('rank'):
+            articles = rank_articles(articles, profile_config)[:top_k]
+        METRICS.gauge('digest_articles', len(articles), digest=name, step='ranked')
+        
+        # 발송 이력에는 상위 기사와 병합된 기사만 기록
+        kept = set(covered_links(articles))
+        selected = [a for a in selected if a.get('link') in kept]
+        logger.info(f"  🎯 [{name}] 사전 순위: 상위 {len(articles)}개 선택")
+    else:
+        selected = limit_articles(selected, max_total)
+        METRICS.gauge('digest_articles', len(selected), digest=name, step='limited')
+        
+        articles = dedupe_articles(selected, profile_config)
+        METRICS.gauge('digest_articles', len(articles), digest=name, step='deduped')
+    for article in articles:
+        METRICS.feed(article['source'], selected=1)
+    return selected, articles
+
+def run_digest(profile: Dict, articles: List[Dict], bot: 'telegram.Bot', api_key: str,
+               journal: RunJournal, use_cache: bool = True) -> bool:
+    """다이제스트 1개 요약 + 모든 수신 채팅으로 발송"""
+    name = profile['name']
+    profile_config = profile['config']
+    chat_ids = profile['chat_ids']
+    
+    if name != DEFAULT_PROFILE:
+        logger.info(f"📰 [{name}] 기사 {len(articles)}개 → 채팅 {len(chat_ids)}개")
+    
+    # 채팅별 발송 기록 (채팅 1개면 다이제스트 범위 그대로)
+    def chat_scope(chat_id):
+        return journal.scoped(chat_id) if len(chat_ids) > 1 else journal
+    
+    # 5. AI 요약 (ai.stream이면 생성과 동시에 발송, 채팅 1개일 때만)
+    stream_sender = None
+    _discard_streamed(bot, journal, name)
+    if journal.has('summary'):
+        summary = journal.get('summary')
+        logger.info(f"⏭️ [{name}] 저장된 요약 사용 (요약 생략)")
+    else:
+        # 요약이 없으면 이전 발송 기록은 무효
+        journal.reset_delivered()
+        if profile_config.get('ai', {}).get('stream', False) and len(chat_ids) == 1:
+            stream_sender = ProgressiveSender(
+                bot,
+                chat_ids[0],
+                profile_config,
+                on_delivered=journal.mark_delivered,
+                on_rollback=journal.reset_delivered,
+                on_sent=lambda message_ids: journal.save(
+                    'streamed', {'chat_id': chat_ids[0], 'message_ids': message_ids})
+            )
+        
+        with METRICS.timer('stage', stage='summarize', digest=name):
+            summary = summarize_with_gemini(
+                articles,
+                profile_config,
+                api_key,
+                use_cache=use_cache,
+                journal=journal,
+                stream_handler=stream_sender
+            )
+        
+        if not summary:
+            logger.error(f"❌ [{name}] 요약 생성 실패")
+            return False
+        journal.save('summary', summary)
+    
+    # 6. 텔레그램 발송 (이미 보낸 메시지는 건너뜀)
+    if stream_sender and stream_sender.completed:
+        logger.info(f"✅ 전체 메시지 발송 완료 (스트리밍, {len(stream_sender.message_ids)}개)")
+        return True
+    
+    with METRICS.timer('stage', stage='deliver', digest=name):
+        results = broadcast_to_telegram(
+            bot,
+            chat_ids,
+            summary,
+            profile_config,
+            journals={chat_id: chat_scope(chat_id) for chat_id in chat_ids}
+        )
+    for chat_id, delivered in results.items():
+        if not delivered:
+            logger.error(f"❌ [{name}] 텔레그램 발송 실패: {chat_id}")
+    
+    return all(results.values())
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="범용 뉴스 자동 요약 시스템")
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help="Gemini 응답 캐시를 무시하고 새로 요약 (결과는 캐시에 저장)"
+    )
+    parser.add_argument(
+        '--resume', action='store_true',
+        help="마지막 미완료 실행을 이어서 진행 (완료된 단계와 발송된 메시지 건너뜀)"
+    )
+    parser.add_argument(
+        '--daemon', action='store_true',
+        help="상주 실행: daemon.schedules(cron)에 따라 반복 실행, 연결/클라이언트 재사용"
+    )
+    parser.add_argument(
+        '--config', default='config.yaml',
+        help="설정 파일 경로 (기본: config.yaml)"
+    )
+    parser.add_argument(
+        '--shard', metavar='i/N',
+        help="분산 수집: 피드를 N개로 나눈 중 i번째(0부터)만 수집해 스풀 파일로 저장하고 종료"
+    )
+    parser.add_argument(
+        '--merge', action='store_true',
+        help="수집 대신 같은 실행 ID의 샤드 스풀을 병합해 요약/발송 (병합 후 스풀 삭제)"
+    )
+    parser.add_argument(
+        '--run-id',
+        help="--shard/--merge 실행 ID (기본: GITHUB_RUN_ID, 없으면 'local')"
+    )
+    parser.add_argument(
+        '--check-config', action='store_true',
+        help="설정 파일만 검증하고 종료 (네트워크/환경 변수 불필요)"
+    )
+    return parser.parse_args(argv)
+
+def run_pipeline(config: Dict, env_vars: Dict[str, str], bot: 'telegram.Bot',
+                 use_cache: bool = True, resume: bool = False,
+                 only_digests: Optional[List[str]] = None, merge: bool = False,
+                 spool_run_id: Optional[str] = None) -> bool:
+    """
+    수집 → 요약 → 발송 1회 (성공 여부 반환, 실행 리포트 저장)
+    
+    Args:
+        resume: 마지막 미완료 실행 이어서 진행
+        only_digests: 지정 시 해당 다이제스트만 실행
+        merge: 직접 수집하지 않고 샤드 스풀을 병합 (--shard로 수집한 결과)
+        spool_run_id: 병합할 스풀의 실행 ID (None이면 resolve_run_id 기본값)
+    """
     start_time = time.time()
+    METRICS.reset()
+    journal = None
+    seen_store = None
+    success = False
     
     try:
-        print("="*60)
-        print("🚀 범용 뉴스 자동 요약 시스템 (개선 버전)")
-        print("="*60)
+        # 실행 저널 (--resume 시 이전 체크포인트 사용)
+        journal_dir = os.path.join(config.get('cache', {}).get('directory', '.cache'), 'journal')
+        journal = RunJournal.resume(journal_dir) if resume else None
+        if journal:
+            logger.info(f"⏭️ 실행 재개: {journal.run_id}")
+        else:
+            if resume:
+                logger.warning("⚠️ 재개할 실행이 없어 새로 시작합니다")
+            journal = RunJournal.start(journal_dir)
         
-        # 1. 설정 로드
-        logger.info("📋 설정 파일 로드 중...")
-        config = load_config()
-        validate_config(config)
-        setup_logging(config)
-        logger.info("✅ 설정 로드 완료")
+        seen_store = SeenStore.from_config(config)
+        profiles = build_profiles(config, env_vars['TELEGRAM_CHAT_ID'])
+        multi = len(profiles) > 1
+        if only_digests is not None:
+            profiles = [p for p in profiles if p['name'] in only_digests]
+        if multi:
+            logger.info(f"📚 다이제스트 {len(profiles)}개: {', '.join(p['name'] for p in profiles)}")
         
-        # 2. 환경 변수 검증
-        env_vars = validate_environment()
+        # 4. RSS 수집 (모든 다이제스트 공용, 피드당 1회)
+        if journal.has('collected'):
+            collected = decode_articles(journal.get('collected'))
+            logger.info(f"⏭️ 저장된 기사 {len(collected)}개 사용 (수집 생략)")
+        else:
+            with METRICS.timer('stage', stage='collect'):
+                if merge:
+                    spool_run_id = resolve_run_id(spool_run_id)
+                    collected = load_spooled_articles(union_feed_config(config, profiles), spool_run_id)
+                else:
+                    collected = fetch_all_rss(union_feed_config(config, profiles), limit_total=False)
+            journal.save('collected', encode_articles(collected))
+            
+            # 병합 결과는 저널에 있으므로 스풀 삭제 (재개 시에도 저널 사용)
+            if merge:
+                removed = remove_spools(_spool_dir(config), spool_run_id, _spool_max_age(config))
+                logger.debug(f"스풀 {removed}개 삭제")
         
-        # 3. 텔레그램 검증
-        bot = validate_telegram(
-            env_vars['TELEGRAM_BOT_TOKEN'],
-            env_vars['TELEGRAM_CHAT_ID']
-        )
+        # 다이제스트별 기사 선택 (발송 이력 제외 → 개수 제한 → 유사 기사 병합)
+        digests = []
+        unresolved = []
+        for profile in profiles:
+            # 수신자가 없으면 요약 비용/발송 이력 기록 없이 실패 처리
+            if not profile['chat_ids']:
+                logger.error(f"❌ [{profile['name']}] 수신 채팅 없음 (chat_ids 환경 변수 확인)")
+                unresolved.append(profile['name'])
+                continue
+            
+            scope = journal.scoped(profile['name']) if multi else journal
+            if scope.has('articles'):
+                selected = decode_articles(scope.get('selected'))
+                articles = decode_articles(scope.get('articles'))
+            else:
+                with METRICS.timer('stage', stage='prepare'):
+                    selected, articles = prepare_digest_articles(
+                        profile, collected, seen_store, namespace=profile['name'] if multi else ''
+                    )
+                with METRICS.timer('stage', stage='enrich'):
+                    articles = enrich_articles(articles, profile['config'])
+                scope.save('selected', encode_articles(selected))
+                scope.save('articles', encode_articles(articles))
+            
+            if articles:
+                digests.append((profile, scope, selected, articles))
+            else:
+                logger.info(f"  ⏭️ [{profile['name']}] 새 기사 없음")
         
-        # 4. RSS 수집
-        articles = fetch_all_rss(config)
+        if not digests and unresolved:
+            return False
         
-        if not articles:
+        if not digests:
             logger.warning("⚠️ 수집된 기사가 없습니다")
             logger.warning("💡 가능한 원인:")
             logger.warning("  - RSS 피드 일시 오류")
             logger.warning("  - 24시간 내 새 기사 없음")
+            logger.warning("  - 새 기사가 모두 이미 발송됨 (history 설정)")
             logger.warning("  - 네트워크 문제")
-            sys.exit(0)
+            journal.complete()
+            success = True
+            return True
         
-        # 5. AI 요약
-        summary = summarize_with_gemini(
-            articles,
-            config,
-            env_vars['GEMINI_API_KEY']
-        )
+        # 5~6. 다이제스트별 요약 + 발송 (동시 실행)
+        def run(item):
+            profile, scope, _, articles = item
+            return run_digest(profile, articles, bot, env_vars['GEMINI_API_KEY'],
+                              scope, use_cache=use_cache)
         
-        if not summary:
-            logger.error("❌ 요약 생성 실패")
-            sys.exit(1)
+        if len(digests) > 1:
+            max_workers = config.get('digest_workers', 4)
+            with ThreadPoolExecutor(max_workers=min(len(digests), max_workers),
+                                    thread_name_prefix='digest') as executor:
+                results = list(executor.map(run, digests))
+        else:
+            results = [run(digests[0])]
         
-        # 6. 텔레그램 발송
-        success = send_to_telegram(
-            bot,
-            env_vars['TELEGRAM_CHAT_ID'],
-            summary,
-            config
-        )
+        # 발송 완료 기사 기록 (다음 실행에서 제외, 프롬프트에 들어간 기사만)
+        if seen_store:
+            for (profile, scope, selected, _), ok in zip(digests, results):
+                if not ok:
+                    continue
+                if scope.has('prompt_links'):
+                    covered = set(scope.get('prompt_links'))
+                    selected = [a for a in selected if a.get('link') in covered]
+                seen_store.mark_delivered(selected, profile['name'] if multi else '')
         
-        if not success:
-            logger.error("❌ 텔레그램 발송 실패")
-            sys.exit(1)
+        if unresolved or not all(results):
+            failed = unresolved + [d[0]['name'] for d, ok in zip(digests, results) if not ok]
+            logger.error(f"❌ 다이제스트 실패: {', '.join(failed)}")
+            logger.error("💡 남은 메시지만 다시 보내려면: python news_digest.py --resume")
+            return False
+        
+        journal.complete()
+        success = True
         
         # 완료
         elapsed = time.time() - start_time
         logger.info(f"🎉 전체 작업 성공! (소요: {elapsed:.1f}초)")
+        return True
+        
+    finally:
+        if seen_store:
+            seen_store.close()
+        # 실행 리포트 (실패/중단 시에도 저장)
+        export_metrics(config, success=success,
+                       run_id=journal.run_id if journal else None,
+                       resumed=resume)
+
+def load_and_validate(config_path: str, strict: bool = False) -> Dict:
+    """설정 로드 + 검증 + 로깅 설정 (strict면 오류 시 기본 설정 대신 예외)"""
+    logger.info("📋 설정 파일 로드 중...")
+    config = ConfigLoader.load(config_path, use_default_on_error=not strict)
+    validate_config(config)
+    setup_logging(config)
+    logger.info("✅ 설정 로드 완료")
+    return config
+
+# ═══════════════════════════════════════════════════════════════
+# 데몬 모드 (내부 스케줄러 + 설정 자동 재로드)
+# ═══════════════════════════════════════════════════════════════
+
+def _config_mtime(config_path: str) -> Optional[float]:
+    try:
+        return os.path.getmtime(config_path)
+    except OSError:
+        return None
+
+def _schedule_timezone(daemon_config: Dict):
+    name = daemon_config.get('timezone')
+    return ZoneInfo(name) if name else None
+
+def run_daemon(args: argparse.Namespace, config: Dict, env_vars: Dict[str, str],
+               bot: 'telegram.Bot') -> None:
+    """
+    상주 실행: 스케줄 시각마다 run_pipeline 실행
+    
+    HTTP 세션, Gemini 모델, 텔레그램 봇은 프로세스 수명 동안 재사용하고,
+    설정 파일이 바뀌면 다음 실행 전에 다시 읽습니다 (검증 실패 시 기존 설정 유지).
+    SIGTERM/SIGINT를 받으면 진행 중인 실행을 마치고 종료합니다.
+    """
+    stop = threading.Event()
+    
+    def request_stop(signum, frame):
+        logger.info(f"🛑 종료 신호 수신 ({signal.Signals(signum).name}), 진행 중인 작업 후 종료")
+        stop.set()
+    
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+    
+    config_mtime = _config_mtime(args.config)
+    daemon_config = config.get('daemon', {})
+    schedules = build_schedules(daemon_config)
+    if not schedules:
+        logger.error("❌ daemon.schedules가 비어 있습니다 (예: \"50 23 * * *\")")
+        sys.exit(1)
+    
+    logger.info(f"🕰️ 데몬 시작: {', '.join(s.expression for s, _ in schedules)}")
+    resume = args.resume
+    pending = daemon_config.get('run_on_start', False)
+    last_poll = time.time()
+    
+    def poll_between_digests():
+        # 바쁜 피드를 미리 수집해 캐시에 누적 (polling.enabled일 때)
+        nonlocal last_poll
+        polling_config = config.get('polling', {})
+        interval = polling_config.get('background_interval_minutes', 15) * 60
+        if not polling_config.get('enabled', False) or time.time() - last_poll < interval:
+            return
+        last_poll = time.time()
+        try:
+            profiles = build_profiles(config, env_vars['TELEGRAM_CHAT_ID'])
+            fetch_all_rss(union_feed_config(config, profiles), background=True)
+        except Exception as e:
+            logger.warning(f"⚠️ 백그라운드 폴링 실패: {e}")
+    
+    while not stop.is_set():
+        timezone = _schedule_timezone(daemon_config)
+        when, digests = next_run(schedules, now_in(timezone))
+        
+        if not pending:
+            logger.info(f"⏰ 다음 실행: {when:%Y-%m-%d %H:%M} "
+                        f"({'전체' if digests is None else ', '.join(digests)})")
+            
+            # 다음 실행까지 대기 (설정 변경 확인 겸)
+            reload_interval = daemon_config.get('reload_interval', 30)
+            while not stop.is_set():
+                remaining = (when - now_in(timezone)).total_seconds()
+                if remaining <= 0:
+                    break
+                stop.wait(min(remaining, reload_interval))
+                if stop.is_set():
+                    break
+                poll_between_digests()
+                
+                mtime = _config_mtime(args.config)
+                if mtime != config_mtime:
+                    config_mtime = mtime
+                    try:
+                        config = load_and_validate(args.config, strict=True)
+                        daemon_config = config.get('daemon', {})
+                        schedules = build_schedules(daemon_config) or schedules
+                        logger.info("🔄 설정 변경 반영")
+                        break  # 바뀐 스케줄로 다음 실행 시각 재계산
+                    except Exception as e:
+                        logger.error(f"❌ 설정 재로드 실패, 기존 설정 유지: {e}")
+            else:
+                break
+            
+            if (when - now_in(timezone)).total_seconds() > 0:
+                continue
+        
+        pending = False
+        try:
+            run_pipeline(config, env_vars, bot, use_cache=not args.no_cache,
+                         resume=resume, only_digests=digests)
+        except Exception as e:
+            logger.error(f"❌ 실행 실패: {e}", exc_info=True)
+        resume = False
+    
+    logger.info("👋 데몬 종료")
+
+def main():
+    """메인 실행 함수"""
+    args = parse_args()
+    
+    if args.check_config:
+        try:
+            load_and_validate(args.config, strict=True)
+        except Exception as e:
+            logger.error(f"❌ 설정 오류: {e}")
+            sys.exit(1)
+        return
+    
+    if args.shard:
+        try:
+            index, count = parse_shard(args.shard)
+            config = load_and_validate(args.config)
+            if not collect_shard(config, index, count, resolve_run_id(args.run_id)):
+                sys.exit(1)
+        except Exception as e:
+            logger.error(f"❌ 샤드 수집 실패: {e}", exc_info=not isinstance(e, ShardError))
+            sys.exit(1)
+        return
+    
+    try:
+        print("="*60)
+        print("🚀 범용 뉴스 자동 요약 시스템 (개선 버전)")
+        print("="*60)
+        
+        # 1. 설정 로드
+        config = load_and_validate(args.config)
+        
+        # 2. 환경 변수 검증
+        env_vars = validate_environment()
+        
+        # 3. 텔레그램 / Gemini 검증 (캐시 유효 기간 내에는 생략)
+        credential_cache = get_credential_cache(config)
+        bot = validate_telegram(
+            env_vars['TELEGRAM_BOT_TOKEN'],
+            env_vars['TELEGRAM_CHAT_ID'],
+            con_pool_size=config.get('telegram', {}).get('max_concurrent_sends', 8) + 2,
+            cache=credential_cache
+        )
+        validate_gemini(
+            env_vars['GEMINI_API_KEY'],
+            config.get('ai', {}).get('model', 'gemini-2.5-flash'),
+            cache=credential_cache
+        )
+        
+        if args.daemon:
+            run_daemon(args, config, env_vars, bot)
+            return
+        
+        if not run_pipeline(config, env_vars, bot, use_cache=not args.no_cache,
+                            resume=args.resume, merge=args.merge,
+                            spool_run_id=args.run_id):
+            # 토큰/Chat ID/API 키 변경일 수 있으므로 다음 실행에서 다시 검증
+            forget_credentials(config, env_vars)
+            sys.exit(1)
         print("="*60)
         
     except KeyboardInterrupt:
@@ -0,0 +1,121 @@
+"""
+프롬프트 링크 압축 (긴 URL → 짧은 기사 ID → 생성 후 원래 링크로 복원)
+프롬프트에는 기사마다 [a1] 같은 ID만 넣고, 모델이 기사링크 자리에 쓴 ID를
+실제 링크로 바꿉니다. 없는 ID(모델이 지어낸 참조)는 링크 없이 텍스트만 남깁니다.
+
+입력/출력 토큰이 줄고, 모델이 URL을 옮겨 적다 깨뜨리는 문제가 없어집니다.
+"""
+
+import re
+import logging
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+ID_PREFIX = 'a'
+
+# 프롬프트의 기사 목록 앞에 붙는 안내
+INSTRUCTION = (
+    "(각 기사의 링크는 [a1] 같은 기사 ID로 표시했습니다. "
+    "출력에서 기사링크 자리에는 해당 ID만 그대로 쓰세요. 예: **[소스명](a1)**)"
+)
+
+# [텍스트](a17) / [a17] (뒤에 링크가 없는 단독 참조)
+_LINK_RE = re.compile(r'\[([^\]\n]*)\]\(\s*<?(' + ID_PREFIX + r'\d+)>?\s*\)')
+_BARE_RE = re.compile(r'\[(' + ID_PREFIX + r'\d+)\](?!\()')
+
+
+class PromptCodec:
+    """기사 ID ↔ 링크 대응표"""
+
+    def __init__(self, refs: Dict[str, Dict[str, str]]):
+        """
+        Args:
+            refs: {ID: {'link': 링크, 'source': 소스명}}
+        """
+        self.refs = refs
+
+    @classmethod
+    def from_articles(cls, articles: List[Dict]) -> 'PromptCodec':
+        """프롬프트 순서대로 a1, a2, ... 부여"""
+        return cls({
+            f"{ID_PREFIX}{i}": {'link': a.get('link', ''), 'source': a.get('source', '')}
+            for i, a in enumerate(articles, 1)
+        })
+
+    def ids(self) -> List[str]:
+        return list(self.refs)
+
+    def to_dict(self) -> Dict[str, Dict[str, str]]:
+        """저널 저장용"""
+        return dict(self.refs)
+
+    def decode(self, text: str, report: bool = True) -> str:
+        """생성 결과의 기사 ID → 실제 링크 (없는 ID는 링크 제거, report=False면 기록 없이)"""
+        resolved: List[str] = []
+        invalid: List[str] = []
+        text = self._decode(text, resolved, invalid)
+        if report:
+            self._report(resolved, invalid)
+        return text
+
+    def _decode(self, text: str, resolved: List[str], invalid: List[str]) -> str:
+
+        def link(match: 're.Match') -> str:
+            label, ref = match.group(1), match.group(2)
+            if ref not in self.refs:
+                invalid.append(ref)
+                return label
+            resolved.append(ref)
+            return f"[{label}]({self.refs[ref]['link']})"
+
+        def bare(match: 're.Match') -> str:
+            ref = match.group(1)
+            if ref not in self.refs:
+                invalid.append(ref)
+                return ''
+            resolved.append(ref)
+            return f"[{self.refs[ref]['source']}]({self.refs[ref]['link']})"
+
+        return _BARE_RE.sub(bare, _LINK_RE.sub(link, text))
+
+    @staticmethod
+    def _report(resolved: List[str], invalid: List[str]) -> None:
+        if resolved:
+            METRICS.inc('prompt_refs', len(resolved), result='resolved')
+        if invalid:
+            METRICS.inc('prompt_refs', len(invalid), result='invalid')
+            logger.warning(f"  ⚠️ 존재하지 않는 기사 ID {len(invalid)}개 (링크 제거): {', '.join(sorted(set(invalid)))}")
+
+    def decode_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        스트리밍 조각 복원
+
+        ID가 조각 경계에서 잘릴 수 있으므로, 마지막 '[' 이후가
+        같은 줄에서 끝나지 않았으면 다음 조각까지 보류합니다.
+        없는 ID 경고는 스트림이 끝난 뒤 한 번만 남깁니다.
+        """
+        resolved: List[str] = []
+        invalid: List[str] = []
+        pending = ''
+        for chunk in chunks:
+            pending += chunk
+            start = pending.rfind('[')
+            cut = len(pending) if start == -1 or '\n' in pending[start:] else start
+            if cut:
+                yield self._decode(pending[:cut], resolved, invalid)
+                pending = pending[cut:]
+        if pending:
+            yield self._decode(pending, resolved, invalid)
+        self._report(resolved, invalid)
+
+
+def get_codec(config: Dict, articles: List[Dict]) -> Optional[PromptCodec]:
+    """ai.short_link_ids 또는 구조화 출력이 켜져 있으면 코덱 생성"""
+    ai_config = config.get('ai', {})
+    if not (ai_config.get('short_link_ids', False)
+            or ai_config.get('structured_output', {}).get('enabled', False)):
+        return None
+    return PromptCodec.from_articles(articles)
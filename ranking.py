@@ -0,0 +1,131 @@
+"""
+로컬 관련도 사전 순위 (BM25 + 소스 우선순위 + 매체 수 + 최신성)
+Gemini에 보내기 전에 다이제스트 주제 키워드로 기사를 점수화해
+상위 후보만 프롬프트에 넣습니다.
+
+키워드 끝의 *는 접두어 일치 (예: "ekonomi*" → ekonomi, ekonominya)
+관련도는 제목으로만 계산합니다. (본문 보강은 순위로 고른 기사에만, 순위 이후에 실행)
+"""
+
+import re
+import math
+import logging
+import unicodedata
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r'[\W_]+', re.UNICODE)
+
+DEFAULT_WEIGHTS = {
+    'relevance': 0.6,
+    'coverage': 0.2,
+    'priority': 0.1,
+    'recency': 0.1,
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """소문자 + NFKC 정규화 후 단어 분리"""
+    text = unicodedata.normalize('NFKC', text or '').lower()
+    return [t for t in _TOKEN_RE.split(text) if t]
+
+
+def _query_terms(topics: Dict[str, List[str]]) -> Tuple[Set[str], Tuple[str, ...]]:
+    """주제별 키워드 → (정확히 일치할 단어, 접두어)"""
+    exact: Set[str] = set()
+    prefixes: Set[str] = set()
+    for keywords in topics.values():
+        for keyword in keywords or []:
+            if keyword.endswith('*'):
+                prefixes.update(tokenize(keyword[:-1]))
+            else:
+                exact.update(tokenize(keyword))
+    return exact, tuple(sorted(prefixes))
+
+
+class BM25:
+    """문서 집합 1개에 대한 BM25 (k1, b 표준값)"""
+
+    def __init__(self, documents: List[List[str]], k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.term_counts = [Counter(doc) for doc in documents]
+        self.lengths = [len(doc) for doc in documents]
+        self.average_length = (sum(self.lengths) / len(documents)) if documents else 0
+        self.document_frequency: Counter = Counter()
+        for counts in self.term_counts:
+            self.document_frequency.update(counts.keys())
+        self.size = len(documents)
+
+    def idf(self, term: str) -> float:
+        df = self.document_frequency.get(term, 0)
+        return math.log(1 + (self.size - df + 0.5) / (df + 0.5))
+
+    def scores(self, exact: Set[str], prefixes: Tuple[str, ...] = ()) -> List[float]:
+        """문서별 점수 (질의어는 가중치 1)"""
+        # 질의어 = 정확 일치 단어 + 접두어에 걸리는 코퍼스 단어
+        terms = {t for t in exact if t in self.document_frequency}
+        if prefixes:
+            terms.update(t for t in self.document_frequency if t.startswith(prefixes))
+        idf = {t: self.idf(t) for t in terms}
+
+        results = []
+        for counts, length in zip(self.term_counts, self.lengths):
+            norm = self.k1 * (1 - self.b + self.b * length / (self.average_length or 1))
+            score = 0.0
+            for term in terms & counts.keys():
+                tf = counts[term]
+                score += idf[term] * tf * (self.k1 + 1) / (tf + norm)
+            results.append(score)
+        return results
+
+
+def _normalized(values: List[float]) -> List[float]:
+    peak = max(values, default=0)
+    return [v / peak for v in values] if peak > 0 else [0.0] * len(values)
+
+
+def rank_articles(articles: List[Dict], config: Dict[str, Any],
+                  now: Optional[datetime] = None) -> List[Dict]:
+    """
+    기사 점수화 → 점수 높은 순 (동점이면 원래 순서)
+
+    각 기사에 'score'(0~1)가 추가됩니다.
+    주제 키워드가 없으면 관련도 없이 매체 수/우선순위/최신성만 사용합니다.
+    """
+    if not articles:
+        return []
+
+    ranking_config = config.get('ranking', {})
+    weights = {**DEFAULT_WEIGHTS, **(ranking_config.get('weights') or {})}
+    hours_threshold = config.get('collection', {}).get('hours_threshold', 24)
+    priorities = {f.get('name'): f.get('priority', 999) for f in config.get('rss_feeds', [])}
+    now = now or datetime.now()
+
+    documents = [tokenize(a.get('title', '')) for a in articles]
+    exact, prefixes = _query_terms(ranking_config.get('topics') or {})
+    relevance = _normalized(BM25(documents).scores(exact, prefixes)) if (exact or prefixes) \
+        else [0.0] * len(articles)
+
+    coverage = _normalized([math.log1p(len(a.get('alt_sources') or [])) for a in articles])
+    priority = [1 / max(priorities.get(a.get('source'), 999), 1) for a in articles]
+
+    recency = []
+    for article in articles:
+        published = article.get('published')
+        if isinstance(published, datetime):
+            age_hours = (now - published).total_seconds() / 3600
+            recency.append(max(0.0, 1 - age_hours / max(hours_threshold, 1)))
+        else:
+            recency.append(0.0)
+
+    scored = []
+    for i, article in enumerate(articles):
+        score = (weights['relevance'] * relevance[i] + weights['coverage'] * coverage[i]
+                 + weights['priority'] * priority[i] + weights['recency'] * recency[i])
+        scored.append((-score, i, {**article, 'score': round(score, 4)}))
+    scored.sort(key=lambda item: item[:2])
+    return [article for _, _, article in scored]
@@ -0,0 +1,144 @@
+"""
+실행 저널 (단계별 체크포인트)
+수집 → 프롬프트 → 요약 → 발송 각 단계의 결과를 저장해
+--resume 실행 시 완료된 단계는 건너뛰고 남은 메시지만 발송합니다.
+"""
+
+import os
+import json
+import logging
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def encode_articles(articles: List[Dict]) -> List[Dict]:
+    """기사 목록 → JSON 직렬화 가능 형태"""
+    return [
+        {**a, 'published': a['published'].isoformat()} if isinstance(a.get('published'), datetime) else a
+        for a in articles
+    ]
+
+
+def decode_articles(articles: List[Dict]) -> List[Dict]:
+    """JSON → 기사 목록 (published 복원)"""
+    return [
+        {**a, 'published': datetime.fromisoformat(a['published'])} if a.get('published') else a
+        for a in articles
+    ]
+
+
+class RunJournal:
+    """실행 1회의 단계별 체크포인트 (JSON 파일 1개)"""
+
+    def __init__(self, path: Path, data: Optional[Dict[str, Any]] = None,
+                 scope: str = '', lock: Optional[threading.Lock] = None):
+        self.path = path
+        self.scope = scope
+        self.data = data or {
+            'run_id': path.stem,
+            'started_at': datetime.now().isoformat(),
+            'stages': {},
+            'delivered': {},
+        }
+        self._lock = lock or threading.Lock()
+
+    @classmethod
+    def start(cls, directory: str) -> 'RunJournal':
+        """새 저널 시작 (이전 저널 정리)"""
+        journal_dir = Path(directory)
+        journal_dir.mkdir(parents=True, exist_ok=True)
+        for old in journal_dir.glob('run-*.json'):
+            old.unlink()
+
+        run_id = datetime.now().strftime('run-%Y%m%d-%H%M%S')
+        journal = cls(journal_dir / f"{run_id}.json")
+        journal._write()
+        return journal
+
+    @classmethod
+    def resume(cls, directory: str) -> Optional['RunJournal']:
+        """가장 최근 미완료 저널 로드 (없으면 None)"""
+        journal_dir = Path(directory)
+        candidates = sorted(journal_dir.glob('run-*.json')) if journal_dir.exists() else []
+
+        for path in reversed(candidates):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️ 저널 손상, 무시: {path} - {e}")
+                continue
+            if not data.get('completed'):
+                if isinstance(data.get('delivered'), list):
+                    data['delivered'] = {'': data['delivered']}
+                return cls(path, data)
+        return None
+
+    @property
+    def run_id(self) -> str:
+        return self.data['run_id']
+
+    def scoped(self, name: str) -> 'RunJournal':
+        """하위 범위 저널 (다이제스트/채팅별 단계 구분, 같은 파일 공유)"""
+        scope = f"{self.scope}/{name}" if self.scope else name
+        return RunJournal(self.path, self.data, scope, self._lock)
+
+    def _key(self, stage: str) -> str:
+        return f"{self.scope}/{stage}" if self.scope else stage
+
+    def has(self, stage: str) -> bool:
+        """단계 완료 여부"""
+        return self._key(stage) in self.data['stages']
+
+    def get(self, stage: str, default: Any = None) -> Any:
+        """단계 결과 조회"""
+        return self.data['stages'].get(self._key(stage), default)
+
+    def save(self, stage: str, value: Any) -> None:
+        """단계 결과 저장 (즉시 디스크 기록)"""
+        with self._lock:
+            self.data['stages'][self._key(stage)] = value
+            self._write()
+
+    @property
+    def delivered(self) -> set:
+        """발송 완료된 메시지 인덱스"""
+        return set(self.data['delivered'].get(self.scope, []))
+
+    def mark_delivered(self, index: int) -> None:
+        """메시지 1개 발송 완료 기록"""
+        with self._lock:
+            delivered = self.data['delivered'].setdefault(self.scope, [])
+            if index not in delivered:
+                delivered.append(index)
+                self._write()
+
+    def reset_delivered(self) -> None:
+        """발송 기록 초기화 (요약을 새로 만들 때, 하위 범위 포함)"""
+        with self._lock:
+            prefix = f"{self.scope}/" if self.scope else ''
+            stale = [k for k in self.data['delivered']
+                     if k == self.scope or k.startswith(prefix)]
+            if stale:
+                for key in stale:
+                    del self.data['delivered'][key]
+                self._write()
+
+    def complete(self) -> None:
+        """전체 완료 → 저널 삭제"""
+        self.data['completed'] = True
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _write(self) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,146 @@
+"""
+내부 스케줄러 (cron 5필드: 분 시 일 월 요일)
+데몬 모드에서 GitHub Actions cron 대신 다음 실행 시각을 계산합니다.
+
+지원 문법: *, 숫자, a-b, */n, a-b/n, 쉼표 목록 (요일 0과 7 = 일요일)
+일/요일이 모두 지정되면 cron과 같이 둘 중 하나만 맞아도 실행합니다.
+"""
+
+import logging
+from datetime import datetime, timedelta, tzinfo
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (이름, 최소, 최대)
+_FIELDS = [
+    ('minute', 0, 59),
+    ('hour', 0, 23),
+    ('day', 1, 31),
+    ('month', 1, 12),
+    ('weekday', 0, 7),
+]
+
+
+class CronError(ValueError):
+    """잘못된 cron 표현식"""
+
+
+def _parse_field(text: str, name: str, low: int, high: int) -> Set[int]:
+    values = set()
+    for part in text.split(','):
+        step = 1
+        if '/' in part:
+            part, step_text = part.split('/', 1)
+            if not step_text.isdigit() or int(step_text) == 0:
+                raise CronError(f"{name}: 잘못된 간격 '{step_text}'")
+            step = int(step_text)
+
+        if part == '*':
+            start, end = low, high
+        elif '-' in part:
+            start_text, end_text = part.split('-', 1)
+            if not (start_text.isdigit() and end_text.isdigit()):
+                raise CronError(f"{name}: 잘못된 범위 '{part}'")
+            start, end = int(start_text), int(end_text)
+        elif part.isdigit():
+            start = end = int(part)
+            if step > 1:
+                end = high  # "5/15" = 5부터 15 간격
+        else:
+            raise CronError(f"{name}: 잘못된 값 '{part}'")
+
+        if not (low <= start <= end <= high):
+            raise CronError(f"{name}: {low}~{high} 범위를 벗어남 '{part}'")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronSchedule:
+    """cron 표현식 1개"""
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise CronError(f"cron 표현식은 5필드여야 함: '{expression}'")
+
+        self.expression = expression
+        parsed = [_parse_field(text, *spec) for text, spec in zip(fields, _FIELDS)]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        # cron 요일(0=일) → Python weekday(0=월)
+        self.weekdays = {(d - 1) % 7 for d in weekdays}
+        self._any_day = fields[2] == '*'
+        self._any_weekday = fields[4] == '*'
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        weekday_ok = moment.weekday() in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        """moment 이후(초과) 첫 실행 시각"""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=366 * 5)
+
+        while candidate < limit:
+            if candidate.month not in self.months:
+                # 다음 달 1일 0시로
+                year = candidate.year + candidate.month // 12
+                month = candidate.month % 12 + 1
+                candidate = candidate.replace(year=year, month=month, day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+                continue
+            if candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+                continue
+            return candidate
+
+        raise CronError(f"실행 시각 없음: '{self.expression}'")
+
+
+def build_schedules(daemon_config: Dict[str, Any]) -> List[Tuple[CronSchedule, Optional[List[str]]]]:
+    """
+    daemon.schedules → [(스케줄, 다이제스트 이름 목록 또는 None=전체)]
+
+    항목은 "50 23 * * *" 문자열 또는 {cron: ..., digests: [...]} 형식입니다.
+    """
+    schedules = []
+    for entry in daemon_config.get('schedules') or []:
+        if isinstance(entry, str):
+            schedules.append((CronSchedule(entry), None))
+        else:
+            schedules.append((CronSchedule(entry['cron']), entry.get('digests')))
+    return schedules
+
+
+def next_run(schedules: List[Tuple[CronSchedule, Optional[List[str]]]], moment: datetime
+             ) -> Tuple[datetime, Optional[List[str]]]:
+    """
+    가장 빠른 다음 실행 → (시각, 다이제스트 목록)
+
+    같은 시각에 여러 스케줄이 겹치면 다이제스트 목록을 합칩니다 (하나라도 전체면 전체).
+    """
+    upcoming = [(schedule.next_after(moment), digests) for schedule, digests in schedules]
+    when = min(at for at, _ in upcoming)
+
+    names: Optional[List[str]] = []
+    for at, digests in upcoming:
+        if at != when:
+            continue
+        if digests is None:
+            names = None
+            break
+        names.extend(d for d in digests if d not in names)
+    return when, names
+
+
+def now_in(timezone: Optional[tzinfo]) -> datetime:
+    """스케줄 기준 현재 시각 (시간대 없으면 로컬 시각)"""
+    return datetime.now(timezone).replace(tzinfo=None) if timezone else datetime.now()
@@ -0,0 +1,156 @@
+"""
+발송 이력 저장소 (SQLite)
+이전 다이제스트에 이미 포함된 기사를 식별해 다시 요약하지 않도록 합니다.
+"""
+
+import os
+import re
+import time
+import hashlib
+import logging
+import sqlite3
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+logger = logging.getLogger(__name__)
+
+# 추적용 쿼리 파라미터 (링크 정규화 시 제거)
+TRACKING_PREFIXES = ('utm_', 'mc_')
+TRACKING_PARAMS = {'fbclid', 'gclid', 'ref', 'src'}
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# SQLite 파라미터 개수 제한 대비 조회 단위
+_QUERY_CHUNK = 500
+
+
+def normalize_link(link: str) -> str:
+    """링크 정규화 (스킴/호스트 소문자, 추적 파라미터·프래그먼트·끝 슬래시 제거)"""
+    if not link:
+        return ''
+
+    parts = urlsplit(link.strip())
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith(TRACKING_PREFIXES) and k.lower() not in TRACKING_PARAMS
+    ))
+    path = parts.path.rstrip('/') or '/'
+    host = (parts.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    if parts.port:
+        host = f"{host}:{parts.port}"
+
+    return urlunsplit(('', host, path, query, ''))
+
+
+def normalize_title(title: str) -> str:
+    """제목 정규화 (소문자 + 공백 정리)"""
+    return _WHITESPACE_RE.sub(' ', (title or '').strip().lower())
+
+
+def _hash_key(kind: str, value: str) -> int:
+    """식별자 → 64비트 정수 키"""
+    digest = hashlib.blake2b(f"{kind}:{value}".encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+def article_keys(article: Dict, namespace: str = '') -> List[int]:
+    """기사 식별 키 목록 (정규화 링크 + GUID 또는 제목 해시, namespace별 구분)"""
+    prefix = f"{namespace}#" if namespace else ''
+    keys = []
+    link = normalize_link(article.get('link', ''))
+    if link:
+        keys.append(_hash_key('link', f"{prefix}{link}"))
+
+    source = article.get('source', '')
+    guid = (article.get('guid') or '').strip()
+    if guid:
+        keys.append(_hash_key('guid', f"{prefix}{source}|{guid}"))
+    else:
+        keys.append(_hash_key('title', f"{prefix}{source}|{normalize_title(article.get('title', ''))}"))
+
+    return keys
+
+
+class SeenStore:
+    """기사 식별자 저장소 (정수 PK 인덱스 + TTL 만료)"""
+
+    def __init__(self, path: str, ttl_days: float = 7):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.ttl_seconds = ttl_days * 86400
+        self._conn = sqlite3.connect(path)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS seen ('
+            ' key INTEGER PRIMARY KEY,'
+            ' seen_at INTEGER NOT NULL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_seen_at ON seen(seen_at)')
+        self._conn.commit()
+
+    @classmethod
+    def from_config(cls, config: Dict) -> Optional['SeenStore']:
+        """설정에서 저장소 생성 (비활성화 시 None)"""
+        history_config = config.get('history', {})
+        if not history_config.get('enabled', False):
+            return None
+
+        cache_dir = config.get('cache', {}).get('directory', '.cache')
+        path = history_config.get('path') or os.path.join(cache_dir, 'seen.sqlite3')
+        store = cls(path, history_config.get('ttl_days', 7))
+        store.purge_expired()
+        return store
+
+    def _known_keys(self, keys: List[int]) -> set:
+        cutoff = int(time.time() - self.ttl_seconds)
+        known = set()
+        for i in range(0, len(keys), _QUERY_CHUNK):
+            chunk = keys[i:i + _QUERY_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self._conn.execute(
+                f'SELECT key FROM seen WHERE seen_at >= ? AND key IN ({placeholders})',
+                [cutoff, *chunk]
+            )
+            known.update(row[0] for row in rows)
+        return known
+
+    def filter_new(self, articles: List[Dict], namespace: str = '') -> List[Dict]:
+        """이미 발송된 기사 제거 (순서 유지, namespace = 다이제스트 구분)"""
+        if not articles:
+            return articles
+
+        per_article = [article_keys(a, namespace) for a in articles]
+        known = self._known_keys([k for keys in per_article for k in keys])
+
+        return [
+            article for article, keys in zip(articles, per_article)
+            if not any(k in known for k in keys)
+        ]
+
+    def mark_delivered(self, articles: List[Dict], namespace: str = '') -> None:
+        """발송 완료 기사 기록"""
+        now = int(time.time())
+        rows = [(k, now) for a in articles for k in article_keys(a, namespace)]
+        with self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO seen (key, seen_at) VALUES (?, ?)', rows
+            )
+        logger.debug(f"발송 이력 기록: {len(articles)}개 기사")
+
+    def purge_expired(self) -> int:
+        """TTL 지난 기록 삭제"""
+        cutoff = int(time.time() - self.ttl_seconds)
+        with self._conn:
+            removed = self._conn.execute('DELETE FROM seen WHERE seen_at < ?', (cutoff,)).rowcount
+        if removed:
+            logger.debug(f"발송 이력 정리: {removed}개 만료")
+        return removed
+
+    def close(self) -> None:
+        self._conn.close()
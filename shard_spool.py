@@ -0,0 +1,164 @@
+"""
+분산 수집 (샤드별 수집 → 스풀 파일 → 병합)
+피드 이름의 rendezvous 해시로 피드를 샤드에 배정하므로
+샤드 수가 바뀌어도 이동하는 피드가 최소이고, 머신/프로세스와 무관하게 결정적입니다.
+
+스풀 파일: gzip JSONL (1행 헤더, 이후 피드당 1행)
+병합 결과는 단일 프로세스 수집과 같은 피드 순서를 유지합니다.
+
+파일 이름과 헤더에 실행 ID를 넣어 같은 실행의 샤드만 병합하고,
+수집 기간보다 오래된 스풀은 거부합니다. 병합 후에는 스풀을 삭제합니다.
+"""
+
+import os
+import re
+import gzip
+import time
+import json
+import hashlib
+import logging
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from run_journal import encode_articles, decode_articles
+
+logger = logging.getLogger(__name__)
+
+SPOOL_VERSION = 2
+
+# 실행 ID 미지정 시 (--run-id, GITHUB_RUN_ID 모두 없을 때)
+LOCAL_RUN_ID = 'local'
+
+_RUN_ID_RE = re.compile(r'^[A-Za-z0-9._-]{1,64}$')
+
+
+class ShardError(ValueError):
+    """잘못된 샤드 지정 / 스풀 누락"""
+
+
+def parse_shard(text: str) -> Tuple[int, int]:
+    """'i/N' → (i, N), i는 0부터 N-1"""
+    try:
+        index_text, count_text = text.split('/')
+        index, count = int(index_text), int(count_text)
+    except ValueError:
+        raise ShardError(f"샤드 형식은 i/N이어야 함: '{text}'")
+    if not (count >= 1 and 0 <= index < count):
+        raise ShardError(f"샤드 번호는 0~N-1이어야 함: '{text}'")
+    return index, count
+
+
+def resolve_run_id(value: Optional[str] = None) -> str:
+    """실행 ID (인자 → GITHUB_RUN_ID → 'local')"""
+    run_id = value or os.environ.get('GITHUB_RUN_ID') or LOCAL_RUN_ID
+    if not _RUN_ID_RE.match(run_id):
+        raise ShardError(f"실행 ID는 영문/숫자/._- 1~64자여야 함: '{run_id}'")
+    return run_id
+
+
+def shard_of(name: str, count: int) -> int:
+    """피드 이름 → 샤드 번호 (rendezvous / HRW 해시)"""
+    def weight(shard: int) -> bytes:
+        return hashlib.sha256(f"{shard}:{name}".encode('utf-8')).digest()
+    return max(range(count), key=weight)
+
+
+def select_shard(feeds: List[Dict], index: int, count: int) -> List[Dict]:
+    """샤드에 배정된 피드만 (설정 순서 유지)"""
+    return [f for f in feeds if shard_of(f.get('name', ''), count) == index]
+
+
+def feeds_fingerprint(feeds: List[Dict]) -> str:
+    """피드 구성 지문 (샤드마다 다른 설정으로 수집했는지 확인용)"""
+    names = '\n'.join(f.get('name', '') for f in feeds if f.get('enabled', False))
+    return hashlib.sha256(names.encode('utf-8')).hexdigest()[:16]
+
+
+def spool_path(directory: str, run_id: str, index: int, count: int) -> Path:
+    return Path(directory) / f"shard-{run_id}-{index}-of-{count}.jsonl.gz"
+
+
+def _run_spools(directory: str, run_id: str) -> List[Path]:
+    return sorted(Path(directory).glob(f"shard-{run_id}-*-of-*.jsonl.gz"))
+
+
+def write_spool(directory: str, run_id: str, index: int, count: int, fingerprint: str,
+                per_feed: Dict[str, List[Dict]]) -> Path:
+    """샤드 수집 결과 저장 (원자적 쓰기)"""
+    path = spool_path(directory, run_id, index, count)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    header = {
+        'version': SPOOL_VERSION,
+        'run_id': run_id,
+        'shard': index,
+        'count': count,
+        'fingerprint': fingerprint,
+        'created_at': datetime.now().isoformat(),
+    }
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    with os.fdopen(fd, 'wb') as raw, gzip.open(raw, 'wt', encoding='utf-8') as f:
+        f.write(json.dumps(header, separators=(',', ':')) + '\n')
+        for feed, articles in per_feed.items():
+            line = {'feed': feed, 'articles': encode_articles(articles)}
+            f.write(json.dumps(line, ensure_ascii=False, separators=(',', ':')) + '\n')
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_spools(directory: str, run_id: str, fingerprint: str,
+                max_age_seconds: Optional[float] = None) -> Dict[str, List[Dict]]:
+    """
+    실행 1회의 샤드 스풀 읽기 → {피드 이름: 기사 목록}
+
+    Raises:
+        ShardError: 스풀이 없거나 샤드가 빠졌거나 샤드 수/피드 구성이 다르거나
+                    max_age_seconds보다 오래됐을 때
+    """
+    paths = _run_spools(directory, run_id)
+    if not paths:
+        raise ShardError(f"스풀 파일 없음: {directory} (실행 ID {run_id})")
+
+    per_feed: Dict[str, List[Dict]] = {}
+    shards = set()
+    counts = set()
+    for path in paths:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            header = json.loads(f.readline())
+            if header.get('version') != SPOOL_VERSION:
+                raise ShardError(f"스풀 버전 불일치: {path.name}")
+            if header.get('run_id') != run_id:
+                raise ShardError(f"실행 ID가 다른 스풀: {path.name}")
+            if header.get('fingerprint') != fingerprint:
+                raise ShardError(f"피드 구성이 다른 스풀: {path.name}")
+            age = (datetime.now() - datetime.fromisoformat(header['created_at'])).total_seconds()
+            if max_age_seconds is not None and age > max_age_seconds:
+                raise ShardError(f"오래된 스풀 ({age / 3600:.1f}시간 전): {path.name}")
+            shards.add(header['shard'])
+            counts.add(header['count'])
+            for line in f:
+                record = json.loads(line)
+                per_feed[record['feed']] = decode_articles(record['articles'])
+
+    if len(counts) != 1:
+        raise ShardError(f"샤드 수가 다른 스풀이 섞여 있음: {sorted(counts)}")
+    count = counts.pop()
+    missing = sorted(set(range(count)) - shards)
+    if missing:
+        raise ShardError(f"누락된 샤드: {', '.join(f'{i}/{count}' for i in missing)}")
+
+    logger.info(f"📦 스풀 병합: 샤드 {count}개, 피드 {len(per_feed)}개")
+    return per_feed
+
+
+def remove_spools(directory: str, run_id: str, max_age_seconds: Optional[float] = None) -> int:
+    """병합한 실행의 스풀 + (max_age_seconds 지정 시) 다른 실행의 오래된 스풀 삭제"""
+    paths = set(_run_spools(directory, run_id))
+    if max_age_seconds is not None:
+        cutoff = time.time() - max_age_seconds
+        paths.update(p for p in Path(directory).glob('shard-*.jsonl.gz') if p.stat().st_mtime < cutoff)
+    for path in paths:
+        path.unlink(missing_ok=True)
+    return len(paths)
@@ -0,0 +1,111 @@
+"""
+구조화 출력 (JSON 스키마 응답 → 로컬 검증 → 템플릿 렌더링)
+Gemini에 항목 배열(JSON)을 요청하고, 항목별로 검증해 빠진 개수만 다시 요청합니다.
+텔레그램 본문은 모델 출력이 아니라 digest_template으로 만듭니다.
+
+항목: {"id": 기사 ID, "title": 번역 제목, "summary": 요약, "rank": 순위}
+"""
+
+import json
+import logging
+from typing import Any, Dict, List, Sequence, Tuple
+
+from prompt_codec import PromptCodec
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TEMPLATE = {
+    'header': "📰 **오늘의 핵심 뉴스**\n━━━━━━━━━━━━━━━━━━",
+    'item': "{number}. **[{source}]({link})** {title}\n   → {summary}",
+    'footer': "━━━━━━━━━━━━━━━━━━\n🤖 *AI 자동 요약*",
+}
+
+# 프롬프트 끝에 붙는 출력 형식 안내
+INSTRUCTION = (
+    "\n\n출력: JSON 배열만 출력하세요. 항목마다 "
+    "id(위 목록의 기사 ID), title(번역한 제목), summary(핵심 요약 1-2문장), "
+    "rank(중요도 순위, 1부터)를 넣으세요."
+)
+
+# 누락 항목 재요청 시 추가 안내
+FOLLOWUP = (
+    "\n\n이미 선택한 기사: {selected}\n"
+    "이 기사들을 제외하고 {missing}개만 더 선택해 같은 형식으로 출력하세요."
+)
+
+
+def response_schema(ids: Sequence[str]) -> Dict[str, Any]:
+    """응답 스키마 (id는 주어진 기사 ID로 제한)"""
+    return {
+        'type': 'array',
+        'items': {
+            'type': 'object',
+            'properties': {
+                'id': {'type': 'string', 'enum': list(ids)},
+                'title': {'type': 'string'},
+                'summary': {'type': 'string'},
+                'rank': {'type': 'integer'},
+            },
+            'required': ['id', 'title', 'summary', 'rank'],
+        },
+    }
+
+
+def parse_items(text: str, allowed: Sequence[str]) -> Tuple[List[Dict], List[str]]:
+    """
+    응답 JSON → (유효 항목, 문제 목록)
+
+    형식이 틀리거나 허용되지 않은/중복 ID인 항목은 버리고 나머지는 살립니다.
+    """
+    try:
+        data = json.loads(text)
+    except (TypeError, ValueError) as e:
+        return [], [f"JSON 파싱 실패: {e}"]
+    if isinstance(data, dict):
+        data = data.get('items', [])
+    if not isinstance(data, list):
+        return [], ["항목 배열이 아님"]
+
+    allowed_ids = set(allowed)
+    items: List[Dict] = []
+    problems: List[str] = []
+    seen = set()
+    for i, raw in enumerate(data, 1):
+        if not isinstance(raw, dict):
+            problems.append(f"#{i}: 객체가 아님")
+            continue
+        ref = raw.get('id')
+        title = raw.get('title')
+        summary = raw.get('summary')
+        rank = raw.get('rank')
+        if ref not in allowed_ids or ref in seen:
+            problems.append(f"#{i}: 잘못된/중복 ID {ref!r}")
+            continue
+        if not (isinstance(title, str) and title.strip() and isinstance(summary, str) and summary.strip()):
+            problems.append(f"#{i}: 제목/요약 누락 ({ref})")
+            continue
+        if isinstance(rank, bool) or not isinstance(rank, (int, float)):
+            rank = len(data) + i
+        seen.add(ref)
+        items.append({'id': ref, 'title': title.strip(), 'summary': summary.strip(), 'rank': rank})
+
+    items.sort(key=lambda item: item['rank'])
+    return items, problems
+
+
+def render_digest(items: List[Dict], codec: PromptCodec, template: Dict[str, str]) -> str:
+    """검증된 항목 → 텔레그램 본문 (번호는 1부터 다시 매김)"""
+    template = {**DEFAULT_TEMPLATE, **(template or {})}
+    lines = [template['header']] if template['header'] else []
+    for number, item in enumerate(items, 1):
+        ref = codec.refs[item['id']]
+        lines.append(template['item'].format(
+            number=number,
+            source=ref['source'],
+            link=ref['link'],
+            title=item['title'],
+            summary=item['summary'],
+        ))
+    if template['footer']:
+        lines.append(template['footer'])
+    return '\n\n'.join(lines)
@@ -0,0 +1,176 @@
+"""
+텔레그램 발송 큐 (토큰 버킷 + RetryAfter 재예약)
+전역/채팅별 속도 제한을 지키면서 여러 채팅으로 동시에 발송합니다.
+채팅 안에서는 메시지 순서를 유지합니다.
+토큰 버킷은 프로세스 전체에서 공유하므로 동시에 실행되는 다이제스트를
+합쳐도 전역/채팅별 한도를 넘지 않습니다.
+
+python-telegram-bot 13.x는 동기 API이므로 asyncio 스케줄러에서
+스레드 풀로 send_message를 실행합니다.
+"""
+
+import time
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Set
+
+import telegram
+
+from metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    초당 rate개, 최대 capacity개까지 누적되는 토큰 버킷
+
+    스레드/이벤트 루프 간 공유 가능 (토큰을 먼저 예약하고 부족분만큼 대기)
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 1개 예약 → 사용 가능해질 때까지 대기할 시간 (초)"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+
+    async def acquire(self) -> None:
+        """토큰 1개 획득 (부족하면 대기)"""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# 프로세스 전체 공유 버킷 (전역 1개 + 채팅별)
+_buckets_lock = threading.Lock()
+_global_bucket: Optional[TokenBucket] = None
+_chat_buckets: Dict[str, TokenBucket] = {}
+
+
+def get_global_bucket(rate: float) -> TokenBucket:
+    """전역 발송 버킷 (설정이 다르면 더 낮은 속도 적용)"""
+    global _global_bucket
+    with _buckets_lock:
+        if _global_bucket is None:
+            _global_bucket = TokenBucket(rate)
+        _global_bucket.rate = min(_global_bucket.rate, rate)
+        return _global_bucket
+
+
+def get_chat_bucket(chat_id: str, rate: float) -> TokenBucket:
+    """채팅별 발송 버킷 (같은 채팅이면 다이제스트가 달라도 공유)"""
+    with _buckets_lock:
+        key = str(chat_id)
+        bucket = _chat_buckets.get(key)
+        if bucket is None:
+            bucket = _chat_buckets[key] = TokenBucket(rate, capacity=1)
+        bucket.rate = min(bucket.rate, rate)
+        return bucket
+
+
+class DeliveryJob:
+    """채팅 1개로 보낼 메시지 목록"""
+
+    def __init__(self, chat_id: str, messages: List[str],
+                 delivered: Optional[Set[int]] = None,
+                 on_delivered: Optional[Callable[[int], None]] = None):
+        self.chat_id = chat_id
+        self.messages = messages
+        self.delivered = delivered or set()
+        self.on_delivered = on_delivered
+
+
+class DeliveryQueue:
+    """전역/채팅별 속도 제한 발송 큐"""
+
+    def __init__(self, send: Callable[[str, str], object], config: Dict):
+        """
+        Args:
+            send: (chat_id, text) → 발송 (동기 함수, 실패 시 예외)
+            config: 전체 설정 (telegram 섹션 사용)
+        """
+        telegram_config = config.get('telegram', {})
+        send_interval = telegram_config.get('send_interval', 0.5)
+
+        self.send = send
+        self.global_rate = telegram_config.get('global_rate', 25)
+        self.per_chat_rate = telegram_config.get('per_chat_rate', 1 / max(send_interval, 0.05))
+        self.max_concurrent = telegram_config.get('max_concurrent_sends', 8)
+        self.max_retries = telegram_config.get('max_send_retries', 5)
+
+    async def _send_one(self, executor, job: DeliveryJob, index: int,
+                        global_bucket: TokenBucket, chat_bucket: TokenBucket) -> bool:
+        loop = asyncio.get_running_loop()
+        total = len(job.messages)
+
+        for attempt in range(self.max_retries):
+            await global_bucket.acquire()
+            await chat_bucket.acquire()
+            try:
+                with METRICS.timer('telegram_send'):
+                    await loop.run_in_executor(executor, self.send, job.chat_id, job.messages[index])
+                METRICS.inc('telegram_messages', status='sent')
+                logger.info(f"  ✅ 메시지 {index+1}/{total} 발송 완료 ({job.chat_id})")
+                if job.on_delivered:
+                    job.on_delivered(index)
+                return True
+
+            except telegram.error.RetryAfter as e:
+                # 흐름 제어: 해당 채팅만 지정 시간 뒤로 재예약
+                METRICS.inc('telegram_messages', status='retry_after')
+                logger.warning(f"  ⏱️ 흐름 제어 ({job.chat_id}): {e.retry_after}초 후 재시도")
+                await asyncio.sleep(float(e.retry_after))
+
+            except (telegram.error.TimedOut, telegram.error.NetworkError) as e:
+                if isinstance(e, telegram.error.BadRequest):
+                    METRICS.inc('telegram_messages', status='failed')
+                    logger.error(f"  ❌ 발송 실패 ({job.chat_id}): {e}")
+                    return False
+                METRICS.inc('telegram_messages', status='network_error')
+                logger.warning(f"  ⚠️ 네트워크 오류 ({job.chat_id}) {attempt+1}/{self.max_retries}: {e}")
+                await asyncio.sleep(2 ** attempt)
+
+            except Exception as e:
+                METRICS.inc('telegram_messages', status='failed')
+                logger.error(f"  ❌ 발송 실패 ({job.chat_id}): {e}")
+                return False
+
+        METRICS.inc('telegram_messages', status='failed')
+        logger.error(f"  ❌ 재시도 초과 ({job.chat_id}): 메시지 {index+1}/{total}")
+        return False
+
+    async def _send_job(self, executor, job: DeliveryJob, global_bucket: TokenBucket) -> bool:
+        chat_bucket = get_chat_bucket(job.chat_id, self.per_chat_rate)
+        for index in range(len(job.messages)):
+            if index in job.delivered:
+                logger.info(f"  ⏭️ 메시지 {index+1}/{len(job.messages)} 이미 발송됨 ({job.chat_id})")
+                continue
+            if not await self._send_one(executor, job, index, global_bucket, chat_bucket):
+                return False
+        return True
+
+    async def _run(self, jobs: List[DeliveryJob]) -> List[bool]:
+        global_bucket = get_global_bucket(self.global_rate)
+        with ThreadPoolExecutor(max_workers=self.max_concurrent,
+                                thread_name_prefix='telegram') as executor:
+            return list(await asyncio.gather(
+                *(self._send_job(executor, job, global_bucket) for job in jobs)
+            ))
+
+    def deliver(self, jobs: List[DeliveryJob]) -> List[bool]:
+        """모든 작업 발송 → 작업별 성공 여부"""
+        if not jobs:
+            return []
+        return asyncio.run(self._run(jobs))
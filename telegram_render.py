@@ -0,0 +1,192 @@
+"""
+텔레그램 렌더러 (한 번의 선형 변환 + 경계 인식 분할)
+모델이 생성한 마크다운(**굵게**, [텍스트](링크))을 parse_mode에 맞는
+텔레그램 서식으로 변환하고, 변환 후 길이 기준으로 항목/줄 경계에서 분할합니다.
+
+서식은 줄 안에서만 적용되므로(굵게가 줄을 넘으면 일반 문자로 처리)
+줄 단위 렌더링 결과를 이어 붙인 것과 전체 렌더링 결과가 같습니다.
+"""
+
+import re
+from typing import List, Optional
+
+# ═══════════════════════════════════════════════════════════════
+# 이스케이프 테이블 (str.translate 1회)
+# ═══════════════════════════════════════════════════════════════
+
+_MARKDOWN_SPECIAL = '_*[]()~`>#+-=|{}.!'
+
+_HTML_TEXT = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+_HTML_ATTR = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+_MARKDOWN_V2_TEXT = str.maketrans({c: f'\\{c}' for c in _MARKDOWN_SPECIAL + '\\'})
+_MARKDOWN_V2_URL = str.maketrans({')': '\\)', '\\': '\\\\'})
+_MARKDOWN_LEGACY = str.maketrans({c: f'\\{c}' for c in _MARKDOWN_SPECIAL})
+
+# **, [텍스트](링크), 줄바꿈 (링크 안의 괄호는 한 단계까지 짝이 맞으면 허용, 예: wiki/A_(B))
+_TOKEN_RE = re.compile(r'\*\*|\[([^\]\n]+)\]\(((?:[^()\s]|\([^()\s]*\))+)\)|\n')
+
+# 모드별 (본문 이스케이프, 링크 URL 이스케이프, 굵게 열기, 굵게 닫기, 링크 형식)
+_FORMATS = {
+    'HTML': (_HTML_TEXT, _HTML_ATTR, '<b>', '</b>', '<a href="{url}">{text}</a>'),
+    'MarkdownV2': (_MARKDOWN_V2_TEXT, _MARKDOWN_V2_URL, '*', '*', '[{text}]({url})'),
+}
+
+
+def escape_markdown(text: str) -> str:
+    """Markdown 특수문자 이스케이프 (parse_mode=Markdown, 1회 변환)"""
+    return text.translate(_MARKDOWN_LEGACY)
+
+
+def _convert(text: str, parse_mode: str) -> str:
+    """마크다운 → HTML / MarkdownV2 (선형 1회 순회)"""
+    text_table, url_table, bold_open, bold_close, link_format = _FORMATS[parse_mode]
+    literal_bold = '**'.translate(text_table)
+
+    out: List[str] = []
+    bold_at: Optional[int] = None  # 열린 굵게 태그의 out 위치
+    pos = 0
+
+    def close_line():
+        # 닫히지 않은 ** → 일반 문자
+        nonlocal bold_at
+        if bold_at is not None:
+            out[bold_at] = literal_bold
+            bold_at = None
+
+    for match in _TOKEN_RE.finditer(text):
+        if match.start() > pos:
+            out.append(text[pos:match.start()].translate(text_table))
+        pos = match.end()
+
+        token = match.group(0)
+        if token == '**':
+            if bold_at is None:
+                bold_at = len(out)
+                out.append(bold_open)
+            else:
+                out.append(bold_close)
+                bold_at = None
+        elif token == '\n':
+            close_line()
+            out.append('\n')
+        else:
+            out.append(link_format.format(
+                text=match.group(1).translate(text_table),
+                url=match.group(2).translate(url_table)
+            ))
+
+    if pos < len(text):
+        out.append(text[pos:].translate(text_table))
+    close_line()
+    return ''.join(out)
+
+
+def render(text: str, parse_mode: Optional[str], escape: bool = True) -> str:
+    """
+    발송용 텍스트 변환
+
+    Args:
+        parse_mode: 'HTML' / 'MarkdownV2' (마크다운 변환), 'Markdown' (이스케이프), None (그대로)
+        escape: parse_mode='Markdown'일 때 특수문자 이스케이프 여부
+    """
+    if parse_mode in _FORMATS:
+        return _convert(text, parse_mode)
+    if parse_mode == 'Markdown' and escape:
+        return escape_markdown(text)
+    return text
+
+
+# ═══════════════════════════════════════════════════════════════
+# 경계 인식 분할
+# ═══════════════════════════════════════════════════════════════
+
+_BLOCK_SEPARATOR = re.compile(r'\n\s*\n')
+
+
+def _hard_split(text: str, max_length: int, measure) -> List[str]:
+    """공백 없는 긴 문자열 → 변환 후 길이 기준 강제 분할"""
+    pieces = []
+    while text:
+        # 변환 후 길이가 max_length 이하인 최대 접두사 (이분 탐색)
+        low, high = 1, len(text)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if measure(text[:mid]) <= max_length:
+                low = mid
+            else:
+                high = mid - 1
+        pieces.append(text[:low])
+        text = text[low:]
+    return pieces
+
+
+def _pack(units: List[str], separator: str, max_length: int, measure) -> List[str]:
+    """단위들을 구분자로 이어 max_length 이하 묶음으로 (탐욕적)"""
+    # 줄 경계에서는 서식이 끊기므로 길이를 더하기만 하면 되고,
+    # 단어 경계에서는 링크/굵게가 걸칠 수 있어 이은 결과를 다시 잰다
+    additive = '\n' in separator
+    chunks: List[str] = []
+    current: List[str] = []
+    size = 0
+
+    for unit in units:
+        if not current:
+            current, size = [unit], measure(unit)
+            continue
+        if additive:
+            candidate = size + len(separator) + measure(unit)
+        else:
+            candidate = measure(separator.join(current + [unit]))
+        if candidate > max_length:
+            chunks.append(separator.join(current))
+            current, size = [unit], measure(unit)
+        else:
+            current.append(unit)
+            size = candidate
+
+    if current:
+        chunks.append(separator.join(current))
+    return chunks
+
+
+def _split_unit(text: str, separator: str, max_length: int, measure) -> List[str]:
+    """max_length를 넘는 단위 → 더 작은 경계(줄 → 단어 → 문자)로 분할"""
+    if measure(text) <= max_length:
+        return [text]
+    if separator == '\n':
+        parts = text.split('\n')
+        next_separator = ' '
+    elif separator == ' ':
+        parts = text.split(' ')
+        next_separator = ''
+    else:
+        return _hard_split(text, max_length, measure)
+
+    units = []
+    for part in parts:
+        units.extend(_split_unit(part, next_separator, max_length, measure))
+    return _pack(units, separator, max_length, measure)
+
+
+def split_message(text: str, max_length: int, parse_mode: Optional[str] = None,
+                  escape: bool = True) -> List[str]:
+    """
+    원문을 항목(빈 줄) → 줄 → 단어 경계에서 분할
+
+    각 조각은 render() 후 길이가 max_length 이하입니다.
+    조각은 원문 그대로 반환하며, 발송 시 render()로 변환합니다.
+    앞부분이 같은 두 텍스트는 마지막 조각을 제외하고 분할 결과가 같습니다.
+    """
+    text = text.strip()
+    if not text:
+        return []
+
+    def measure(unit: str) -> int:
+        return len(render(unit, parse_mode, escape))
+
+    blocks = [b.strip() for b in _BLOCK_SEPARATOR.split(text)]
+    units = []
+    for block in blocks:
+        if block:
+            units.extend(_split_unit(block, '\n', max_length, measure))
+    return _pack(units, '\n\n', max_length, measure)
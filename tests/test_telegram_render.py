@@ -0,0 +1,110 @@
+"""
+telegram_render 테스트 (render / split_message는 순수 함수)
+실행: python -m pytest -q
+"""
+
+import pytest
+
+from telegram_render import render, split_message
+
+WIKI = 'https://en.wikipedia.org/wiki/Foo_(bar)'
+
+
+# ═══════════════════════════════════════════════════════════════
+# 링크 변환
+# ═══════════════════════════════════════════════════════════════
+
+def test_html_link_keeps_balanced_parens():
+    assert render(f'[위키]({WIKI}) 끝', 'HTML') == f'<a href="{WIKI}">위키</a> 끝'
+
+
+def test_markdown_v2_link_escapes_paren_in_url():
+    assert render(f'[위키]({WIKI})', 'MarkdownV2') == r'[위키](https://en.wikipedia.org/wiki/Foo_(bar\))'
+
+
+def test_markdown_v2_link_escapes_backslash_in_url():
+    assert render(r'[A](http://x/a\b)', 'MarkdownV2') == r'[A](http://x/a\\b)'
+
+
+def test_markdown_v2_link_text_is_escaped():
+    assert render('[A.B_(c)](http://x/a)', 'MarkdownV2') == r'[A\.B\_\(c\)](http://x/a)'
+
+
+def test_link_inside_parentheses():
+    assert render('([A](http://x/a)) 끝', 'HTML') == '(<a href="http://x/a">A</a>) 끝'
+
+
+def test_unbalanced_paren_ends_link():
+    assert render('[A](http://x/a)b)', 'HTML') == '<a href="http://x/a">A</a>b)'
+
+
+def test_html_link_attribute_is_escaped():
+    assert render('[A](http://x/?a=1&b="2")', 'HTML') == '<a href="http://x/?a=1&amp;b=&quot;2&quot;">A</a>'
+
+
+@pytest.mark.parametrize('parse_mode, expected', [
+    ('HTML', '<b>굵게</b> **열림'),
+    ('MarkdownV2', r'*굵게* \*\*열림'),
+])
+def test_unclosed_bold_is_literal(parse_mode, expected):
+    assert render('**굵게** **열림', parse_mode) == expected
+
+
+def test_bold_does_not_cross_lines():
+    assert render('**가\n나**', 'HTML') == '**가\n나**'
+
+
+def test_legacy_markdown_escape_toggle():
+    assert render('a_b', 'Markdown') == r'a\_b'
+    assert render('a_b', 'Markdown', escape=False) == 'a_b'
+    assert render('a_b', None) == 'a_b'
+
+
+# ═══════════════════════════════════════════════════════════════
+# 분할
+# ═══════════════════════════════════════════════════════════════
+
+def _digest(count: int) -> str:
+    return '\n\n'.join(
+        f"{i}. **[위키]({WIKI}?n={i})** 제목 {i}\n   → 요약 " + ' '.join(['가나다'] * 20)
+        for i in range(1, count + 1)
+    )
+
+
+@pytest.mark.parametrize('parse_mode', ['HTML', 'MarkdownV2', 'Markdown', None])
+def test_split_respects_rendered_length(parse_mode):
+    chunks = split_message(_digest(30), 500, parse_mode)
+    assert len(chunks) > 1
+    assert all(len(render(chunk, parse_mode)) <= 500 for chunk in chunks)
+
+
+def test_split_on_item_boundaries_keeps_text():
+    text = _digest(30)
+    chunks = split_message(text, 500, 'HTML')
+    assert '\n\n'.join(chunks) == text
+
+
+def test_split_does_not_break_paren_link():
+    # 단어 경계 분할에서도 괄호가 있는 링크는 한 조각 안에 남음
+    line = ' '.join(f'[링크{i}]({WIKI}?n={i})' for i in range(20))
+    for chunk in split_message(line, 200, 'HTML'):
+        rendered = render(chunk, 'HTML')
+        assert rendered.count('<a href=') == chunk.count('](')
+        assert '](' not in rendered
+
+
+def test_split_hard_splits_long_word():
+    chunks = split_message('x' * 250, 100, 'MarkdownV2')
+    assert [len(c) for c in chunks] == [100, 100, 50]
+
+
+def test_split_prefix_is_stable():
+    # 스트리밍: 앞부분이 같으면 마지막 조각 외에는 분할 결과가 같음
+    text = _digest(30)
+    full = split_message(text, 500, 'HTML')
+    partial = split_message(text[:len(text) // 2], 500, 'HTML')
+    assert partial[:-1] == full[:len(partial) - 1]
+
+
+def test_split_empty():
+    assert split_message('  \n\n ', 100, 'HTML') == []
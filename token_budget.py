@@ -0,0 +1,93 @@
+"""
+로컬 토큰 추정기 + 예산 내 기사 선택
+문자 종류(라틴/한글/CJK 등)별 비율로 토큰 수를 추정하고,
+실제 count_tokens 결과로 보정한 배율을 캐시합니다.
+"""
+
+import re
+import math
+import logging
+from bisect import bisect_right
+from itertools import accumulate
+from typing import List, Optional, Tuple
+
+from disk_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+# 문자 종류별 토큰당 문자 수 (보정 전 기본값)
+CHARS_PER_TOKEN = {
+    'hangul': 1.5,
+    'cjk': 1.1,
+    'latin': 4.0,
+    'digit': 2.5,
+    'space': 8.0,
+    'other': 1.5,
+}
+
+_CATEGORY_RE = {
+    'hangul': re.compile(r'[가-힣ᄀ-ᇿ㄰-㆏]'),
+    'cjk': re.compile(r'[぀-ヿ㐀-䶿一-鿿]'),
+    'latin': re.compile(r'[A-Za-zÀ-ɏ]'),
+    'digit': re.compile(r'[0-9]'),
+    'space': re.compile(r'\s'),
+}
+
+
+class TokenEstimator:
+    """문자 종류 기반 토큰 추정기 (scale = 실측 보정 배율)"""
+
+    def __init__(self, scale: float = 1.0):
+        self.scale = scale
+
+    @staticmethod
+    def raw_estimate(text: str) -> float:
+        """보정 전 추정치"""
+        if not text:
+            return 0.0
+
+        total = 0.0
+        counted = 0
+        for category, pattern in _CATEGORY_RE.items():
+            count = len(pattern.findall(text))
+            counted += count
+            total += count / CHARS_PER_TOKEN[category]
+        total += (len(text) - counted) / CHARS_PER_TOKEN['other']
+        return total
+
+    def estimate(self, text: str) -> int:
+        """보정된 추정 토큰 수"""
+        return math.ceil(self.raw_estimate(text) * self.scale)
+
+    def calibrate(self, text: str, actual_tokens: int) -> float:
+        """실측값으로 배율 보정"""
+        raw = self.raw_estimate(text)
+        if raw > 0 and actual_tokens > 0:
+            self.scale = actual_tokens / raw
+        return self.scale
+
+
+def load_estimator(cache: Optional[DiskCache], model_name: str) -> Tuple[TokenEstimator, bool]:
+    """
+    캐시된 보정 배율로 추정기 생성
+
+    Returns:
+        (추정기, 보정값 캐시 여부)
+    """
+    if cache:
+        scale = cache.get(f"token-scale:{model_name}")
+        if isinstance(scale, (int, float)) and scale > 0:
+            return TokenEstimator(scale), True
+    return TokenEstimator(), False
+
+
+def save_estimator(cache: Optional[DiskCache], model_name: str, estimator: TokenEstimator) -> None:
+    """보정 배율 저장"""
+    if cache:
+        cache.set(f"token-scale:{model_name}", estimator.scale)
+
+
+def fit_count(costs: List[int], budget: int) -> int:
+    """앞에서부터 누적 비용이 budget 이하인 최대 개수 (누적합 + 이분 탐색)"""
+    prefix = list(accumulate(costs))
+    return bisect_right(prefix, budget)